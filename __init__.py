@@ -1,10 +1,45 @@
 from __future__ import annotations
 
+from typing import Awaitable, Callable
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, CONF_BASE_URL, CONF_USERNAME, CONF_PASSWORD
-from .api import LubeLoggerApi
+from .const import (
+    DOMAIN,
+    CONF_BASE_URL,
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_RESPONSE_CACHE,
+    CONF_DAY_FIRST,
+    CONF_REQUEST_TIMEOUT,
+    CONF_PUSH_UPDATES,
+    CONF_READ_RATE_LIMIT,
+    CONF_READ_BURST,
+    CONF_WRITE_RATE_LIMIT,
+    CONF_WRITE_BURST,
+    DEFAULT_RESPONSE_CACHE,
+    DEFAULT_DAY_FIRST,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_READ_RATE_LIMIT,
+    DEFAULT_READ_BURST,
+    DEFAULT_WRITE_RATE_LIMIT,
+    DEFAULT_WRITE_BURST,
+)
+from .api import LubeLoggerApi, RateLimits, ResponseCache, span
+from .coordinator import LubeLoggerDataUpdateCoordinator
+from .models import LubeLoggerRuntimeData
+from .outbox import WriteOutbox
+from .push import PushReceiver
+from .bulk_import import BulkImporter
+from .history_statistics import HistoryStatistics
+from .snapshot import VehicleSnapshotStore
+from .sync import RecordSyncEngine
+from .sensors.utils import vehicle_device_identifier
 from .services import async_register_services
 
 import logging
@@ -12,30 +47,193 @@ _LOGGER = logging.getLogger(__name__)
 _LOGGER.info("Setting up LubeLogger integration")
 
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register services once for all LubeLogger config entries."""
+    await async_register_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up LubeLogger from a config entry."""
+    with span("setup"):
+        return await _async_setup_entry(hass, entry)
+
+
+async def _async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     base_url = entry.data[CONF_BASE_URL]
     username = entry.data.get(CONF_USERNAME)
     password = entry.data.get(CONF_PASSWORD)
 
-    api = LubeLoggerApi(base_url, username, password)
+    cache = None
+    if entry.options.get(CONF_RESPONSE_CACHE, DEFAULT_RESPONSE_CACHE):
+        cache = ResponseCache()
+
+    options = entry.options
+    rate_limits = RateLimits(
+        read_rate=options.get(CONF_READ_RATE_LIMIT, DEFAULT_READ_RATE_LIMIT),
+        read_burst=options.get(CONF_READ_BURST, DEFAULT_READ_BURST),
+        write_rate=options.get(CONF_WRITE_RATE_LIMIT, DEFAULT_WRITE_RATE_LIMIT),
+        write_burst=options.get(CONF_WRITE_BURST, DEFAULT_WRITE_BURST),
+    )
+
+    api = LubeLoggerApi(
+        base_url,
+        username,
+        password,
+        cache=cache,
+        rate_limits=rate_limits,
+        request_timeout=options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT),
+        day_first=options.get(CONF_DAY_FIRST, DEFAULT_DAY_FIRST),
+    )
+    coordinator = LubeLoggerDataUpdateCoordinator(hass, entry, api)
+
+    outbox = WriteOutbox(
+        hass,
+        entry.entry_id,
+        api,
+        on_flushed=coordinator.async_request_vehicle_refresh,
+    )
+
+    statistics = HistoryStatistics(hass, entry, coordinator)
+
+    # Undone in reverse, as an unload would, if a later step fails; the
+    # shared session stays referenced until api.async_close runs
+    started: list[Callable[[], Awaitable[None]]] = [
+        api.async_close,
+        coordinator.backfill.async_shutdown,
+    ]
+
+    try:
+        await coordinator.sync.async_load()
+        await statistics.async_load()
+        # Registered before the first refresh so its changes are backfilled
+        entry.async_on_unload(coordinator.async_add_listener(statistics.async_schedule))
+        restored = await coordinator.async_restore_snapshot()
+        if restored:
+            # Entities start from the snapshot; LubeLogger catches up in the
+            # background
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+            )
+        else:
+            # Nothing to show yet, so the first refresh has to succeed
+            await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = api
+        await outbox.async_load()
+        # Only a loaded outbox may write its queue back on shutdown
+        started.append(outbox.async_shutdown)
 
-    await async_register_services(hass, entry, api)
+        importer = BulkImporter(
+            hass,
+            entry.entry_id,
+            api,
+            on_written=coordinator.async_request_vehicle_refresh,
+        )
+        await importer.async_load()
+        started.append(importer.async_shutdown)
 
-    # Modern HA method
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+        push = None
+        if entry.options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES):
+            push = PushReceiver(hass, entry, coordinator)
+            push.async_setup()
+            started.append(push.async_shutdown)
+
+        data = LubeLoggerRuntimeData(
+            api=api,
+            coordinator=coordinator,
+            outbox=outbox,
+            importer=importer,
+            statistics=statistics,
+            push=push,
+        )
+
+        hass.data.setdefault(DOMAIN, {})
+        hass.data[DOMAIN][entry.entry_id] = data
+
+        _async_migrate_devices(hass, entry)
+
+        options_at_setup = dict(entry.options)
+
+        async def _async_entry_updated(
+            hass: HomeAssistant, entry: ConfigEntry
+        ) -> None:
+            # Entry data also changes at runtime (the webhook id); only a
+            # change of options needs the entry set up again
+            if dict(entry.options) != options_at_setup:
+                await hass.config_entries.async_reload(entry.entry_id)
+
+        entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
+
+        # Modern HA method
+        await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+    except Exception:
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        for shutdown in reversed(started):
+            await shutdown()
+        raise
 
     return True
 
 
+@callback
+def _async_migrate_devices(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Move vehicle devices to identifiers scoped to the config entry.
+
+    Vehicle devices used to be identified by vehicle id alone, so vehicles
+    with the same id on two LubeLogger servers shared one device. A device
+    owned by this entry alone is renamed in place; a shared one is left to
+    the other entry and this entry's entities get a device of their own.
+    """
+    registry = dr.async_get(hass)
+
+    for device in dr.async_entries_for_config_entry(registry, entry.entry_id):
+        legacy = next(
+            (
+                value
+                for domain, value in device.identifiers
+                if domain == DOMAIN and value.startswith("vehicle_")
+            ),
+            None,
+        )
+        if legacy is None:
+            continue
+
+        vehicle_id = int(legacy.removeprefix("vehicle_"))
+        if device.config_entries == {entry.entry_id}:
+            registry.async_update_device(
+                device.id,
+                new_identifiers={vehicle_device_identifier(entry.entry_id, vehicle_id)},
+            )
+        else:
+            registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a LubeLogger config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if data is not None:
+            if data.push is not None:
+                await data.push.async_shutdown()
+            await data.coordinator.backfill.async_shutdown()
+            await data.importer.async_shutdown()
+            await data.outbox.async_shutdown()
+            await data.api.async_close()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove locally stored data when a config entry is deleted."""
+    await RecordSyncEngine(hass, entry.entry_id).async_remove()
+    await VehicleSnapshotStore(hass, entry.entry_id).async_remove()
+    await WriteOutbox(hass, entry.entry_id, None).async_remove()
+    await BulkImporter(hass, entry.entry_id, None).async_remove()
+    await HistoryStatistics(hass, entry, None).async_remove()
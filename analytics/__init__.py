@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from .fuel import FuelAnalytics, FuelStats, ROLLING_WINDOWS
+from .forecast import OdometerTrend, ServiceForecast, predict_service
+from .cost import CostAggregates, CostStats
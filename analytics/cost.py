@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable
+
+from ..api.models import FuelRecord, HistoryRecord, ServiceRecord
+
+FUEL = 0
+SERVICE = 1
+
+
+@dataclass
+class CostStats:
+    """Cost of ownership figures for one vehicle at a point in time."""
+
+    fuel_total: float = 0.0
+    service_total: float = 0.0
+    total: float = 0.0
+    fuel_month: float = 0.0
+    service_month: float = 0.0
+    month: float = 0.0
+    fuel_ytd: float = 0.0
+    service_ytd: float = 0.0
+    ytd: float = 0.0
+    cost_per_distance: float | None = None
+    distance: float | None = None
+
+
+class CostAggregates:
+    """Running fuel and service cost totals for one vehicle.
+
+    Totals are kept overall and per calendar month. Costs are plain sums,
+    so added, changed and removed records all adjust the totals in place
+    and a refresh costs O(changed records) whatever the history length.
+    Only removing the record that holds the lowest odometer reading
+    forces a rescan, because a minimum cannot be un-applied.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self) -> None:
+        self.totals = [0.0, 0.0]
+        self.months: dict[tuple[int, int], list[float]] = {}
+        self.first_odometer: float | None = None
+        self.stale = False
+
+    def rebuild(
+        self, fuel: Iterable[FuelRecord], service: Iterable[ServiceRecord]
+    ) -> None:
+        self._reset()
+        self.apply(added=fuel)
+        self.apply(added=service)
+
+    def apply(
+        self,
+        added: Iterable[HistoryRecord] = (),
+        removed: Iterable[HistoryRecord] = (),
+    ) -> None:
+        """Fold added and removed records into the totals."""
+        first = self.first_odometer
+        lost_first = False
+
+        for record in removed:
+            self._add(record, -1.0)
+            if first is not None and record.odometer == first:
+                lost_first = True
+
+        for record in added:
+            self._add(record, 1.0)
+            odometer = record.odometer
+            if odometer is None or odometer <= 0:
+                continue
+            if odometer == first:
+                # An edited record kept the lowest reading
+                lost_first = False
+            if self.first_odometer is None or odometer < self.first_odometer:
+                self.first_odometer = odometer
+
+        if lost_first and self.first_odometer == first:
+            self.stale = True
+
+    def _add(self, record: HistoryRecord, sign: float) -> None:
+        slot = FUEL if isinstance(record, FuelRecord) else SERVICE
+        cost = (record.cost or 0.0) * sign
+
+        self.totals[slot] += cost
+        if record.date is not None:
+            month = self.months.setdefault(
+                (record.date.year, record.date.month), [0.0, 0.0]
+            )
+            month[slot] += cost
+
+    def stats(self, today: date, current_odometer: float | None) -> CostStats:
+        month = self.months.get((today.year, today.month), (0.0, 0.0))
+
+        fuel_ytd = service_ytd = 0.0
+        for (year, _), amounts in self.months.items():
+            if year == today.year:
+                fuel_ytd += amounts[FUEL]
+                service_ytd += amounts[SERVICE]
+
+        stats = CostStats(
+            fuel_total=round(self.totals[FUEL], 2),
+            service_total=round(self.totals[SERVICE], 2),
+            total=round(sum(self.totals), 2),
+            fuel_month=round(month[FUEL], 2),
+            service_month=round(month[SERVICE], 2),
+            month=round(month[FUEL] + month[SERVICE], 2),
+            fuel_ytd=round(fuel_ytd, 2),
+            service_ytd=round(service_ytd, 2),
+            ytd=round(fuel_ytd + service_ytd, 2),
+        )
+
+        if current_odometer is not None and self.first_odometer is not None:
+            distance = current_odometer - self.first_odometer
+            if distance > 0:
+                stats.distance = round(distance, 1)
+                stats.cost_per_distance = round(sum(self.totals) / distance, 3)
+
+        return stats
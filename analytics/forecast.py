@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterable
+
+from ..api.models import OdometerRecord, ServiceRecord
+
+# Older driving habits fade out with this half-life
+HALF_LIFE_DAYS = 180.0
+# Segment rates further than this many robust deviations are clipped
+CLIP_DEVIATIONS = 5.0
+# Readings that go backwards are dropped unless this many agree in a row
+REANCHOR_AFTER = 3
+# Readings needed before outlier clipping kicks in
+WARMUP_SEGMENTS = 3
+
+
+@dataclass
+class ServiceForecast:
+    """Predicted next service for one vehicle."""
+
+    due_date: date | None = None
+    due_odometer: float | None = None
+    daily_distance: float | None = None
+    last_service_date: date | None = None
+    last_service_odometer: float | None = None
+    # "distance" or "time", whichever interval falls due first
+    due_by: str | None = None
+    overdue: bool = False
+
+
+class OdometerTrend:
+    """Online, outlier-robust estimate of a vehicle's daily distance.
+
+    Each pair of consecutive readings forms a segment. The estimate is an
+    exponentially time-decayed ratio of distance to days, so long gaps
+    contribute in proportion to their length instead of as a single
+    sample. Segment rates far from the running estimate are clipped
+    (Huber style), and readings that go backwards are ignored unless
+    several consecutive ones agree. Every reading is processed once, so
+    polls only pay for the new ones.
+    """
+
+    def __init__(self):
+        self.last_day: int | None = None
+        self.last_odometer: float | None = None
+        self.segments = 0
+        self._distance = 0.0
+        self._days = 0.0
+        self._deviation = 0.0
+        self._rejected: list[tuple[int, float]] = []
+
+    @property
+    def daily_distance(self) -> float | None:
+        if self._days <= 0:
+            return None
+        return self._distance / self._days
+
+    def extend(self, records: Iterable[OdometerRecord]) -> None:
+        """Feed date-ordered odometer records into the model."""
+        for record in records:
+            if record.date is not None and record.odometer is not None:
+                self.update(record.date, record.odometer)
+
+    def update(self, day: date, odometer: float) -> None:
+        ordinal = day.toordinal()
+
+        if self.last_day is None:
+            self.last_day, self.last_odometer = ordinal, odometer
+            return
+
+        if ordinal < self.last_day:
+            # Out of order reading; the caller rebuilds for back-dated data
+            return
+
+        if odometer < self.last_odometer:
+            self._reject(ordinal, odometer)
+            return
+        self._rejected.clear()
+
+        elapsed = ordinal - self.last_day
+        if elapsed == 0:
+            # Same-day readings only move the anchor forward
+            self.last_odometer = odometer
+            return
+
+        distance = odometer - self.last_odometer
+        rate = distance / elapsed
+        estimate = self.daily_distance
+
+        if estimate is not None and self.segments >= WARMUP_SEGMENTS:
+            deviation = abs(rate - estimate)
+            limit = CLIP_DEVIATIONS * max(self._deviation, 0.1 * estimate, 1.0)
+            if deviation > limit:
+                rate = estimate + math.copysign(limit, rate - estimate)
+            self._deviation += (min(deviation, limit) - self._deviation) * 0.2
+        elif estimate is not None:
+            self._deviation += (abs(rate - estimate) - self._deviation) * 0.5
+
+        decay = 0.5 ** (elapsed / HALF_LIFE_DAYS)
+        self._distance = self._distance * decay + rate * elapsed
+        self._days = self._days * decay + elapsed
+
+        self.segments += 1
+        self.last_day, self.last_odometer = ordinal, odometer
+
+    def _reject(self, ordinal: int, odometer: float) -> None:
+        """Track backwards readings; accept them once they are consistent.
+
+        This recovers from a single mistyped high reading that would
+        otherwise make every later reading look like it went backwards.
+        """
+        if self._rejected and odometer < self._rejected[-1][1]:
+            self._rejected.clear()
+        self._rejected.append((ordinal, odometer))
+
+        if len(self._rejected) >= REANCHOR_AFTER:
+            self.last_day, self.last_odometer = self._rejected[-1]
+            self._rejected.clear()
+
+
+def predict_service(
+    trend: OdometerTrend,
+    last_service: ServiceRecord | None,
+    current_odometer: float | None,
+    today: date,
+    interval_distance: float | None,
+    interval_days: int | None,
+) -> ServiceForecast:
+    """Predict when the next service falls due by distance or by time."""
+    forecast = ServiceForecast(daily_distance=trend.daily_distance)
+
+    if forecast.daily_distance is not None:
+        forecast.daily_distance = round(forecast.daily_distance, 2)
+
+    if last_service is not None:
+        forecast.last_service_date = last_service.date
+        forecast.last_service_odometer = last_service.odometer
+
+    if forecast.last_service_date is None:
+        return forecast
+
+    if current_odometer is None:
+        current_odometer = trend.last_odometer
+
+    candidates: list[tuple[date, str]] = []
+
+    if interval_days:
+        candidates.append(
+            (forecast.last_service_date + timedelta(days=interval_days), "time")
+        )
+
+    if interval_distance and forecast.last_service_odometer is not None:
+        forecast.due_odometer = forecast.last_service_odometer + interval_distance
+        rate = trend.daily_distance
+
+        if current_odometer is not None and current_odometer >= forecast.due_odometer:
+            candidates.append((today, "distance"))
+            forecast.overdue = True
+        elif current_odometer is not None and rate:
+            days_left = (forecast.due_odometer - current_odometer) / rate
+            # Cap far-future predictions for near-idle vehicles
+            days_left = min(days_left, 3650)
+            candidates.append((today + timedelta(days=math.ceil(days_left)), "distance"))
+
+    if candidates:
+        forecast.due_date, forecast.due_by = min(candidates)
+        forecast.overdue = forecast.overdue or forecast.due_date < today
+
+    return forecast
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterable
+
+from ..api.models import FuelRecord, RecordColumns
+
+ROLLING_WINDOWS = (30, 90, 365)
+
+_NAN = float("nan")
+
+
+@dataclass
+class FuelStats:
+    """Derived fuel metrics for one vehicle at a point in time."""
+
+    fill_ups: int = 0
+    last_economy: float | None = None
+    rolling_economy: dict[int, float | None] | None = None
+    cost_per_distance: float | None = None
+    month_spend: float = 0.0
+    total_cost: float = 0.0
+    total_fuel: float = 0.0
+
+
+def _finite(value: float) -> float | None:
+    return None if math.isnan(value) or math.isinf(value) else round(value, 3)
+
+
+class FuelAnalytics:
+    """Columnar fuel-economy and cost engine for one vehicle's fill-ups.
+
+    Records are held as parallel typed arrays (one per field) alongside
+    running prefix sums, so every windowed metric is two bisects and a
+    subtraction regardless of history length. Records that arrive in date
+    order are appended without touching earlier rows.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self) -> None:
+        self.columns = RecordColumns()
+        self.fuel = array("d")
+        # Economy of each full fill-up, NaN for partial or unusable rows
+        self.economy = array("d")
+
+        # Prefix sums over completed economy segments and cost
+        self._seg_distance = array("d", [0.0])
+        self._seg_fuel = array("d", [0.0])
+        self._cost_sum = array("d", [0.0])
+
+        # Running state carried between fill-ups
+        self._last_full_odometer: float | None = None
+        self._pending_fuel = 0.0
+        self._total_fuel = 0.0
+        self._last_economy = _NAN
+        self._min_odometer = math.inf
+        self._max_odometer = -math.inf
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def rebuild(self, records: Iterable[FuelRecord]) -> None:
+        """Recompute every column from a date-ordered history."""
+        self._reset()
+        self.extend(records)
+
+    def extend(self, records: Iterable[FuelRecord]) -> None:
+        """Append fill-ups dated on or after the newest one already held."""
+        for record in records:
+            self._append(record)
+
+    def _append(self, record: FuelRecord) -> None:
+        odometer = record.odometer
+        fuel = record.fuel_consumed
+        cost = record.cost
+        full = record.is_fill_to_full
+        missed = record.missed_fuel_up
+
+        economy = _NAN
+        distance = 0.0
+        used = 0.0
+
+        if missed or odometer is None:
+            # A missed fill-up breaks the chain; restart from this one
+            self._last_full_odometer = odometer if full else None
+            self._pending_fuel = 0.0
+        else:
+            self._pending_fuel += fuel
+            if full:
+                last = self._last_full_odometer
+                if last is not None and odometer > last and self._pending_fuel > 0:
+                    distance = odometer - last
+                    used = self._pending_fuel
+                    economy = distance / used
+                    self._last_economy = economy
+                self._last_full_odometer = odometer
+                self._pending_fuel = 0.0
+
+        if odometer is not None:
+            self._min_odometer = min(self._min_odometer, odometer)
+            self._max_odometer = max(self._max_odometer, odometer)
+
+        self.columns.append(record)
+        self.fuel.append(fuel)
+        self._total_fuel += fuel
+        self.economy.append(economy)
+
+        self._seg_distance.append(self._seg_distance[-1] + distance)
+        self._seg_fuel.append(self._seg_fuel[-1] + used)
+        self._cost_sum.append(self._cost_sum[-1] + cost)
+
+    def rolling_economy(self, today: date, window: int) -> float | None:
+        """Distance per unit of fuel over full fill-ups in the last window days."""
+        start = self.columns.index_since(today - timedelta(days=window - 1))
+        distance = self._seg_distance[-1] - self._seg_distance[start]
+        fuel = self._seg_fuel[-1] - self._seg_fuel[start]
+        return _finite(distance / fuel) if fuel > 0 else None
+
+    def spend_since(self, day: date) -> float:
+        start = self.columns.index_since(day)
+        return round(self._cost_sum[-1] - self._cost_sum[start], 2)
+
+    def last_economy(self) -> float | None:
+        return _finite(self._last_economy)
+
+    def cost_per_distance(self) -> float | None:
+        distance = self._max_odometer - self._min_odometer
+        if not len(self) or distance <= 0:
+            return None
+        return _finite(self._cost_sum[-1] / distance)
+
+    def stats(self, today: date) -> FuelStats:
+        return FuelStats(
+            fill_ups=len(self),
+            last_economy=self.last_economy(),
+            rolling_economy={
+                window: self.rolling_economy(today, window)
+                for window in ROLLING_WINDOWS
+            },
+            cost_per_distance=self.cost_per_distance(),
+            month_spend=self.spend_since(today.replace(day=1)),
+            total_cost=round(self._cost_sum[-1], 2),
+            total_fuel=round(self._total_fuel, 3),
+        )
@@ -1,16 +1,78 @@
 from __future__ import annotations
 
+from .base import ResponseDecodeError
 from .vehicles import VehicleApi
 from .odometer import OdometerApi
 from .service_records import ServiceRecordApi
 from .fuel import FuelApi
+from .session import acquire_session, release_session
+from .scheduler import FleetFetchScheduler, FleetFetchResult
+from .cache import ResponseCache, bypass_cache
+from .singleflight import SingleFlight
+from .resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, get_breaker
+from .metrics import ApiMetrics
+from .spans import SpanRecorder, span, spans_active, start_spans, stop_spans
+from .ratelimit import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    RateLimits,
+    get_rate_limiter,
+    request_priority,
+)
 
 
 class LubeLoggerApi:
-    """Unified API wrapper for all LubeLogger endpoints."""
+    """Unified API wrapper for all LubeLogger endpoints.
 
-    def __init__(self, base_url: str, username: str, password: str):
-        self.vehicles = VehicleApi(base_url, username, password)
-        self.odometer = OdometerApi(base_url, username, password)
-        self.service_records = ServiceRecordApi(base_url, username, password)
-        self.fuel = FuelApi(base_url, username, password)
+    All endpoint clients share one pooled session per LubeLogger host, so
+    connections are kept alive across polls and reused by other config
+    entries pointing at the same server. Passing a ResponseCache enables
+    cached reads shared by every endpoint.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limits: RateLimits | None = None,
+        request_timeout: float | None = None,
+        day_first: bool = False,
+    ):
+        self._base_url = base_url
+        self._session = acquire_session(base_url)
+        self.cache = cache
+        self.single_flight = SingleFlight()
+        self.breaker = get_breaker(base_url)
+        self.metrics = ApiMetrics()
+        self.rate_limiter = get_rate_limiter(base_url, rate_limits)
+        # Whether the server writes slashed dates as dd/MM/yyyy
+        self.day_first = day_first
+
+        shared = {
+            "session": self._session,
+            "cache": cache,
+            "single_flight": self.single_flight,
+            "retry_policy": retry_policy or RetryPolicy(),
+            "breaker": self.breaker,
+            "metrics": self.metrics,
+            "rate_limiter": self.rate_limiter,
+            "day_first": day_first,
+        }
+        if request_timeout is not None:
+            shared["request_timeout"] = request_timeout
+
+        self.vehicles = VehicleApi(base_url, username, password, **shared)
+        self.odometer = OdometerApi(base_url, username, password, **shared)
+        self.service_records = ServiceRecordApi(base_url, username, password, **shared)
+        self.fuel = FuelApi(base_url, username, password, **shared)
+
+    async def async_close(self) -> None:
+        """Release the shared session held by this API instance."""
+        if self._session is None:
+            return
+        self._session = None
+        await release_session(self._base_url)
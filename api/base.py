@@ -5,26 +5,197 @@ import async_timeout
 import asyncio
 import logging
 import time
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from typing import Any, AsyncIterator, Callable
+
+from ..const import DEFAULT_REQUEST_TIMEOUT
+from .cache import ResponseCache, cache_bypassed, split_path
+from .codec import ACCEPT_ENCODING, BodyDecoder, decode_body, dumps, loads
+from .metrics import ApiMetrics
+from .ratelimit import RateLimiter, get_rate_limiter
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    get_breaker,
+    is_outage,
+)
+from .singleflight import SingleFlight
+from .spans import span
+from .streaming import JsonArrayDecoder
 
 _LOGGER = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 16 * 1024
+# A streamed listing may take this many request timeouts in total
+STREAM_TIMEOUT_FACTOR = 6
+
+
+class ResponseDecodeError(ValueError):
+    """A success response whose body could not be decoded.
+
+    Unlike other ValueErrors this says nothing about the request: for a
+    write it means LubeLogger most likely applied it.
+    """
+
+
+@dataclass
+class ApiResponse:
+    """Decoded response plus the metadata needed for caching."""
+
+    status: int
+    value: Any = None
+    size: int = 0
+    etag: str | None = None
+    last_modified: str | None = None
+
 
 class LubeLoggerApiBase:
     """Base class for all LubeLogger API endpoints with logging, error handling, and auth detection."""
 
-    def __init__(self, base_url: str, username: str | None, password: str | None):
+    def __init__(
+        self,
+        base_url: str,
+        username: str | None,
+        password: str | None,
+        session: aiohttp.ClientSession | None = None,
+        cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        metrics: ApiMetrics | None = None,
+        rate_limiter: RateLimiter | None = None,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        day_first: bool = False,
+    ):
         self._base_url = base_url.rstrip("/")
         self._username = username
         self._password = password
+        self._session = session
+        self._owns_session = session is None
+        self._cache = cache
+        self._single_flight = single_flight or SingleFlight()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._breaker = breaker or get_breaker(base_url)
+        self._metrics = metrics or ApiMetrics()
+        self._rate_limiter = rate_limiter or get_rate_limiter(base_url)
+        self._request_timeout = request_timeout
+        self._day_first = day_first
+        self._warned_dates = False
         self._last_error: str | None = None
+        # Whether the server honours startDate/endDate; None until seen
+        self.server_windows: bool | None = None
 
-    async def _request(self, method: str, path: str, **kwargs):
-        url = f"{self._base_url}{path}"
+    def _parser(self, model: Any) -> Callable[[Any], Any]:
+        """Return model.from_json reading dates in this server's order."""
+        return partial(model.from_json, day_first=self._day_first)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, or a private one for standalone use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the session if this client created it."""
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        parse: Callable[[Any], Any] | None = None,
+        **kwargs,
+    ):
+        """Send a request and return the decoded (and optionally parsed) body.
+
+        parse turns the decoded JSON into model objects once, before it is
+        cached or shared with coalesced callers.
+        """
+        if method != "GET":
+            response = await self._send(method, path, **kwargs)
+            if self._cache is not None:
+                self._invalidate(path)
+            return parse(response.value) if parse else response.value
+
+        key = (method, path)
+
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None and cached.fresh and not cache_bypassed():
+                self._cache.hits += 1
+                return cached.value
+
+        # Extra request options make the key ambiguous, so only plain
+        # GETs are shared between concurrent callers.
+        if kwargs:
+            return await self._get(key, parse, **kwargs)
+
+        return await self._single_flight.run(key, lambda: self._get(key, parse))
+
+    async def _get(
+        self,
+        key: tuple[str, str],
+        parse: Callable[[Any], Any] | None,
+        **kwargs,
+    ):
+        method, path = key
+
+        if self._cache is None:
+            response = await self._send(method, path, **kwargs)
+            return parse(response.value) if parse else response.value
+
+        self._cache.misses += 1
+        cached = self._cache.get(key)
+
+        conditional: dict[str, str] = {}
+        if cached is not None and cached.revalidatable:
+            if cached.etag:
+                conditional["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                conditional["If-Modified-Since"] = cached.last_modified
+
+        response = await self._send(method, path, conditional, **kwargs)
 
+        if response.status == 304 and cached is not None:
+            self._cache.refresh(key)
+            return cached.value
+
+        value = parse(response.value) if parse else response.value
+        self._cache.put(
+            key,
+            value,
+            response.size,
+            etag=response.etag,
+            last_modified=response.last_modified,
+        )
+        return value
+
+    def _invalidate(self, path: str) -> None:
+        """Drop cached reads affected by a write to path."""
+        _, vehicle_id = split_path(path)
+        if vehicle_id is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate_vehicle(vehicle_id)
+
+    def _prepare(
+        self, extra_headers: dict[str, str] | None
+    ) -> tuple[dict[str, str], aiohttp.BasicAuth | None, str]:
+        """Build request headers and auth."""
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
         }
+        if extra_headers:
+            headers.update(extra_headers)
 
         # Determine auth mode
         auth = None
@@ -34,77 +205,357 @@ class LubeLoggerApiBase:
             auth = aiohttp.BasicAuth(self._username, self._password or "")
             auth_mode = "basic"
 
+        return headers, auth, auth_mode
+
+    def _check_response(
+        self,
+        resp: aiohttp.ClientResponse,
+        method: str,
+        url: str,
+        auth_mode: str,
+        start: float,
+    ) -> None:
+        """Log the request summary and raise for error statuses."""
+        duration = round(time.monotonic() - start, 3)
+
+        # Log request summary
+        _LOGGER.debug(
+            "LubeLogger API %s %s (auth=%s) → %s in %ss",
+            method,
+            url,
+            auth_mode,
+            resp.status,
+            duration,
+        )
+
+        # Handle auth failures
+        if resp.status == 401:
+            self._last_error = "Authentication failed (401)"
+            _LOGGER.error("LubeLogger: Authentication failed (401)")
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=401,
+                message="Authentication failed",
+            )
+
+        if resp.status == 403:
+            self._last_error = "Forbidden (403)"
+            _LOGGER.error("LubeLogger: Access forbidden (403)")
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=403,
+                message="Forbidden",
+            )
+
+        resp.raise_for_status()
+
+    def _record_failure(self, err: BaseException, method: str, url: str) -> None:
+        """Remember and log a failed request."""
+        if isinstance(err, CircuitOpenError):
+            # The breaker already logged the outage once; stay quiet here
+            self._last_error = str(err)
+            _LOGGER.debug("LubeLogger: Skipped %s %s: %s", method, url, err)
+
+        elif isinstance(err, asyncio.TimeoutError):
+            self._last_error = "Timeout"
+            _LOGGER.error("LubeLogger: Request timed out (%s %s)", method, url)
+
+        elif isinstance(err, aiohttp.ClientConnectorError):
+            self._last_error = f"Connection error: {err}"
+            _LOGGER.error("LubeLogger: Connection error: %s", err)
+
+        elif isinstance(err, aiohttp.ClientResponseError):
+            self._last_error = f"HTTP error {err.status}: {err.message}"
+            _LOGGER.error("LubeLogger: HTTP error %s: %s", err.status, err.message)
+
+        elif isinstance(err, ResponseDecodeError):
+            self._last_error = str(err)
+            _LOGGER.error("LubeLogger: %s (%s %s)", err, method, url)
+
+        else:
+            self._last_error = f"Unexpected error: {err}"
+            _LOGGER.exception("LubeLogger: Unexpected error")
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        extra_headers: dict[str, str] | None = None,
+        **kwargs,
+    ) -> ApiResponse:
+        """Send through the circuit breaker, retrying idempotent GETs."""
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                self._breaker.before_request()
+            except CircuitOpenError as err:
+                self._record_failure(err, method, f"{self._base_url}{path}")
+                raise
+
+            try:
+                response = await self._send_once(method, path, extra_headers, **kwargs)
+            except asyncio.CancelledError:
+                self._breaker.abandon()
+                raise
+            except Exception as err:
+                if is_outage(err):
+                    self._breaker.record_failure()
+                else:
+                    # The server answered, so it is reachable
+                    self._breaker.record_success()
+
+                if (
+                    method != "GET"
+                    or attempt >= self._retry_policy.attempts
+                    or not self._retry_policy.should_retry(err)
+                ):
+                    raise
+
+                delay = self._retry_policy.delay(attempt)
+                _LOGGER.debug(
+                    "LubeLogger: Retrying %s %s in %.2fs (attempt %s)",
+                    method,
+                    path,
+                    delay,
+                    attempt + 1,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            self._breaker.record_success()
+            return response
+
+    async def _send_once(
+        self,
+        method: str,
+        path: str,
+        extra_headers: dict[str, str] | None = None,
+        **kwargs,
+    ) -> ApiResponse:
+        url = f"{self._base_url}{path}"
+        headers, auth, auth_mode = self._prepare(extra_headers)
+
+        if "json" in kwargs:
+            # Same encoder as the decoder; the JSON content type is already set
+            kwargs["data"] = dumps(kwargs.pop("json"))
+
+        # Queueing for the host's budget is not part of the request latency
+        with span("api.rate_limit"):
+            await self._rate_limiter.acquire(method)
+
+        session = self._get_session()
         start = time.monotonic()
 
         try:
-            async with async_timeout.timeout(20):
-                async with aiohttp.ClientSession() as session:
+            with span("api.request"):
+                async with async_timeout.timeout(self._request_timeout):
                     async with session.request(
                         method,
                         url,
                         headers=headers,
                         auth=auth,
+                        auto_decompress=False,
                         **kwargs,
                     ) as resp:
+                        self._check_response(resp, method, url, auth_mode, start)
+
+                        if resp.status == 304:
+                            self._metrics.record(path, time.monotonic() - start)
+                            return ApiResponse(status=304)
+
+                        raw = await resp.read()
 
-                        duration = round(time.monotonic() - start, 3)
+                        with span("api.decode"):
+                            try:
+                                body, decoder = decode_body(
+                                    raw, resp.headers.get("Content-Encoding")
+                                )
+                            except (ValueError, zlib.error) as err:
+                                raise ResponseDecodeError(
+                                    f"Undecodable response body: {err}"
+                                ) from err
+                            try:
+                                value = loads(body) if body.strip() else None
+                            except ValueError as err:
+                                _LOGGER.error(
+                                    "LubeLogger: Invalid JSON response: %s",
+                                    body.decode(errors="replace"),
+                                )
+                                raise ResponseDecodeError(
+                                    f"Invalid JSON response: {err}"
+                                ) from err
 
-                        # Log request summary
-                        _LOGGER.debug(
-                            "LubeLogger API %s %s (auth=%s) → %s in %ss",
-                            method,
-                            url,
-                            auth_mode,
-                            resp.status,
-                            duration,
+                        self._metrics.record(
+                            path,
+                            time.monotonic() - start,
+                            decoder.body_bytes,
+                            wire_size=decoder.wire_bytes,
+                        )
+                        return ApiResponse(
+                            status=resp.status,
+                            value=value,
+                            size=len(body),
+                            etag=resp.headers.get("ETag"),
+                            last_modified=resp.headers.get("Last-Modified"),
                         )
 
-                        # Handle auth failures
-                        if resp.status == 401:
-                            self._last_error = "Authentication failed (401)"
-                            _LOGGER.error("LubeLogger: Authentication failed (401)")
-                            raise aiohttp.ClientResponseError(
-                                resp.request_info,
-                                resp.history,
-                                status=401,
-                                message="Authentication failed",
-                            )
-
-                        if resp.status == 403:
-                            self._last_error = "Forbidden (403)"
-                            _LOGGER.error("LubeLogger: Access forbidden (403)")
-                            raise aiohttp.ClientResponseError(
-                                resp.request_info,
-                                resp.history,
-                                status=403,
-                                message="Forbidden",
-                            )
-
-                        resp.raise_for_status()
-
-                        try:
-                            return await resp.json()
-                        except Exception:
-                            text = await resp.text()
-                            _LOGGER.error("LubeLogger: Invalid JSON response: %s", text)
-                            raise
-
-        except asyncio.TimeoutError:
-            self._last_error = "Timeout"
-            _LOGGER.error("LubeLogger: Request timed out (%s %s)", method, url)
+        except Exception as err:
+            self._metrics.record(path, time.monotonic() - start, error=err)
+            self._record_failure(err, method, url)
             raise
 
-        except aiohttp.ClientConnectorError as err:
-            self._last_error = f"Connection error: {err}"
-            _LOGGER.error("LubeLogger: Connection error: %s", err)
+    async def _stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        parse: Callable[[Any], Any] | None = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Yield the elements of a JSON array response as they are decoded.
+
+        The body is never held in full, which keeps memory flat for long
+        record histories. Streamed responses bypass the response cache
+        and request coalescing. Each read must make progress within the
+        request timeout, and the whole listing must arrive within
+        STREAM_TIMEOUT_FACTOR request timeouts, so a server trickling
+        bytes cannot hold a refresh forever.
+        """
+        url = f"{self._base_url}{path}"
+        headers, auth, auth_mode = self._prepare(None)
+
+        session = self._get_session()
+        decoder = JsonArrayDecoder()
+        body: BodyDecoder | None = None
+        start = time.monotonic()
+
+        try:
+            self._breaker.before_request()
+        except CircuitOpenError as err:
+            self._record_failure(err, method, url)
             raise
 
-        except aiohttp.ClientResponseError as err:
-            self._last_error = f"HTTP error {err.status}: {err.message}"
-            _LOGGER.error("LubeLogger: HTTP error %s: %s", err.status, err.message)
+        try:
+            with span("api.rate_limit"):
+                await self._rate_limiter.acquire(method)
+            start = time.monotonic()
+
+            async with session.request(
+                method,
+                url,
+                headers=headers,
+                auth=auth,
+                auto_decompress=False,
+                timeout=aiohttp.ClientTimeout(
+                    total=self._request_timeout * STREAM_TIMEOUT_FACTOR,
+                    sock_connect=self._request_timeout,
+                    sock_read=self._request_timeout,
+                ),
+                **kwargs,
+            ) as resp:
+                self._check_response(resp, method, url, auth_mode, start)
+                body = BodyDecoder(resp.headers.get("Content-Encoding"))
+
+                async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    with span("api.decode"):
+                        items = decoder.feed(body.feed(chunk))
+                    for item in items:
+                        yield parse(item) if parse else item
+
+                for item in decoder.feed(body.flush()) + decoder.close():
+                    yield parse(item) if parse else item
+
+        except (asyncio.CancelledError, GeneratorExit):
+            self._breaker.abandon()
             raise
 
         except Exception as err:
-            self._last_error = f"Unexpected error: {err}"
-            _LOGGER.exception("LubeLogger: Unexpected error")
+            if is_outage(err):
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+            self._metrics.record(
+                path,
+                time.monotonic() - start,
+                body.body_bytes if body else 0,
+                err,
+                wire_size=body.wire_bytes if body else 0,
+            )
+            self._record_failure(err, method, url)
             raise
+
+        self._breaker.record_success()
+        self._metrics.record(
+            path,
+            time.monotonic() - start,
+            body.body_bytes,
+            wire_size=body.wire_bytes,
+        )
+
+        _LOGGER.debug(
+            "LubeLogger: Streamed %s records from %s in %ss",
+            decoder.items,
+            url,
+            round(time.monotonic() - start, 3),
+        )
+
+    async def _stream_window(
+        self,
+        path: str,
+        start: date | None,
+        end: date | None,
+        *,
+        parse: Callable[[Any], Any],
+    ) -> AsyncIterator[Any]:
+        """Stream the records of a listing dated from start to end, inclusive.
+
+        The window is passed to the server as startDate/endDate. Servers
+        that ignore it send the whole history, so records are trimmed
+        here as well and server_windows records which behaviour was seen.
+        Undated records only fall inside windows without a start.
+        """
+        unparsed = 0
+        query = "".join(
+            f"&{name}={day.isoformat()}"
+            for name, day in (("startDate", start), ("endDate", end))
+            if day is not None
+        )
+        inside = outside = 0
+
+        async for record in self._stream("GET", f"{path}{query}", parse=parse):
+            day = record.date
+            if day is None:
+                unparsed += 1
+            if (start is not None and (day is None or day < start)) or (
+                end is not None and day is not None and day > end
+            ):
+                outside += 1
+                continue
+            inside += 1
+            yield record
+
+        if unparsed and not self._warned_dates:
+            self._warned_dates = True
+            _LOGGER.warning(
+                "LubeLogger: %s records from %s have no date in the %s order; "
+                "check the day_first option",
+                unparsed,
+                path.split("?", 1)[0],
+                "dd/MM/yyyy" if self._day_first else "MM/dd/yyyy",
+            )
+
+        if not query:
+            return
+        if outside:
+            if self.server_windows is not False:
+                _LOGGER.debug(
+                    "LubeLogger: %s ignores date windows; trimming client-side",
+                    path.split("?", 1)[0],
+                )
+            self.server_windows = False
+        elif inside and self.server_windows is None:
+            self.server_windows = True
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator
+from urllib.parse import parse_qs, urlsplit
+
+# Seconds a response stays fresh, by endpoint path. Kept a little shorter
+# than the default refresh interval so every scheduled poll revalidates,
+# while repeat reads inside one refresh window are served locally.
+DEFAULT_TTLS: dict[str, float] = {
+    "/api/vehicles": 240,
+    "/api/vehicle/get": 240,
+    "/api/vehicle/odometerrecords/latest": 30,
+    "/api/vehicle/odometerrecords/list": 240,
+    "/api/vehicle/fuelrecords/list": 240,
+    "/api/vehicle/servicerecords/list": 240,
+}
+
+DEFAULT_TTL = 60
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+CacheKey = tuple[str, str]
+
+_BYPASS: ContextVar[bool] = ContextVar("lubelogger_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass_cache(bypass: bool = True) -> Iterator[None]:
+    """Skip fresh cached responses for the requests made inside the block.
+
+    Responses are still revalidated and stored, so later cached reads see
+    what the bypassing request fetched. Like the request priority, the
+    setting follows the asyncio context; bypass=False restores cached
+    reads for background work started from a bypassing block.
+    """
+    token = _BYPASS.set(bypass)
+    try:
+        yield
+    finally:
+        _BYPASS.reset(token)
+
+
+def cache_bypassed() -> bool:
+    return _BYPASS.get()
+
+
+@dataclass
+class CacheEntry:
+    """A cached, already decoded response."""
+
+    value: Any
+    size: int
+    expires: float
+    vehicle_id: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+def split_path(path: str) -> tuple[str, str | None]:
+    """Return the endpoint path and the vehicle id it refers to, if any."""
+    parts = urlsplit(path)
+    query = parse_qs(parts.query)
+    vehicle_id = (query.get("vehicleId") or query.get("id") or [None])[0]
+    return parts.path, vehicle_id
+
+
+class ResponseCache:
+    """TTL + LRU cache for decoded GET responses.
+
+    Entries are keyed by (method, path) and bounded both by count and by
+    the size of the raw response bodies. Expired entries that carried an
+    ETag or Last-Modified header are kept so they can be revalidated with
+    a conditional request instead of downloaded again.
+
+    Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self._ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._by_vehicle: dict[str, set[CacheKey]] = {}
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def ttl_for(self, path: str) -> float:
+        endpoint, _ = split_path(path)
+        return self._ttls.get(endpoint, self._default_ttl)
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        """Return the entry for a key (fresh or not) and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: CacheKey,
+        value: Any,
+        size: int,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        ttl = self.ttl_for(key[1])
+        if ttl <= 0 or size > self._max_bytes:
+            self.discard(key)
+            return
+
+        self.discard(key)
+
+        _, vehicle_id = split_path(key[1])
+        self._entries[key] = CacheEntry(
+            value=value,
+            size=size,
+            expires=time.monotonic() + ttl,
+            vehicle_id=vehicle_id,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._bytes += size
+
+        if vehicle_id is not None:
+            self._by_vehicle.setdefault(vehicle_id, set()).add(key)
+
+        self._evict()
+
+    def refresh(self, key: CacheKey) -> CacheEntry | None:
+        """Extend an entry's lifetime after a 304 Not Modified."""
+        entry = self.get(key)
+        if entry is not None:
+            entry.expires = time.monotonic() + self.ttl_for(key[1])
+            self.revalidations += 1
+        return entry
+
+    def discard(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        self._bytes -= entry.size
+        if entry.vehicle_id is not None:
+            keys = self._by_vehicle.get(entry.vehicle_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_vehicle[entry.vehicle_id]
+
+    def invalidate_vehicle(self, vehicle_id: int | str) -> None:
+        """Drop every cached response that belongs to a vehicle."""
+        for key in list(self._by_vehicle.get(str(vehicle_id), ())):
+            self.discard(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_vehicle.clear()
+        self._bytes = 0
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+        ):
+            key = next(iter(self._entries))
+            self.discard(key)
+            self.evictions += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cache statistics for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+        }
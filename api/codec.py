@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Encodings offered to the server; both are handled by zlib
+ACCEPT_ENCODING = "gzip, deflate"
+
+CODEC_NAME = "orjson" if orjson is not None else "json"
+
+
+if orjson is not None:
+
+    def loads(body: bytes | str) -> Any:
+        return orjson.loads(body)
+
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+else:
+
+    def loads(body: bytes | str) -> Any:
+        return json.loads(body)
+
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+
+class BodyDecoder:
+    """Undo the Content-Encoding of a response, whole or chunk by chunk.
+
+    Responses are read with aiohttp's automatic decompression turned off,
+    so both the bytes received on the wire and the decoded body size are
+    known. Streamed bodies are inflated incrementally and never held in
+    full.
+    """
+
+    def __init__(self, encoding: str | None):
+        encoding = (encoding or "identity").strip().lower()
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self._raw_deflate = False
+
+        if encoding == "identity":
+            self._inflater = None
+        elif encoding in ("gzip", "x-gzip"):
+            self._inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self._inflater = zlib.decompressobj(zlib.MAX_WBITS)
+            # Some servers send raw deflate without the zlib header
+            self._raw_deflate = True
+        else:
+            raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+
+    def feed(self, chunk: bytes) -> bytes:
+        self.wire_bytes += len(chunk)
+        if self._inflater is None:
+            data = chunk
+        else:
+            try:
+                data = self._inflater.decompress(chunk)
+            except zlib.error:
+                if not (self._raw_deflate and self.body_bytes == 0):
+                    raise
+                self._inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+                data = self._inflater.decompress(chunk)
+            self._raw_deflate = False
+        self.body_bytes += len(data)
+        return data
+
+    def flush(self) -> bytes:
+        if self._inflater is None:
+            return b""
+        data = self._inflater.flush()
+        self.body_bytes += len(data)
+        return data
+
+
+def decode_body(body: bytes, encoding: str | None) -> tuple[bytes, BodyDecoder]:
+    """Decode a complete response body."""
+    decoder = BodyDecoder(encoding)
+    return decoder.feed(body) + decoder.flush(), decoder
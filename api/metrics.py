@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Any
+
+from .cache import split_path
+
+# Upper bounds of the latency buckets in seconds; the last one is open
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0,
+)
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with interpolated percentiles.
+
+    Memory is constant no matter how many requests are recorded, so it
+    can run for the lifetime of a config entry. Percentiles are estimated
+    by interpolating inside the bucket that holds them.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def add(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float | None:
+        if not self.count:
+            return None
+
+        rank = self.count * percent / 100
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count or seen + bucket_count < rank:
+                seen += bucket_count
+                continue
+
+            lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+            upper = (
+                LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max
+            )
+            # Observed extremes are tighter bounds than the bucket edges
+            lower = max(lower, self.min)
+            upper = min(upper, self.max)
+            return lower + (upper - lower) * (rank - seen) / bucket_count
+
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        data = {f"p{percent}": _ms(self.percentile(percent)) for percent in PERCENTILES}
+        data["mean"] = _ms(self.mean)
+        data["max"] = _ms(self.max)
+        return data
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def _ratio(body: int, wire: int) -> float | None:
+    return round(body / wire, 2) if wire else None
+
+
+class EndpointMetrics:
+    """Counters for one API endpoint."""
+
+    __slots__ = ("requests", "errors", "bytes", "wire_bytes", "latency", "last_error")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors: Counter[str] = Counter()
+        # Decoded body size, and what actually crossed the network
+        self.bytes = 0
+        self.wire_bytes = 0
+        self.latency = LatencyHistogram()
+        self.last_error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "bytes": self.bytes,
+            "wire_bytes": self.wire_bytes,
+            "compression_ratio": _ratio(self.bytes, self.wire_bytes),
+            "latency_ms": self.latency.as_dict(),
+            "last_error": self.last_error,
+        }
+
+
+class ApiMetrics:
+    """Per-endpoint request counts, errors, bytes and latency.
+
+    Endpoints are keyed by path without the query string, so every
+    vehicle shares the counters of e.g. /api/vehicle/fuelrecords/list.
+    """
+
+    def __init__(self):
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.latency = LatencyHistogram()
+
+    def record(
+        self,
+        path: str,
+        duration: float,
+        size: int = 0,
+        error: BaseException | None = None,
+        wire_size: int | None = None,
+    ) -> None:
+        """Record one request; wire_size defaults to size when uncompressed."""
+        endpoint, _ = split_path(path)
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+
+        metrics.requests += 1
+        metrics.bytes += size
+        metrics.wire_bytes += size if wire_size is None else wire_size
+        metrics.latency.add(duration)
+        self.latency.add(duration)
+
+        if error is not None:
+            name = type(error).__name__
+            status = getattr(error, "status", None)
+            if status:
+                name = f"{name}({status})"
+            metrics.errors[name] += 1
+            metrics.last_error = str(error) or name
+
+    @property
+    def requests(self) -> int:
+        return sum(metrics.requests for metrics in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(
+            sum(metrics.errors.values()) for metrics in self.endpoints.values()
+        )
+
+    @property
+    def bytes(self) -> int:
+        return sum(metrics.bytes for metrics in self.endpoints.values())
+
+    @property
+    def wire_bytes(self) -> int:
+        return sum(metrics.wire_bytes for metrics in self.endpoints.values())
+
+    def slowest(self, percent: float = 95) -> tuple[str, float] | None:
+        """Return the endpoint with the highest latency percentile."""
+        ranked = [
+            (metrics.latency.percentile(percent), endpoint)
+            for endpoint, metrics in self.endpoints.items()
+            if metrics.latency.count
+        ]
+        if not ranked:
+            return None
+        seconds, endpoint = max(ranked)
+        return endpoint, seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "wire_bytes": self.wire_bytes,
+            "compression_ratio": _ratio(self.bytes, self.wire_bytes),
+            "latency_ms": self.latency.as_dict(),
+            "endpoints": {
+                endpoint: metrics.as_dict()
+                for endpoint, metrics in sorted(self.endpoints.items())
+            },
+        }
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import hashlib
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, fields
+from datetime import date
+from typing import Any, Callable, Iterable
+
+from .parsing import parse_bool, parse_date, parse_float
+
+
+def list_of(model: Any, **options: Any) -> Callable[[Any], list[Any]]:
+    """Return a parser turning a JSON list into model instances."""
+
+    def _parse(value: Any) -> list[Any]:
+        return [model.from_json(item, **options) for item in value or []]
+
+    return _parse
+
+
+def _parse_id(value: Any) -> int | None:
+    try:
+        record_id = int(value)
+    except (TypeError, ValueError):
+        return None
+    return record_id or None
+
+
+def _text(value: Any) -> str | None:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+@dataclass(slots=True)
+class Vehicle:
+    """A vehicle as returned by /api/vehicles."""
+
+    id: int
+    year: int | None = None
+    make: str | None = None
+    model: str | None = None
+    license_plate: str | None = None
+    purchase_date: str | None = None
+    sold_date: str | None = None
+    odometer_multiplier: str | None = None
+    odometer_difference: str | None = None
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Vehicle:
+        year = parse_float(data.get("year"))
+        return cls(
+            id=int(data["id"]),
+            year=int(year) if year else None,
+            make=_text(data.get("make")),
+            model=_text(data.get("model")),
+            license_plate=_text(data.get("licensePlate")),
+            purchase_date=_text(data.get("purchaseDate")),
+            sold_date=_text(data.get("soldDate")),
+            odometer_multiplier=_text(data.get("odometerMultiplier")),
+            odometer_difference=_text(data.get("odometerDifference")),
+        )
+
+    @property
+    def sold(self) -> bool:
+        return bool(self.sold_date)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "year": self.year,
+            "make": self.make,
+            "model": self.model,
+            "licensePlate": self.license_plate,
+            "purchaseDate": self.purchase_date,
+            "soldDate": self.sold_date,
+            "odometerMultiplier": self.odometer_multiplier,
+            "odometerDifference": self.odometer_difference,
+        }
+
+
+class _Record:
+    """Shared helpers for dated history records."""
+
+    __slots__ = ()
+
+    def fingerprint(self) -> str:
+        """Stable content hash used to detect changed records."""
+        raw = repr(tuple(getattr(self, f.name) for f in fields(self)))
+        return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+
+    def as_dict(self) -> dict[str, Any]:
+        data = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            data[_JSON_NAMES.get(f.name, f.name)] = (
+                value.isoformat() if isinstance(value, date) else value
+            )
+        return data
+
+
+@dataclass(slots=True)
+class OdometerRecord(_Record):
+    """An odometer reading."""
+
+    id: int | None
+    date: date | None
+    odometer: float | None
+    initial_odometer: float | None = None
+    notes: str | None = None
+
+    @classmethod
+    def from_json(
+        cls, data: dict[str, Any], day_first: bool = False
+    ) -> OdometerRecord:
+        return cls(
+            id=_parse_id(data.get("id")),
+            date=parse_date(data.get("date"), day_first),
+            odometer=parse_float(data.get("odometer")),
+            initial_odometer=parse_float(data.get("initialOdometer")),
+            notes=_text(data.get("notes")),
+        )
+
+
+@dataclass(slots=True)
+class FuelRecord(_Record):
+    """A fill-up."""
+
+    id: int | None
+    date: date | None
+    odometer: float | None
+    fuel_consumed: float = 0.0
+    cost: float = 0.0
+    is_fill_to_full: bool = True
+    missed_fuel_up: bool = False
+    notes: str | None = None
+
+    @classmethod
+    def from_json(
+        cls, data: dict[str, Any], day_first: bool = False
+    ) -> FuelRecord:
+        return cls(
+            id=_parse_id(data.get("id")),
+            date=parse_date(data.get("date"), day_first),
+            odometer=parse_float(data.get("odometer")),
+            fuel_consumed=parse_float(data.get("fuelConsumed")) or 0.0,
+            cost=parse_float(data.get("cost")) or 0.0,
+            is_fill_to_full=parse_bool(data.get("isFillToFull", True)),
+            missed_fuel_up=parse_bool(data.get("missedFuelUp", False)),
+            notes=_text(data.get("notes")),
+        )
+
+
+@dataclass(slots=True)
+class ServiceRecord(_Record):
+    """A service or repair entry."""
+
+    id: int | None
+    date: date | None
+    odometer: float | None
+    description: str | None = None
+    cost: float = 0.0
+    notes: str | None = None
+
+    @classmethod
+    def from_json(
+        cls, data: dict[str, Any], day_first: bool = False
+    ) -> ServiceRecord:
+        return cls(
+            id=_parse_id(data.get("id")),
+            date=parse_date(data.get("date"), day_first),
+            odometer=parse_float(data.get("odometer")),
+            description=_text(data.get("description")),
+            cost=parse_float(data.get("cost")) or 0.0,
+            notes=_text(data.get("notes")),
+        )
+
+
+# Attribute names that differ from LubeLogger's JSON keys
+_JSON_NAMES = {
+    "initial_odometer": "initialOdometer",
+    "fuel_consumed": "fuelConsumed",
+    "is_fill_to_full": "isFillToFull",
+    "missed_fuel_up": "missedFuelUp",
+}
+
+HistoryRecord = OdometerRecord | FuelRecord | ServiceRecord
+
+_NAN = float("nan")
+
+
+class RecordColumns:
+    """Array-backed date, odometer and cost columns for a long history.
+
+    Rows are appended in date order. Each column is a typed array, so a
+    history costs a few machine words per row instead of a Python object
+    per field, and date windows are a bisect away.
+    """
+
+    __slots__ = ("days", "odometer", "cost")
+
+    def __init__(self, records: Iterable[HistoryRecord] = ()):
+        self.days = array("l")
+        self.odometer = array("d")
+        self.cost = array("d")
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def append(self, record: HistoryRecord) -> None:
+        self.days.append(record.date.toordinal() if record.date else 0)
+        self.odometer.append(_NAN if record.odometer is None else record.odometer)
+        self.cost.append(getattr(record, "cost", 0.0))
+
+    def index_since(self, day: date) -> int:
+        """Return the first row dated on or after day."""
+        return bisect_left(self.days, day.toordinal())
@@ -1,5 +1,9 @@
 from __future__ import annotations
+from datetime import date
+from typing import AsyncIterator
+
 from .base import LubeLoggerApiBase
+from .models import OdometerRecord, list_of
 
 
 class OdometerApi(LubeLoggerApiBase):
@@ -10,6 +14,43 @@ class OdometerApi(LubeLoggerApiBase):
             f"/api/vehicle/odometerrecords/latest?vehicleId={vehicle_id}"
         )
 
+    async def list(self, vehicle_id: int) -> list[OdometerRecord]:
+        return await self._request(
+            "GET",
+            f"/api/vehicle/odometerrecords/list?vehicleId={vehicle_id}",
+            parse=list_of(OdometerRecord, day_first=self._day_first),
+        )
+
+    def iter_records(self, vehicle_id: int) -> AsyncIterator[OdometerRecord]:
+        """Stream records one at a time instead of loading the whole list."""
+        return self._stream(
+            "GET",
+            f"/api/vehicle/odometerrecords/list?vehicleId={vehicle_id}",
+            parse=self._parser(OdometerRecord),
+        )
+
+    def iter_window(
+        self,
+        vehicle_id: int,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> AsyncIterator[OdometerRecord]:
+        """Stream records dated from start to end (inclusive, open if None)."""
+        return self._stream_window(
+            f"/api/vehicle/odometerrecords/list?vehicleId={vehicle_id}",
+            start,
+            end,
+            parse=self._parser(OdometerRecord),
+        )
+
+    async def list_window(
+        self,
+        vehicle_id: int,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[OdometerRecord]:
+        return [record async for record in self.iter_window(vehicle_id, start, end)]
+
     async def add(self, vehicle_id: int, value: float, date: str):
         return await self._request(
             "POST",
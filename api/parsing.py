@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any
+
+# LubeLogger formats dates with the server culture. Slashed dates are
+# ambiguous, so their order comes from the server's configuration rather
+# than from whichever format happens to parse; the other shapes are not.
+_MONTH_FIRST_FORMATS = ("%m/%d/%Y", "%Y/%m/%d", "%d.%m.%Y", "%d-%m-%Y")
+_DAY_FIRST_FORMATS = ("%d/%m/%Y", "%Y/%m/%d", "%d.%m.%Y", "%d-%m-%Y")
+
+
+def parse_date(value: Any, day_first: bool = False) -> date | None:
+    """Parse a LubeLogger date string, returning None when unparseable.
+
+    day_first reads slashed dates as dd/MM/yyyy instead of MM/dd/yyyy.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    text = str(value).strip()
+    if not text:
+        return None
+
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        pass
+
+    # Drop a trailing time component such as "1/15/2024 12:00:00 AM"
+    head = text.split(" ", 1)[0]
+    for fmt in _DAY_FIRST_FORMATS if day_first else _MONTH_FIRST_FORMATS:
+        try:
+            return datetime.strptime(head, fmt).date()
+        except ValueError:
+            continue
+
+    return None
+
+
+def parse_float(value: Any) -> float | None:
+    """Parse a number that LubeLogger may send as a (localised) string.
+
+    Returns None when unparseable, and for a lone comma followed by three
+    digits, which reads as either a thousands separator or a decimal comma.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    text = str(value).strip().replace(" ", "")
+    if not text:
+        return None
+
+    # Strip currency symbols and other decorations
+    text = "".join(ch for ch in text if ch.isdigit() or ch in ".,-")
+    if "," in text and "." in text:
+        # Whichever separator comes last is the decimal point
+        if text.rfind(",") > text.rfind("."):
+            text = text.replace(".", "").replace(",", ".")
+        else:
+            text = text.replace(",", "")
+    elif text.count(",") > 1:
+        # Thousands separators only, e.g. "1,234,567"
+        text = text.replace(",", "")
+    elif "," in text:
+        whole, fraction = text.split(",")
+        digits = whole.lstrip("-")
+        if len(fraction) == 3 and digits and digits != "0" and len(digits) <= 3:
+            # "45,123" is 45123 in one culture and 45.123 in another; a
+            # wrong guess is off by a factor of a thousand, so don't
+            return None
+        text = f"{whole}.{fraction}"
+
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("true", "1", "yes")
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from .session import host_key
+
+# Lower values are served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+_PRIORITY: ContextVar[int] = ContextVar(
+    "lubelogger_request_priority", default=PRIORITY_BACKGROUND
+)
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Send the requests made inside the block at the given priority.
+
+    The priority follows the asyncio context, so tasks started inside the
+    block inherit it.
+    """
+    token = _PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+def current_priority() -> int:
+    return _PRIORITY.get()
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Requests per second and burst size for reads and for writes.
+
+    A rate of 0 turns limiting off for that bucket.
+    """
+
+    read_rate: float = 20.0
+    read_burst: int = 40
+    write_rate: float = 5.0
+    write_burst: int = 10
+
+
+class TokenBucket:
+    """Async token bucket that hands out tokens by priority, then FIFO.
+
+    Callers that find a token available and nobody queued take it without
+    suspending. Everyone else waits in a heap and is woken by a single
+    timer when the next token is due, so waiting costs no polling.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+        self.acquired = 0
+        self.delayed = 0
+        self.wait_total = 0.0
+
+    def configure(self, rate: float, burst: int) -> None:
+        self._refill()
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = min(self._tokens, self.burst)
+        self._dispatch()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.rate > 0:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+        self._updated = now
+
+    async def acquire(self, priority: int = PRIORITY_BACKGROUND) -> float:
+        """Wait for a token; returns the seconds spent waiting."""
+        self.acquired += 1
+        if self.rate <= 0:
+            return 0.0
+
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._dispatch()
+
+        start = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as we were cancelled; hand the token on
+                self._tokens += 1
+                self._dispatch()
+            raise
+
+        waited = time.monotonic() - start
+        self.delayed += 1
+        self.wait_total += waited
+        return waited
+
+    def _dispatch(self) -> None:
+        if self.rate <= 0:
+            # Limiting was turned off; let everyone through
+            self._tokens = float(len(self._waiters) + self.burst)
+
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                # Cancelled while queued
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+
+        if self._waiters and self._timer is None:
+            delay = (1 - self._tokens) / self.rate
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def as_dict(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "queued": sum(1 for *_, future in self._waiters if not future.done()),
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "wait_seconds": round(self.wait_total, 3),
+        }
+
+
+class RateLimiter:
+    """Separate read and write budgets for one LubeLogger host.
+
+    GETs draw from the read bucket and everything else from the write
+    bucket, so a long sync cannot hold back a user's write. Within a
+    bucket, requests made under PRIORITY_INTERACTIVE go before queued
+    background requests.
+    """
+
+    def __init__(self, host: str, limits: RateLimits | None = None):
+        self.host = host
+        limits = limits or RateLimits()
+        self.read = TokenBucket(limits.read_rate, limits.read_burst)
+        self.write = TokenBucket(limits.write_rate, limits.write_burst)
+
+    def configure(self, limits: RateLimits) -> None:
+        self.read.configure(limits.read_rate, limits.read_burst)
+        self.write.configure(limits.write_rate, limits.write_burst)
+
+    async def acquire(self, method: str) -> float:
+        bucket = self.read if method == "GET" else self.write
+        return await bucket.acquire(current_priority())
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"read": self.read.as_dict(), "write": self.write.as_dict()}
+
+
+_LIMITERS: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(base_url: str, limits: RateLimits | None = None) -> RateLimiter:
+    """Return the rate limiter shared by every client of a host.
+
+    Passing limits reconfigures an existing limiter, so the most recently
+    set up config entry for a host decides its budget.
+    """
+    key = host_key(base_url)
+    limiter = _LIMITERS.get(key)
+    if limiter is None:
+        limiter = _LIMITERS[key] = RateLimiter(key, limits)
+    elif limits is not None:
+        limiter.configure(limits)
+    return limiter
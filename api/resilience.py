@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+
+from .session import host_key
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Raised instead of sending a request while the host is known to be down."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter for idempotent requests."""
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    retry_statuses: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504})
+
+    def should_retry(self, err: BaseException) -> bool:
+        if isinstance(err, CircuitOpenError):
+            return False
+        if isinstance(err, aiohttp.ClientResponseError):
+            return err.status in self.retry_statuses
+        return isinstance(err, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number attempt (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+def is_outage(err: BaseException) -> bool:
+    """Whether a failure suggests the server itself is unreachable or broken."""
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status >= 500
+    return isinstance(err, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker.
+
+    After failure_threshold consecutive outage failures the circuit opens
+    and every request fails fast with CircuitOpenError. Once reset_timeout
+    has passed a single half-open probe is let through; success closes the
+    circuit, failure opens it for another interval.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.times_opened = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent now."""
+        if self.state == STATE_CLOSED:
+            return
+
+        if self.state == STATE_OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError(f"LubeLogger at {self.name} is unavailable")
+            self.state = STATE_HALF_OPEN
+            _LOGGER.info("LubeLogger: Probing %s after outage", self.name)
+
+        if self._probe_in_flight:
+            self.rejected += 1
+            raise CircuitOpenError(f"LubeLogger at {self.name} is being probed")
+        self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        if self.state != STATE_CLOSED:
+            _LOGGER.warning("LubeLogger: %s is reachable again", self.name)
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_in_flight = False
+
+        if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state == STATE_CLOSED:
+                self.times_opened += 1
+                _LOGGER.warning(
+                    "LubeLogger: %s unreachable after %s failures, pausing requests "
+                    "for %ss",
+                    self.name,
+                    self.failures,
+                    self.reset_timeout,
+                )
+            self.state = STATE_OPEN
+            self.opened_at = time.monotonic()
+
+    def abandon(self) -> None:
+        """Release a half-open probe whose request was cancelled."""
+        self._probe_in_flight = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return breaker state for diagnostics."""
+        retry_in = None
+        if self.state == STATE_OPEN and self.opened_at is not None:
+            retry_in = max(
+                0.0, round(self.reset_timeout - (time.monotonic() - self.opened_at), 1)
+            )
+        return {
+            "host": self.name,
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+            "rejected_requests": self.rejected,
+            "retry_in": retry_in,
+        }
+
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(base_url: str) -> CircuitBreaker:
+    """Return the circuit breaker shared by every client of a host."""
+    key = host_key(base_url)
+    breaker = _BREAKERS.get(key)
+    if breaker is None:
+        breaker = _BREAKERS[key] = CircuitBreaker(key)
+    return breaker
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+from ..const import DEFAULT_MAX_CONCURRENCY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class FleetFetchResult:
+    """Outcome of a fleet-wide fetch, keyed by vehicle id."""
+
+    results: dict[Hashable, Any] = field(default_factory=dict)
+    errors: dict[Hashable, BaseException] = field(default_factory=dict)
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class FleetFetchScheduler:
+    """Run per-vehicle requests across a fleet with bounded concurrency.
+
+    Deadlines are left to the API client, which times out each request
+    on its own and retries it, so one slow vehicle fails on its own
+    without stalling the whole refresh and still counts towards the
+    circuit breaker. Failures are collected per vehicle rather than raised.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._max_concurrency = max_concurrency
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    async def gather(
+        self,
+        keys: Iterable[Hashable],
+        fetch: Callable[[Hashable], Awaitable[Any]],
+    ) -> FleetFetchResult:
+        """Call fetch(key) for every key and collect results and errors."""
+        keys = list(dict.fromkeys(keys))
+        result = FleetFetchResult()
+
+        if not keys:
+            return result
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        start = time.monotonic()
+
+        async def _run(key: Hashable) -> None:
+            async with semaphore:
+                try:
+                    value = await fetch(key)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as err:
+                    result.errors[key] = err
+                else:
+                    result.results[key] = value
+
+        await asyncio.gather(*(_run(key) for key in keys))
+
+        result.duration = round(time.monotonic() - start, 3)
+
+        if result.errors:
+            _LOGGER.debug(
+                "LubeLogger: Fleet fetch finished in %ss with %s/%s failures",
+                result.duration,
+                len(result.errors),
+                len(keys),
+            )
+
+        return result
@@ -1,15 +1,50 @@
 from __future__ import annotations
+from datetime import date
+from typing import AsyncIterator
+
 from .base import LubeLoggerApiBase
+from .models import ServiceRecord, list_of
 
 
 class ServiceRecordApi(LubeLoggerApiBase):
 
-    async def list(self, vehicle_id: int):
+    async def list(self, vehicle_id: int) -> list[ServiceRecord]:
         return await self._request(
             "GET",
-            f"/api/vehicle/servicerecords/list?vehicleId={vehicle_id}"
+            f"/api/vehicle/servicerecords/list?vehicleId={vehicle_id}",
+            parse=list_of(ServiceRecord, day_first=self._day_first),
+        )
+
+    def iter_records(self, vehicle_id: int) -> AsyncIterator[ServiceRecord]:
+        """Stream records one at a time instead of loading the whole list."""
+        return self._stream(
+            "GET",
+            f"/api/vehicle/servicerecords/list?vehicleId={vehicle_id}",
+            parse=self._parser(ServiceRecord),
         )
 
+    def iter_window(
+        self,
+        vehicle_id: int,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> AsyncIterator[ServiceRecord]:
+        """Stream records dated from start to end (inclusive, open if None)."""
+        return self._stream_window(
+            f"/api/vehicle/servicerecords/list?vehicleId={vehicle_id}",
+            start,
+            end,
+            parse=self._parser(ServiceRecord),
+        )
+
+    async def list_window(
+        self,
+        vehicle_id: int,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[ServiceRecord]:
+        return [record async for record in self.iter_window(vehicle_id, start, end)]
+
     async def add(self, vehicle_id: int, data: dict):
         return await self._request(
             "POST",
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import logging
+from urllib.parse import urlsplit
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# Connection pool tuning for a single LubeLogger host
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = 8
+KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_TTL = 300
+
+
+def host_key(base_url: str) -> str:
+    """Return the scheme://host:port key used to share per-host state."""
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class _SharedSession:
+    """Reference counted aiohttp session for one LubeLogger host."""
+
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
+        self.refs = 0
+
+
+_SESSIONS: dict[str, _SharedSession] = {}
+
+
+def _create_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+
+    # Auth is sent per request, so cookies must never leak between
+    # config entries that share a host but use different credentials.
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+    )
+
+
+def acquire_session(base_url: str) -> aiohttp.ClientSession:
+    """Return the pooled session for a host, creating it on first use.
+
+    Must be called from within the event loop. Every call must be paired
+    with a call to release_session().
+    """
+    key = host_key(base_url)
+    shared = _SESSIONS.get(key)
+
+    if shared is None or shared.session.closed:
+        _LOGGER.debug("LubeLogger: Opening pooled session for %s", key)
+        shared = _SharedSession(_create_session())
+        _SESSIONS[key] = shared
+
+    shared.refs += 1
+    return shared.session
+
+
+async def release_session(base_url: str) -> None:
+    """Drop a reference to a host session and close it once unused."""
+    key = host_key(base_url)
+    shared = _SESSIONS.get(key)
+
+    if shared is None:
+        return
+
+    shared.refs -= 1
+    if shared.refs > 0:
+        return
+
+    _SESSIONS.pop(key, None)
+    if not shared.session.closed:
+        _LOGGER.debug("LubeLogger: Closing pooled session for %s", key)
+        await shared.session.close()
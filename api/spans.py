@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class SpanStats:
+    """Call count and wall-clock time of one named span."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 1),
+            "mean_ms": round(self.total / self.count * 1000, 2) if self.count else None,
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+
+class SpanRecorder:
+    """Timings collected while a profile is running."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.spans: dict[str, SpanStats] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        stats = self.spans.get(name)
+        if stats is None:
+            stats = self.spans[name] = SpanStats()
+        stats.count += 1
+        stats.total += seconds
+        if seconds > stats.max:
+            stats.max = seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            name: stats.as_dict()
+            for name, stats in sorted(
+                self.spans.items(), key=lambda item: item[1].total, reverse=True
+            )
+        }
+
+
+class _Span:
+    __slots__ = ("_recorder", "_name", "_start")
+
+    def __init__(self, recorder: SpanRecorder, name: str):
+        self._recorder = recorder
+        self._name = name
+
+    def __enter__(self) -> _Span:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._recorder.add(self._name, time.perf_counter() - self._start)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+_recorder: SpanRecorder | None = None
+
+
+def span(name: str) -> _Span | _NullSpan:
+    """Time the enclosed block under name while a profile is running.
+
+    With no profile running this returns a shared no-op context manager,
+    so instrumented code pays one global lookup and nothing is allocated.
+    Spans around awaits measure wall-clock time, including time other
+    tasks spent running in between.
+    """
+    recorder = _recorder
+    if recorder is None:
+        return _NULL_SPAN
+    return _Span(recorder, name)
+
+
+def start_spans() -> SpanRecorder:
+    global _recorder
+    if _recorder is not None:
+        raise RuntimeError("Span recording is already running")
+    _recorder = SpanRecorder()
+    return _recorder
+
+
+def stop_spans() -> SpanRecorder | None:
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def spans_active() -> bool:
+    return _recorder is not None
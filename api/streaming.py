@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any
+
+_WHITESPACE = " \t\r\n"
+
+
+class JsonArrayDecoder:
+    """Incrementally decode the elements of a top-level JSON array.
+
+    Feed raw bytes as they arrive and get back every element that is
+    complete so far. Only the undecoded tail of the body is buffered, so
+    memory stays proportional to one record rather than the whole list.
+    """
+
+    def __init__(self):
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self.items = 0
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        self._buffer += self._utf8.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        """Flush the remaining input; raises ValueError if it is incomplete."""
+        self._buffer += self._utf8.decode(b"", final=True)
+        items = self._drain(final=True)
+
+        if not self._finished:
+            if not self._started and not self._buffer.strip():
+                # Empty body, treated like an empty list
+                return items
+            raise ValueError("Truncated JSON array in response")
+
+        return items
+
+    def _skip(self, pos: int) -> int:
+        buffer = self._buffer
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+    def _drain(self, final: bool) -> list[Any]:
+        items: list[Any] = []
+        buffer = self._buffer
+        pos = self._skip(0)
+
+        if not self._started:
+            if pos >= len(buffer):
+                self._buffer = ""
+                return items
+            if buffer[pos] != "[":
+                raise ValueError("Expected a JSON array in response")
+            self._started = True
+            pos = self._skip(pos + 1)
+
+        while pos < len(buffer) and not self._finished:
+            char = buffer[pos]
+
+            if char == "]":
+                self._finished = True
+                pos += 1
+                break
+
+            if char == ",":
+                pos = self._skip(pos + 1)
+                continue
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                # Element not fully received yet
+                break
+
+            # A bare number or literal is only complete once a separator
+            # follows it; "15" may still become "1500.5" with more input.
+            if not isinstance(item, (dict, list, str)):
+                after = self._skip(end)
+                if after >= len(buffer):
+                    if not final:
+                        break
+                elif buffer[after] not in ",]":
+                    if final:
+                        raise ValueError("Malformed JSON array in response")
+                    break
+
+            items.append(item)
+            self.items += 1
+            pos = self._skip(end)
+
+        self._buffer = buffer[pos:]
+        return items
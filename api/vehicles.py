@@ -1,11 +1,16 @@
 from __future__ import annotations
 from .base import LubeLoggerApiBase
+from .models import Vehicle, list_of
 
 
 class VehicleApi(LubeLoggerApiBase):
 
-    async def vehicles_list(self):
-        return await self._request("GET", "/api/vehicles")
+    async def vehicles_list(self) -> list[Vehicle]:
+        return await self._request("GET", "/api/vehicles", parse=list_of(Vehicle))
 
-    async def get(self, vehicle_id: int):
-        return await self._request("GET", f"/api/vehicle/get?id={vehicle_id}")
+    async def get(self, vehicle_id: int) -> Vehicle:
+        return await self._request(
+            "GET",
+            f"/api/vehicle/get?id={vehicle_id}",
+            parse=Vehicle.from_json,
+        )
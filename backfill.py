@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable, Iterable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .api import PRIORITY_BACKGROUND, LubeLoggerApi, bypass_cache, request_priority
+from .api.models import Vehicle
+from .api.parsing import parse_date
+from .const import DOMAIN
+from .sync import (
+    FULL_HISTORY,
+    RECORD_FUEL,
+    RECORD_ODOMETER,
+    RECORD_SERVICE,
+    WINDOWED_KINDS,
+    RecordIndex,
+    RecordSyncEngine,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Days of history fetched per backfill request
+BACKFILL_CHUNK_DAYS = 365
+# Without a purchase date or model year, this many empty chunks in a row
+# are taken as the start of the history
+MAX_EMPTY_CHUNKS = 3
+
+# Oldest date a consumer needs records from, given today, or None when
+# it currently needs nothing beyond what is stored
+HistoryNeed = Callable[[date], date | None]
+
+
+def full_history(today: date) -> date:
+    return FULL_HISTORY
+
+
+def year_to_date(today: date) -> date:
+    return today.replace(month=1, day=1)
+
+
+def days_back(days: int) -> HistoryNeed:
+    return lambda today: today - timedelta(days=days)
+
+
+def _history_floor(vehicle: Vehicle, day_first: bool = False) -> date | None:
+    """Oldest date a vehicle can plausibly have records for."""
+    purchased = parse_date(vehicle.purchase_date, day_first)
+    if purchased is not None:
+        return purchased
+    if vehicle.year:
+        # Registered the year before the model year at the earliest
+        return date(vehicle.year - 1, 1, 1)
+    return None
+
+
+class HistoryBackfill:
+    """Fetch record history older than the refresh window, on demand.
+
+    Regular refreshes only fetch the last few months of records.
+    Consumers register how far back they need each record kind; while
+    that reaches past what is stored, older records are fetched in
+    BACKFILL_CHUNK_DAYS chunks in a background task per vehicle and
+    record kind, newest first, until the need is met or the vehicle's
+    history starts. Each chunk is merged under the coordinator's fetch
+    lock. Once something older was found, the vehicle is refreshed with
+    a rebuild flag so analytics and statistics start over from the
+    extended index.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: LubeLoggerApi,
+        sync: RecordSyncEngine,
+        lock: asyncio.Lock,
+        on_finished: Callable[[list[int]], Awaitable[Any]],
+    ):
+        self._hass = hass
+        self._entry = entry
+        self._sync = sync
+        self._lock = lock
+        self._on_finished = on_finished
+        self._clients = {
+            RECORD_FUEL: api.fuel,
+            RECORD_SERVICE: api.service_records,
+            RECORD_ODOMETER: api.odometer,
+        }
+        self._day_first = api.day_first
+        self._tasks: dict[tuple[int, str], asyncio.Task] = {}
+        self._needs: dict[tuple[int, str], dict[str, HistoryNeed]] = {}
+        self._chunks = 0
+        self._failures = 0
+
+    def complete(self, vehicle_id: int) -> bool:
+        """Whether the full history of every windowed kind is stored."""
+        return all(
+            self._sync.index(vehicle_id, kind).covered_from == FULL_HISTORY
+            for kind in WINDOWED_KINDS
+        )
+
+    @callback
+    def async_require(
+        self,
+        vehicle: Vehicle,
+        consumer: str,
+        kinds: tuple[str, ...],
+        need: HistoryNeed,
+    ) -> CALLBACK_TYPE:
+        """Keep a vehicle's history fetched as far back as need asks.
+
+        Returns a callback that withdraws the need again.
+        """
+        for kind in kinds:
+            self._needs.setdefault((vehicle.id, kind), {})[consumer] = need
+        self.request(vehicle)
+
+        @callback
+        def release() -> None:
+            for kind in kinds:
+                self._needs.get((vehicle.id, kind), {}).pop(consumer, None)
+
+        return release
+
+    def needed_from(self, vehicle_id: int, kind: str) -> date | None:
+        """Oldest date any consumer currently needs records of a kind from."""
+        today = dt_util.now().date()
+        dates = [
+            needed
+            for need in self._needs.get((vehicle_id, kind), {}).values()
+            if (needed := need(today)) is not None
+        ]
+        return min(dates, default=None)
+
+    def _wanted(self, vehicle_id: int, kind: str, index: RecordIndex) -> bool:
+        covered = index.covered_from
+        # Nothing to extend before the first sync, nothing left after
+        if covered in (None, FULL_HISTORY):
+            return False
+        needed = self.needed_from(vehicle_id, kind)
+        return needed is not None and needed < covered
+
+    @callback
+    def request(self, vehicle: Vehicle) -> None:
+        """Start backfilling what consumers need and is not stored yet."""
+        for kind in WINDOWED_KINDS:
+            key = (vehicle.id, kind)
+            index = self._sync.index(vehicle.id, kind)
+            if key in self._tasks or not self._wanted(vehicle.id, kind, index):
+                continue
+
+            task = self._entry.async_create_background_task(
+                self._hass,
+                self._async_backfill(vehicle, kind),
+                f"{DOMAIN} backfill {vehicle.id} {kind}",
+            )
+            self._tasks[key] = task
+            task.add_done_callback(lambda _, key=key: self._tasks.pop(key, None))
+
+    async def _async_backfill(self, vehicle: Vehicle, kind: str) -> None:
+        # The task inherits the context of the refresh that requested it,
+        # which may be an interactive one that bypasses the cache
+        with request_priority(PRIORITY_BACKGROUND), bypass_cache(False):
+            await self._async_backfill_chunks(vehicle, kind)
+
+    async def _async_backfill_chunks(self, vehicle: Vehicle, kind: str) -> None:
+        index = self._sync.index(vehicle.id, kind)
+        client = self._clients[kind]
+        floor = _history_floor(vehicle, self._day_first)
+        found = False
+        empty = 0
+
+        while self._wanted(vehicle.id, kind, index):
+            end = index.covered_from - timedelta(days=1)
+            start = end - timedelta(days=BACKFILL_CHUNK_DAYS - 1)
+
+            reached_floor = floor is not None and start <= floor
+            if client.server_windows is False or reached_floor:
+                # One open-ended fetch finishes the job: the server sends
+                # everything anyway, or the history starts in this chunk
+                start = None
+
+            try:
+                async with self._lock:
+                    delta = await self._sync.async_apply_stream(
+                        vehicle.id,
+                        kind,
+                        client.iter_window(vehicle.id, start, end),
+                        start,
+                        end,
+                    )
+            except Exception as err:
+                # Retried on the next refresh while still needed
+                self._failures += 1
+                _LOGGER.warning(
+                    "LubeLogger: Backfill of vehicle %s %s records failed: %s",
+                    vehicle.id,
+                    kind,
+                    err,
+                )
+                return
+
+            self._chunks += 1
+            if delta:
+                found = True
+                empty = 0
+            else:
+                empty += 1
+                if floor is None and empty >= MAX_EMPTY_CHUNKS:
+                    self._sync.mark_complete(vehicle.id, kind)
+
+        _LOGGER.debug(
+            "LubeLogger: Backfilled vehicle %s %s history (%s records)",
+            vehicle.id,
+            kind,
+            len(index),
+        )
+
+        if found:
+            index.require_rebuild()
+            await self._on_finished([vehicle.id])
+
+    def prune(self, vehicle_ids: Iterable[int]) -> None:
+        """Forget the needs of vehicles that no longer exist."""
+        keep = set(vehicle_ids)
+        for key in [key for key in self._needs if key[0] not in keep]:
+            del self._needs[key]
+
+    async def async_shutdown(self) -> None:
+        for task in list(self._tasks.values()):
+            task.cancel()
+        self._tasks.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "running": sorted(f"{vid}:{kind}" for vid, kind in self._tasks),
+            "needed_from": {
+                f"{vid}:{kind}": needed.isoformat()
+                for vid, kind in sorted(self._needs)
+                if (needed := self.needed_from(vid, kind)) is not None
+            },
+            "chunks": self._chunks,
+            "failures": self._failures,
+        }
@@ -0,0 +1,150 @@
+"""Benchmark the API layer against a local fake LubeLogger server.
+
+Runs the same request pattern as a coordinator refresh (vehicle list,
+latest odometer per vehicle, streamed record listings) with the api
+package loaded on its own, so it needs aiohttp but not Home Assistant.
+
+    python benchmarks/bench_api.py --vehicles 1 10 100 --history 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import date
+from typing import Any
+
+from common import (
+    Timer,
+    add_fleet_arguments,
+    emit,
+    fleet_configs,
+    load_api,
+    peak_memory,
+    reset_server_stats,
+    server_stats,
+)
+from fake_server import FakeServerProcess, FleetConfig
+
+api_package = load_api()
+
+
+async def _drain(records) -> int:
+    count = 0
+    async for _record in records:
+        count += 1
+    return count
+
+
+async def refresh(api: Any, scheduler: Any) -> dict[str, Any]:
+    """Fetch the whole fleet the way the coordinator does."""
+    vehicles = await api.vehicles.vehicles_list()
+    vehicle_ids = [vehicle.id for vehicle in vehicles]
+
+    odometers = await scheduler.gather(vehicle_ids, api.odometer.get_latest_odometer)
+
+    clients = {
+        "odometer": api.odometer,
+        "fuel": api.fuel,
+        "service": api.service_records,
+    }
+
+    async def _listing(key: tuple[int, str]) -> int:
+        vehicle_id, kind = key
+        return await _drain(clients[kind].iter_records(vehicle_id))
+
+    listings = await scheduler.gather(
+        [(vid, kind) for vid in vehicle_ids for kind in clients], _listing
+    )
+
+    return {
+        "vehicles": len(vehicle_ids),
+        "records": sum(listings.results.values()),
+        "failed_requests": len(odometers.errors) + len(listings.errors),
+    }
+
+
+async def _measure_refresh(api: Any, scheduler: Any, base_url: str) -> dict[str, Any]:
+    await reset_server_stats(base_url)
+
+    with peak_memory() as memory, Timer() as timer:
+        summary = await refresh(api, scheduler)
+
+    stats = await server_stats(base_url)
+    return {
+        **summary,
+        "seconds": round(timer.elapsed, 4),
+        "requests": stats["total_requests"],
+        "not_modified": stats["not_modified"],
+        "bytes_received": stats["bytes_sent"],
+        "peak_memory_bytes": memory["peak_bytes"],
+    }
+
+
+async def _measure_writes(
+    api: Any, scheduler: Any, vehicles: int, writes: int
+) -> dict[str, Any]:
+    today = date.today().isoformat()
+    keys = range(writes)
+
+    async def _write(index: int) -> None:
+        await api.odometer.add(index % vehicles + 1, 100000 + index, today)
+
+    with Timer() as timer:
+        result = await scheduler.gather(keys, _write)
+
+    return {
+        "writes": writes,
+        "failed": len(result.errors),
+        "seconds": round(timer.elapsed, 4),
+        "writes_per_second": round(writes / timer.elapsed, 1) if timer.elapsed else None,
+    }
+
+
+async def run_scenario(
+    config: FleetConfig, writes: int, rate_limit: float = 0
+) -> dict[str, Any]:
+    with FakeServerProcess(config) as server:
+        api = api_package.LubeLoggerApi(
+            server.base_url,
+            "bench",
+            "bench",
+            cache=api_package.ResponseCache(),
+            rate_limits=api_package.RateLimits(
+                read_rate=rate_limit, write_rate=rate_limit
+            ),
+        )
+        scheduler = api_package.FleetFetchScheduler()
+        try:
+            cold = await _measure_refresh(api, scheduler, server.base_url)
+            warm = await _measure_refresh(api, scheduler, server.base_url)
+            write = await _measure_writes(api, scheduler, config.vehicles, writes)
+        finally:
+            await api.async_close()
+
+        return {
+            "fleet": server.describe(),
+            "cold_refresh": cold,
+            "warm_refresh": warm,
+            "writes": write,
+            "cache": api.cache.as_dict(),
+        }
+
+
+async def main(args: argparse.Namespace) -> None:
+    scenarios = []
+    for config in fleet_configs(args):
+        scenarios.append(await run_scenario(config, args.writes, args.rate_limit))
+    emit("api", scenarios, args.output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_fleet_arguments(parser)
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=0,
+        help="client-side requests per second for reads and writes; 0 is unlimited",
+    )
+    asyncio.run(main(parser.parse_args()))
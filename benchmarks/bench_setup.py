@@ -0,0 +1,168 @@
+"""Benchmark config entry setup, refreshes and services inside Home Assistant.
+
+Loads the integration as a custom component into a throwaway Home
+Assistant instance pointed at the fake server. Needs homeassistant and
+pytest-homeassistant-custom-component; when they are missing every
+scenario is reported as skipped so the output stays machine-readable.
+
+    python benchmarks/bench_setup.py --vehicles 1 10 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from common import (
+    REPO_ROOT,
+    Timer,
+    add_fleet_arguments,
+    emit,
+    fleet_configs,
+    peak_memory,
+    reset_server_stats,
+    server_stats,
+)
+from fake_server import FakeServerProcess, FleetConfig
+
+DOMAIN = "lubelogger"
+# Give up waiting for queued service writes after this many seconds
+DRAIN_TIMEOUT = 120
+
+try:
+    from homeassistant import loader
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+except ImportError as err:
+    SKIP_REASON: str | None = f"Home Assistant test helpers unavailable: {err}"
+else:
+    SKIP_REASON = None
+
+
+def _config_dir(root: Path) -> str:
+    """Create a config dir exposing this repo as custom_components/lubelogger."""
+    components = root / "custom_components"
+    components.mkdir()
+    (components / "__init__.py").touch()
+    (components / DOMAIN).symlink_to(REPO_ROOT, target_is_directory=True)
+    return str(root)
+
+
+async def _drain_outbox(outbox: Any) -> None:
+    async with asyncio.timeout(DRAIN_TIMEOUT):
+        while len(outbox):
+            await asyncio.sleep(0.01)
+
+
+async def _measure_services(hass: Any, data: Any, writes: int) -> dict[str, Any]:
+    entity_ids = [
+        state.entity_id
+        for state in hass.states.async_all("sensor")
+        if "vehicle_id" in state.attributes
+    ]
+    if not entity_ids:
+        return {"writes": 0, "error": "no vehicle info entities"}
+
+    today = date.today().isoformat()
+
+    with Timer() as total:
+        with Timer() as enqueue:
+            for index in range(writes):
+                await hass.services.async_call(
+                    DOMAIN,
+                    "add_odometer_entry",
+                    {
+                        "entity_id": entity_ids[index % len(entity_ids)],
+                        "value": 100000 + index,
+                        "date": today,
+                    },
+                    blocking=True,
+                )
+        # Service calls only queue the write; wait until it reaches the server
+        await _drain_outbox(data.outbox)
+
+    return {
+        "writes": writes,
+        "enqueue_seconds": round(enqueue.elapsed, 4),
+        "seconds": round(total.elapsed, 4),
+        "writes_per_second": round(writes / total.elapsed, 1) if total.elapsed else None,
+        "outbox": data.outbox.as_dict(),
+    }
+
+
+async def run_scenario(config: FleetConfig, writes: int) -> dict[str, Any]:
+    with FakeServerProcess(config) as server, tempfile.TemporaryDirectory() as tmp:
+        async with async_test_home_assistant(config_dir=_config_dir(Path(tmp))) as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                data={
+                    "base_url": server.base_url,
+                    "username": "bench",
+                    "password": "bench",
+                },
+            )
+            entry.add_to_hass(hass)
+
+            with peak_memory() as memory, Timer() as setup:
+                assert await hass.config_entries.async_setup(entry.entry_id)
+                await hass.async_block_till_done()
+
+            data = hass.data[DOMAIN][entry.entry_id]
+            entities = len(hass.states.async_all("sensor"))
+
+            await reset_server_stats(server.base_url)
+            with Timer() as refresh:
+                await data.coordinator.async_refresh()
+            stats = await server_stats(server.base_url)
+
+            services = await _measure_services(hass, data, writes)
+
+            await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+
+        return {
+            "fleet": server.describe(),
+            "status": "ok",
+            "setup": {
+                "seconds": round(setup.elapsed, 4),
+                "peak_memory_bytes": memory["peak_bytes"],
+                "entities": entities,
+            },
+            "refresh": {
+                "seconds": round(refresh.elapsed, 4),
+                "requests": stats["total_requests"],
+                "not_modified": stats["not_modified"],
+                "bytes_received": stats["bytes_sent"],
+            },
+            "services": services,
+        }
+
+
+async def main(args: argparse.Namespace) -> None:
+    scenarios = []
+    for config in fleet_configs(args):
+        if SKIP_REASON:
+            scenarios.append(
+                {
+                    "fleet": FakeServerProcess(config).describe(),
+                    "status": "skipped",
+                    "reason": SKIP_REASON,
+                }
+            )
+            continue
+        scenarios.append(await run_scenario(config, args.writes))
+    emit("setup", scenarios, args.output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_fleet_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,148 @@
+"""Helpers shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import types
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+import aiohttp
+
+from fake_server import RESET_PATH, STATS_PATH, FleetConfig
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ROOT_PACKAGE = "lubelogger"
+API_PACKAGE = f"{ROOT_PACKAGE}.api"
+
+
+def load_api() -> Any:
+    """Import the api package on its own, without Home Assistant.
+
+    The integration package is registered without running its __init__,
+    which needs Home Assistant; the api package only reaches up for const.
+    """
+    if API_PACKAGE in sys.modules:
+        return sys.modules[API_PACKAGE]
+
+    root = types.ModuleType(ROOT_PACKAGE)
+    root.__path__ = [str(REPO_ROOT)]
+    sys.modules.setdefault(ROOT_PACKAGE, root)
+    return importlib.import_module(API_PACKAGE)
+
+
+def add_fleet_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--vehicles",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100, 1000],
+        help="fleet sizes to run, one scenario each",
+    )
+    parser.add_argument("--history", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--no-compress",
+        dest="compress",
+        action="store_false",
+        help="serve uncompressed responses even when gzip is accepted",
+    )
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="append results as one JSON line to this file instead of stdout",
+    )
+
+
+def fleet_configs(args: argparse.Namespace) -> Iterator[FleetConfig]:
+    for vehicles in args.vehicles:
+        yield FleetConfig(
+            vehicles=vehicles,
+            history=args.history,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            compress=args.compress,
+        )
+
+
+class Timer:
+    """Wall clock duration of a block, in seconds."""
+
+    def __init__(self):
+        self.elapsed = 0.0
+
+    def __enter__(self) -> Timer:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.elapsed = time.perf_counter() - self._start
+
+
+@contextmanager
+def peak_memory() -> Iterator[dict[str, int]]:
+    """Record the peak traced allocation size of a block, in bytes."""
+    result = {"peak_bytes": 0}
+    tracemalloc.start()
+    try:
+        yield result
+    finally:
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+
+async def server_stats(base_url: str) -> dict[str, Any]:
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{base_url}{STATS_PATH}") as resp:
+            return await resp.json()
+
+
+async def reset_server_stats(base_url: str) -> None:
+    async with aiohttp.ClientSession() as session:
+        async with session.post(f"{base_url}{RESET_PATH}") as resp:
+            resp.raise_for_status()
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def emit(benchmark: str, scenarios: list[dict[str, Any]], output: Path | None) -> None:
+    """Write one JSON document describing a benchmark run."""
+    document = {
+        "benchmark": benchmark,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": scenarios,
+    }
+
+    if output is None:
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    with output.open("a", encoding="utf-8") as file:
+        file.write(json.dumps(document) + "\n")
@@ -0,0 +1,287 @@
+"""Local stand-in for a LubeLogger server used by the benchmarks.
+
+Implements the endpoints called from api/*.py with a generated fleet of
+configurable size and history length. Latency and server errors can be
+injected per request. The server runs in a child process so its
+allocations and CPU time do not skew what the benchmarks measure.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import multiprocessing
+import random
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Any
+
+from aiohttp import web
+
+DATE_FORMAT = "%m/%d/%Y"
+STATS_PATH = "/_bench/stats"
+RESET_PATH = "/_bench/reset"
+
+
+@dataclass
+class FleetConfig:
+    """Shape of the generated fleet and the faults to inject."""
+
+    vehicles: int = 10
+    # Records per vehicle for each of the odometer, fuel and service lists
+    history: int = 100
+    # Seconds added to every request, plus up to jitter seconds at random
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Fraction of requests answered with a 503
+    error_rate: float = 0.0
+    # gzip responses for clients that accept it
+    compress: bool = True
+    seed: int = 1
+
+
+def _day(start: date, index: int) -> str:
+    return (start + timedelta(days=index * 7)).strftime(DATE_FORMAT)
+
+
+class FakeFleet:
+    """Deterministic vehicles and record histories."""
+
+    def __init__(self, config: FleetConfig):
+        rng = random.Random(config.seed)
+        start = date.today() - timedelta(days=config.history * 7)
+
+        self.vehicles: dict[int, dict[str, Any]] = {}
+        self.odometer: dict[int, list[dict[str, Any]]] = {}
+        self.fuel: dict[int, list[dict[str, Any]]] = {}
+        self.service: dict[int, list[dict[str, Any]]] = {}
+        self._next_id = 1
+
+        for vehicle_id in range(1, config.vehicles + 1):
+            self.vehicles[vehicle_id] = {
+                "id": vehicle_id,
+                "year": str(2005 + vehicle_id % 20),
+                "make": rng.choice(["Ford", "Toyota", "Volkswagen", "Honda"]),
+                "model": f"Model {vehicle_id}",
+                "licensePlate": f"LL{vehicle_id:05d}",
+                "purchaseDate": _day(start, 0),
+                "soldDate": "",
+                "odometerMultiplier": "1",
+                "odometerDifference": "0",
+            }
+
+            odometer = rng.uniform(1000, 50000)
+            readings, fills, services = [], [], []
+            for index in range(config.history):
+                odometer += rng.uniform(50, 600)
+                day = _day(start, index)
+                readings.append(
+                    {
+                        "id": self._take_id(),
+                        "date": day,
+                        "initialOdometer": "0",
+                        "odometer": f"{odometer:.0f}",
+                        "notes": "",
+                    }
+                )
+                fuel = rng.uniform(20, 60)
+                fills.append(
+                    {
+                        "id": self._take_id(),
+                        "date": day,
+                        "odometer": f"{odometer:.0f}",
+                        "fuelConsumed": f"{fuel:.2f}",
+                        "cost": f"{fuel * 1.5:.2f}",
+                        "isFillToFull": "True",
+                        "missedFuelUp": "False",
+                        "notes": "",
+                    }
+                )
+                services.append(
+                    {
+                        "id": self._take_id(),
+                        "date": day,
+                        "odometer": f"{odometer:.0f}",
+                        "description": "Oil change",
+                        "cost": f"{rng.uniform(50, 400):.2f}",
+                        "notes": "",
+                    }
+                )
+
+            self.odometer[vehicle_id] = readings
+            self.fuel[vehicle_id] = fills
+            self.service[vehicle_id] = services
+
+    def _take_id(self) -> int:
+        record_id = self._next_id
+        self._next_id += 1
+        return record_id
+
+    def add(self, kind: str, vehicle_id: int, record: dict[str, Any]) -> None:
+        record = dict(record, id=self._take_id())
+        getattr(self, kind)[vehicle_id].append(record)
+
+
+class FakeLubeLogger:
+    """aiohttp application serving a FakeFleet."""
+
+    def __init__(self, config: FleetConfig):
+        self.config = config
+        self.fleet = FakeFleet(config)
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self.errors = 0
+        self.not_modified = 0
+        self._rng = random.Random(config.seed + 1)
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_get("/api/vehicles", self._vehicles)
+        self.app.router.add_get("/api/vehicle/get", self._vehicle)
+        self.app.router.add_get(
+            "/api/vehicle/odometerrecords/latest", self._latest_odometer
+        )
+        for kind, name in (
+            ("odometer", "odometerrecords"),
+            ("fuel", "fuelrecords"),
+            ("service", "servicerecords"),
+        ):
+            self.app.router.add_get(f"/api/vehicle/{name}/list", self._lister(kind))
+            self.app.router.add_post(f"/api/vehicle/{name}/add", self._adder(kind))
+        self.app.router.add_get(STATS_PATH, self._stats)
+        self.app.router.add_post(RESET_PATH, self._reset)
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        if request.path.startswith("/_bench/"):
+            return await handler(request)
+
+        self.requests[request.path] += 1
+
+        delay = self.config.latency + self._rng.uniform(0, self.config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.config.error_rate and self._rng.random() < self.config.error_rate:
+            self.errors += 1
+            raise web.HTTPServiceUnavailable()
+
+        return await handler(request)
+
+    def _json(self, request: web.Request, value: Any) -> web.Response:
+        body = json.dumps(value).encode()
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+
+        headers = {"ETag": etag}
+        accepted = request.headers.get("Accept-Encoding", "")
+        if self.config.compress and "gzip" in accepted:
+            body = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+
+        self.bytes_sent += len(body)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    def _vehicle_id(self, request: web.Request, name: str = "vehicleId") -> int:
+        try:
+            vehicle_id = int(request.query[name])
+        except (KeyError, ValueError):
+            raise web.HTTPBadRequest() from None
+        if vehicle_id not in self.fleet.vehicles:
+            raise web.HTTPNotFound()
+        return vehicle_id
+
+    async def _vehicles(self, request: web.Request) -> web.Response:
+        return self._json(request, list(self.fleet.vehicles.values()))
+
+    async def _vehicle(self, request: web.Request) -> web.Response:
+        vehicle_id = self._vehicle_id(request, "id")
+        return self._json(request, self.fleet.vehicles[vehicle_id])
+
+    async def _latest_odometer(self, request: web.Request) -> web.Response:
+        readings = self.fleet.odometer[self._vehicle_id(request)]
+        return self._json(request, int(readings[-1]["odometer"]) if readings else 0)
+
+    def _lister(self, kind: str):
+        async def _list(request: web.Request) -> web.Response:
+            records = getattr(self.fleet, kind)[self._vehicle_id(request)]
+            return self._json(request, records)
+
+        return _list
+
+    def _adder(self, kind: str):
+        async def _add(request: web.Request) -> web.Response:
+            vehicle_id = self._vehicle_id(request)
+            try:
+                record = await request.json()
+            except ValueError:
+                raise web.HTTPBadRequest() from None
+            self.fleet.add(kind, vehicle_id, record)
+            return web.json_response({"success": True, "message": "Record Added"})
+
+        return _add
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "requests": dict(self.requests),
+                "total_requests": sum(self.requests.values()),
+                "bytes_sent": self.bytes_sent,
+                "errors": self.errors,
+                "not_modified": self.not_modified,
+            }
+        )
+
+    async def _reset(self, request: web.Request) -> web.Response:
+        self.requests.clear()
+        self.bytes_sent = 0
+        self.errors = 0
+        self.not_modified = 0
+        return web.json_response({"success": True})
+
+
+def _serve(config: FleetConfig, ready: multiprocessing.Queue) -> None:
+    async def _main() -> None:
+        server = FakeLubeLogger(config)
+        runner = web.AppRunner(server.app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        ready.put(port)
+        await asyncio.Event().wait()
+
+    asyncio.run(_main())
+
+
+class FakeServerProcess:
+    """Run FakeLubeLogger in a child process for the duration of a block."""
+
+    def __init__(self, config: FleetConfig):
+        self.config = config
+        self.base_url: str | None = None
+        self._process: multiprocessing.Process | None = None
+
+    def __enter__(self) -> FakeServerProcess:
+        ready: multiprocessing.Queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(self.config, ready), daemon=True
+        )
+        self._process.start()
+        port = ready.get(timeout=60)
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(timeout=10)
+            self._process = None
+
+    def describe(self) -> dict[str, Any]:
+        return asdict(self.config)
@@ -0,0 +1,514 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Iterator
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .api import CircuitOpenError, LubeLoggerApi, ResponseDecodeError
+from .api.parsing import parse_bool, parse_date, parse_float
+from .const import DOMAIN
+from .outbox import WRITE_FUEL, WRITE_ODOMETER, WRITE_SERVICE, is_permanent_failure
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 5
+
+EVENT_IMPORT_PROGRESS = f"{DOMAIN}_import_progress"
+EVENT_IMPORT_FINISHED = f"{DOMAIN}_import_finished"
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_CONCURRENCY = 4
+# Attempts per row before a transient failure pauses the whole import
+WRITE_ATTEMPTS = 3
+# Invalid rows reported per job, to keep events and storage small
+MAX_REPORTED_ERRORS = 20
+
+# Accepted column names, normalised to lower case alphanumerics
+_COLUMNS = {
+    "date": "date",
+    "odometer": "odometer",
+    "mileage": "odometer",
+    "initialodometer": "initialOdometer",
+    "fuelconsumed": "fuelConsumed",
+    "fuel": "fuelConsumed",
+    "gallons": "fuelConsumed",
+    "liters": "fuelConsumed",
+    "litres": "fuelConsumed",
+    "cost": "cost",
+    "price": "cost",
+    "isfilltofull": "isFillToFull",
+    "filltofull": "isFillToFull",
+    "missedfuelup": "missedFuelUp",
+    "description": "description",
+    "notes": "notes",
+}
+
+
+def _normalise(row: dict[str, Any]) -> dict[str, Any]:
+    normalised = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        name = _COLUMNS.get("".join(c for c in str(key).lower() if c.isalnum()))
+        if name is not None and value not in (None, ""):
+            normalised[name] = value
+    return normalised
+
+
+def validate_row(
+    kind: str, row: dict[str, Any], day_first: bool = False
+) -> dict[str, Any]:
+    """Turn one input row into a LubeLogger payload; raises ValueError."""
+    row = _normalise(row)
+
+    day = parse_date(row.get("date"), day_first)
+    if day is None:
+        raise ValueError(f"invalid date {row.get('date')!r}")
+
+    odometer = parse_float(row.get("odometer"))
+    if odometer is None or odometer < 0:
+        raise ValueError(f"invalid odometer {row.get('odometer')!r}")
+
+    payload: dict[str, Any] = {"date": day.isoformat(), "odometer": odometer}
+
+    if kind == WRITE_ODOMETER:
+        return payload
+
+    cost = parse_float(row.get("cost", 0))
+    if cost is None or cost < 0:
+        raise ValueError(f"invalid cost {row.get('cost')!r}")
+    payload["cost"] = cost
+    if row.get("notes"):
+        payload["notes"] = str(row["notes"])
+
+    if kind == WRITE_FUEL:
+        fuel = parse_float(row.get("fuelConsumed"))
+        if fuel is None or fuel <= 0:
+            raise ValueError(f"invalid fuel amount {row.get('fuelConsumed')!r}")
+        payload["fuelConsumed"] = fuel
+        payload["isFillToFull"] = parse_bool(row.get("isFillToFull", True))
+        payload["missedFuelUp"] = parse_bool(row.get("missedFuelUp", False))
+        return payload
+
+    description = str(row.get("description", "")).strip()
+    if not description:
+        raise ValueError("missing description")
+    payload["description"] = description
+    return payload
+
+
+class _RowReader:
+    """Blocking, resumable reader for CSV and JSON-lines files.
+
+    Only ever holds one batch of rows in memory. All methods do file I/O
+    and must run in the executor.
+    """
+
+    def __init__(self, path: str, file_format: str, skip: int):
+        self._path = path
+        self._format = file_format
+        self._skip = skip
+        self._file = None
+        self._rows: Iterator[dict[str, Any] | ValueError] | None = None
+        self.row = 0
+
+    def open(self) -> None:
+        self._file = open(self._path, newline="", encoding="utf-8-sig")
+        if self._format == FORMAT_CSV:
+            self._rows = iter(csv.DictReader(self._file))
+        else:
+            self._rows = self._json_lines()
+
+        for _ in range(self._skip):
+            if next(self._rows, None) is None:
+                break
+            self.row += 1
+
+    def _json_lines(self) -> Iterator[dict[str, Any] | ValueError]:
+        for line in self._file:
+            if not line.strip():
+                continue
+            try:
+                value = json.loads(line)
+            except ValueError as err:
+                yield ValueError(f"invalid JSON: {err}")
+                continue
+            yield value if isinstance(value, dict) else ValueError("not an object")
+
+    def read(self, count: int) -> list[tuple[int, dict[str, Any] | ValueError]]:
+        batch = []
+        for raw in self._rows:
+            self.row += 1
+            batch.append((self.row, raw))
+            if len(batch) >= count:
+                break
+        return batch
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ImportFileError(Exception):
+    """The import file cannot be used; resuming will not help."""
+
+
+def _signature(path: str) -> tuple[int, float]:
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime
+
+
+def detect_format(path: str) -> str:
+    return FORMAT_JSONL if path.lower().endswith((".jsonl", ".ndjson")) else FORMAT_CSV
+
+
+@dataclass
+class ImportJob:
+    """Progress of one file import, persisted so it can resume."""
+
+    vehicle_id: int
+    kind: str
+    path: str
+    format: str
+    size: int
+    mtime: float
+    # Every row up to and including this one has been handled
+    committed_row: int = 0
+    # Rows after committed_row that were handled out of order
+    done_rows: list[int] = field(default_factory=list)
+    sent: int = 0
+    # Sent rows whose success response could not be read
+    unconfirmed: int = 0
+    invalid: int = 0
+    failed: int = 0
+    started: float = field(default_factory=time.time)
+    finished: float | None = None
+    status: str = "pending"
+    last_error: str | None = None
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def id(self) -> str:
+        key = f"{self.vehicle_id}:{self.kind}:{os.path.abspath(self.path)}"
+        return hashlib.blake2b(key.encode(), digest_size=6).hexdigest()
+
+
+class BulkImporter:
+    """Stream history files into LubeLogger for one config entry.
+
+    Rows are read in batches in the executor, validated, and posted with
+    bounded concurrency. Every handled row is recorded, so an interrupted
+    or paused import resumes without posting a row twice (only a request
+    cut off mid-flight may have reached the server). Unreadable or
+    changed files fail a job; server errors and timeouts pause it until
+    the import is started again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        api: LubeLoggerApi | None,
+        on_written: Callable[[list[int]], Any] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        self._hass = hass
+        self._entry_id = entry_id
+        self._api = api
+        self._on_written = on_written
+        self._batch_size = batch_size
+        self._max_concurrency = max_concurrency
+
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.imports"
+        )
+        self._jobs: dict[str, ImportJob] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    async def async_load(self) -> None:
+        """Load saved jobs and resume the ones a shutdown interrupted."""
+        stored = await self._store.async_load() or {}
+
+        for raw in stored.get("jobs", []):
+            job = ImportJob(**raw)
+            self._jobs[job.id] = job
+
+        for job in list(self._jobs.values()):
+            # Paused jobs wait for the import to be started again
+            if job.finished is None and job.status != "paused":
+                _LOGGER.info(
+                    "LubeLogger: Resuming import of %s from row %s",
+                    job.path,
+                    job.committed_row + 1,
+                )
+                self._start(job)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    async def async_start(
+        self, vehicle_id: int, kind: str, path: str, file_format: str | None = None
+    ) -> ImportJob:
+        """Start importing a file, or resume it if it was interrupted."""
+        size, mtime = await self._hass.async_add_executor_job(_signature, path)
+        job = ImportJob(
+            vehicle_id=vehicle_id,
+            kind=kind,
+            path=path,
+            format=file_format or detect_format(path),
+            size=size,
+            mtime=mtime,
+        )
+
+        existing = self._jobs.get(job.id)
+        if existing is not None and existing.id in self._tasks:
+            return existing
+
+        if existing is not None and (existing.size, existing.mtime) == (size, mtime):
+            if existing.status == "finished":
+                # Importing the same file again would duplicate its records
+                _LOGGER.info("LubeLogger: %s was already imported", path)
+                return existing
+            # Pick up after the rows already handled
+            job = existing
+            job.finished = None
+            job.last_error = None
+
+        self._jobs[job.id] = job
+        self._start(job)
+        return job
+
+    async def async_shutdown(self) -> None:
+        """Stop running imports; they resume on the next start."""
+        for task in list(self._tasks.values()):
+            task.cancel()
+        for task in list(self._tasks.values()):
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _start(self, job: ImportJob) -> None:
+        job.status = "running"
+        self._tasks[job.id] = self._hass.async_create_background_task(
+            self._async_run(job), f"{DOMAIN} import {os.path.basename(job.path)}"
+        )
+
+    async def _async_run(self, job: ImportJob) -> None:
+        reader = _RowReader(job.path, job.format, job.committed_row)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        done = set(job.done_rows)
+        stop = asyncio.Event()
+        start = time.monotonic()
+        start_row = job.committed_row
+
+        async def _post(row: int, raw: Any) -> None:
+            async with semaphore:
+                if row in done or stop.is_set():
+                    return
+                try:
+                    await self._async_post(job, row, raw)
+                except BaseException:
+                    # Rows not yet sent wait for the import to resume
+                    stop.set()
+                    raise
+                done.add(row)
+
+        try:
+            if job.kind not in (WRITE_ODOMETER, WRITE_FUEL, WRITE_SERVICE):
+                raise ValueError(f"Unknown record type {job.kind}")
+
+            try:
+                size, mtime = await self._hass.async_add_executor_job(
+                    _signature, job.path
+                )
+                if (size, mtime) != (job.size, job.mtime):
+                    raise ImportFileError("file changed since the import started")
+                await self._hass.async_add_executor_job(reader.open)
+            except (OSError, csv.Error, UnicodeError) as err:
+                raise ImportFileError(str(err)) from err
+
+            while True:
+                try:
+                    batch = await self._hass.async_add_executor_job(
+                        reader.read, self._batch_size
+                    )
+                except (OSError, csv.Error, UnicodeError) as err:
+                    raise ImportFileError(str(err)) from err
+                if not batch:
+                    break
+
+                try:
+                    results = await asyncio.gather(
+                        *(_post(row, raw) for row, raw in batch),
+                        return_exceptions=True,
+                    )
+                finally:
+                    self._commit(job, done)
+                    self._save()
+
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+
+                self._fire_progress(job, start, start_row)
+
+            job.status = "finished"
+            job.finished = time.time()
+
+        except asyncio.CancelledError:
+            job.status = "interrupted"
+            raise
+
+        except Exception as err:
+            job.last_error = str(err) or type(err).__name__
+            if isinstance(err, ImportFileError):
+                job.status = "failed"
+                job.finished = time.time()
+            else:
+                # LubeLogger unreachable or erroring; resumes when the
+                # import is started again
+                job.status = "paused"
+            _LOGGER.warning(
+                "LubeLogger: Import of %s %s at row %s: %s",
+                job.path,
+                job.status,
+                job.committed_row + 1,
+                job.last_error,
+            )
+
+        finally:
+            await self._hass.async_add_executor_job(reader.close)
+            self._tasks.pop(job.id, None)
+            self._save()
+
+        self._hass.bus.async_fire(EVENT_IMPORT_FINISHED, self._event_data(job))
+
+        if job.sent and self._on_written is not None:
+            result = self._on_written([job.vehicle_id])
+            if asyncio.iscoroutine(result):
+                await result
+
+    @staticmethod
+    def _commit(job: ImportJob, done: set[int]) -> None:
+        """Advance committed_row over the rows handled so far."""
+        row = job.committed_row
+        while row + 1 in done:
+            row += 1
+            done.discard(row)
+        job.committed_row = row
+        job.done_rows = sorted(done)
+
+    async def _async_post(self, job: ImportJob, row: int, raw: Any) -> None:
+        """Validate and send one row; raise to pause the import."""
+        try:
+            if isinstance(raw, ValueError):
+                raise raw
+            payload = validate_row(job.kind, raw, self._api.day_first)
+        except ValueError as err:
+            job.invalid += 1
+            if len(job.errors) < MAX_REPORTED_ERRORS:
+                job.errors.append(f"row {row}: {err}")
+            return
+
+        for attempt in range(1, WRITE_ATTEMPTS + 1):
+            try:
+                await self._write(job, payload)
+            except (asyncio.CancelledError, CircuitOpenError):
+                raise
+            except ResponseDecodeError as err:
+                # Accepted by LubeLogger; resending could duplicate the row
+                _LOGGER.warning(
+                    "LubeLogger: Row %s of %s was accepted but its response "
+                    "could not be read: %s",
+                    row,
+                    job.path,
+                    err,
+                )
+                job.sent += 1
+                job.unconfirmed += 1
+                return
+            except Exception as err:
+                if is_permanent_failure(err):
+                    job.failed += 1
+                    job.last_error = f"row {row}: {err}"
+                    return
+                if attempt == WRITE_ATTEMPTS:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+            else:
+                job.sent += 1
+                return
+
+    async def _write(self, job: ImportJob, payload: dict[str, Any]) -> None:
+        if job.kind == WRITE_ODOMETER:
+            await self._api.odometer.add(
+                job.vehicle_id, payload["odometer"], payload["date"]
+            )
+        elif job.kind == WRITE_FUEL:
+            await self._api.fuel.add(job.vehicle_id, payload)
+        elif job.kind == WRITE_SERVICE:
+            await self._api.service_records.add(job.vehicle_id, payload)
+        else:
+            raise ValueError(f"Unknown record type {job.kind}")
+
+    def _event_data(self, job: ImportJob) -> dict[str, Any]:
+        return {
+            "entry_id": self._entry_id,
+            "job_id": job.id,
+            "vehicle_id": job.vehicle_id,
+            "record_type": job.kind,
+            "path": job.path,
+            "status": job.status,
+            "row": job.committed_row,
+            "sent": job.sent,
+            "unconfirmed": job.unconfirmed,
+            "invalid": job.invalid,
+            "failed": job.failed,
+            "errors": job.errors,
+            "last_error": job.last_error,
+        }
+
+    @callback
+    def _fire_progress(self, job: ImportJob, start: float, start_row: int) -> None:
+        elapsed = time.monotonic() - start
+        data = self._event_data(job)
+        data["rows_per_second"] = (
+            round((job.committed_row - start_row) / elapsed, 1) if elapsed else None
+        )
+        self._hass.bus.async_fire(EVENT_IMPORT_PROGRESS, data)
+
+    @callback
+    def _save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"jobs": [asdict(job) for job in self._jobs.values()]}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return import jobs for diagnostics."""
+        return {
+            job_id: {
+                key: value
+                for key, value in asdict(job).items()
+                if key != "errors"
+            }
+            for job_id, job in self._jobs.items()
+        }
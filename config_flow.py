@@ -5,7 +5,7 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
@@ -13,7 +13,51 @@ from .const import (
     CONF_BASE_URL,
     CONF_USERNAME,
     CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_MAX_CONCURRENCY,
+    CONF_REQUEST_TIMEOUT,
+    CONF_RESPONSE_CACHE,
+    CONF_DAY_FIRST,
+    CONF_SERVICE_INTERVAL_DISTANCE,
+    CONF_SERVICE_INTERVAL_DAYS,
+    CONF_PUSH_UPDATES,
+    CONF_READ_RATE_LIMIT,
+    CONF_READ_BURST,
+    CONF_WRITE_RATE_LIMIT,
+    CONF_WRITE_BURST,
     DEFAULT_BASE_URL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_RESPONSE_CACHE,
+    DEFAULT_DAY_FIRST,
+    DEFAULT_SERVICE_INTERVAL_DISTANCE,
+    DEFAULT_SERVICE_INTERVAL_DAYS,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_READ_RATE_LIMIT,
+    DEFAULT_READ_BURST,
+    DEFAULT_WRITE_RATE_LIMIT,
+    DEFAULT_WRITE_BURST,
+)
+
+_POSITIVE = vol.All(int, vol.Range(min=1))
+# A rate of 0 turns limiting off
+_RATE = vol.All(vol.Coerce(float), vol.Range(min=0))
+
+# Option, default and validator, in the order the form shows them
+OPTIONS = (
+    (CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, vol.All(int, vol.Range(min=30))),
+    (CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES, bool),
+    (CONF_RESPONSE_CACHE, DEFAULT_RESPONSE_CACHE, bool),
+    (CONF_DAY_FIRST, DEFAULT_DAY_FIRST, bool),
+    (CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY, vol.All(int, vol.Range(1, 32))),
+    (CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT, vol.All(int, vol.Range(5, 300))),
+    (CONF_SERVICE_INTERVAL_DISTANCE, DEFAULT_SERVICE_INTERVAL_DISTANCE, _POSITIVE),
+    (CONF_SERVICE_INTERVAL_DAYS, DEFAULT_SERVICE_INTERVAL_DAYS, _POSITIVE),
+    (CONF_READ_RATE_LIMIT, DEFAULT_READ_RATE_LIMIT, _RATE),
+    (CONF_READ_BURST, DEFAULT_READ_BURST, _POSITIVE),
+    (CONF_WRITE_RATE_LIMIT, DEFAULT_WRITE_RATE_LIMIT, _RATE),
+    (CONF_WRITE_BURST, DEFAULT_WRITE_BURST, _POSITIVE),
 )
 
 
@@ -22,6 +66,13 @@ class LubeLoggerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        return LubeLoggerOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -60,3 +111,29 @@ class LubeLoggerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_import(self, user_input: dict[str, Any]) -> FlowResult:
         """Handle YAML import."""
         return await self.async_step_user(user_input)
+
+
+class LubeLoggerOptionsFlow(config_entries.OptionsFlow):
+    """Options for polling, push updates, caching and rate limits."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry):
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        if user_input is not None:
+            # Keep options this form does not show, such as units
+            return self.async_create_entry(
+                title="", data={**self._entry.options, **user_input}
+            )
+
+        options = self._entry.options
+        data_schema = vol.Schema(
+            {
+                vol.Optional(key, default=options.get(key, default)): validator
+                for key, default, validator in OPTIONS
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=data_schema)
@@ -7,3 +7,49 @@ CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 
 DEFAULT_BASE_URL = "http://lubelogger:8080"
+
+CONF_SCAN_INTERVAL = "scan_interval"
+
+# Seconds between fleet-wide refreshes
+DEFAULT_SCAN_INTERVAL = 300
+
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_REQUEST_TIMEOUT = "request_timeout"
+
+# Vehicles fetched at once, and seconds before a single request (or a
+# single streamed read) is abandoned; failed reads are retried on top
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_REQUEST_TIMEOUT = 20
+
+CONF_RESPONSE_CACHE = "response_cache"
+
+DEFAULT_RESPONSE_CACHE = False
+
+# Whether LubeLogger (and import files) write slashed dates as dd/MM/yyyy
+CONF_DAY_FIRST = "day_first"
+
+DEFAULT_DAY_FIRST = False
+
+CONF_SERVICE_INTERVAL_DISTANCE = "service_interval_distance"
+CONF_SERVICE_INTERVAL_DAYS = "service_interval_days"
+
+DEFAULT_SERVICE_INTERVAL_DISTANCE = 10000
+DEFAULT_SERVICE_INTERVAL_DAYS = 365
+
+CONF_PUSH_UPDATES = "push_updates"
+CONF_WEBHOOK_ID = "webhook_id"
+
+DEFAULT_PUSH_UPDATES = False
+# With push updates, polling only reconciles changes a notification missed
+PUSH_RECONCILE_INTERVAL = 60 * 60
+
+# Requests per second and burst size, shared by all entries on a host
+CONF_READ_RATE_LIMIT = "read_rate_limit"
+CONF_READ_BURST = "read_burst"
+CONF_WRITE_RATE_LIMIT = "write_rate_limit"
+CONF_WRITE_BURST = "write_burst"
+
+DEFAULT_READ_RATE_LIMIT = 20
+DEFAULT_READ_BURST = 40
+DEFAULT_WRITE_RATE_LIMIT = 5
+DEFAULT_WRITE_BURST = 10
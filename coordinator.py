@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field, replace
+from datetime import date, timedelta
+from typing import Any, Iterable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .analytics import (
+    CostAggregates,
+    CostStats,
+    FuelAnalytics,
+    FuelStats,
+    OdometerTrend,
+    ServiceForecast,
+    predict_service,
+)
+
+from .api import LubeLoggerApi, FleetFetchScheduler, bypass_cache, span
+from .api.models import Vehicle
+from .const import (
+    DOMAIN,
+    CONF_SCAN_INTERVAL,
+    CONF_PUSH_UPDATES,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_MAX_CONCURRENCY,
+    CONF_SERVICE_INTERVAL_DISTANCE,
+    CONF_SERVICE_INTERVAL_DAYS,
+    DEFAULT_SERVICE_INTERVAL_DISTANCE,
+    DEFAULT_SERVICE_INTERVAL_DAYS,
+    PUSH_RECONCILE_INTERVAL,
+)
+from .backfill import HistoryBackfill
+from .polling import VehiclePollPlanner
+from .snapshot import VehicleSnapshotStore
+from .sync import (
+    RecordSyncEngine,
+    SyncDelta,
+    RECORD_FUEL,
+    RECORD_SERVICE,
+    RECORD_ODOMETER,
+    RECORD_KINDS,
+    RECENT_WINDOW_DAYS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class VehicleData:
+    """Latest known data for a single vehicle."""
+
+    vehicle: Vehicle
+    odometer: float | None = None
+    # Record changes picked up by the most recent refresh, by record kind
+    deltas: dict[str, SyncDelta] = field(default_factory=dict)
+    fuel_stats: FuelStats | None = None
+    service_forecast: ServiceForecast | None = None
+    cost_stats: CostStats | None = None
+
+
+class LubeLoggerDataUpdateCoordinator(DataUpdateCoordinator[dict[int, VehicleData]]):
+    """Fetch the whole fleet from LubeLogger in one scheduled pass."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, api: LubeLoggerApi):
+        self.entry = entry
+        self.api = api
+        self.sync = RecordSyncEngine(hass, entry.entry_id, api.day_first)
+        self.snapshot = VehicleSnapshotStore(hass, entry.entry_id)
+        # True while data comes from the snapshot and no refresh has succeeded
+        self.restored = False
+        self._fuel_analytics: dict[int, FuelAnalytics] = {}
+        self._trends: dict[int, OdometerTrend] = {}
+        self._costs: dict[int, CostAggregates] = {}
+        # Refreshes and pushed updates must not sync the same listing at once
+        self._fetch_lock = asyncio.Lock()
+        # Vehicles whose next fetch reads full listings instead of the window
+        self._full_sync: set[int] = set()
+        self._clients = {
+            RECORD_FUEL: api.fuel,
+            RECORD_SERVICE: api.service_records,
+            RECORD_ODOMETER: api.odometer,
+        }
+        self.backfill = HistoryBackfill(
+            hass,
+            entry,
+            api,
+            self.sync,
+            self._fetch_lock,
+            on_finished=self.async_request_vehicle_refresh,
+        )
+
+        interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        if entry.options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES):
+            # Changes arrive through the webhook; polls only reconcile
+            interval = max(interval, PUSH_RECONCILE_INTERVAL)
+            self.polling = VehiclePollPlanner(
+                base_interval=interval, fast_interval=interval
+            )
+        else:
+            self.polling = VehiclePollPlanner(base_interval=interval)
+
+        self.scheduler = FleetFetchScheduler(
+            max_concurrency=entry.options.get(
+                CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+            ),
+        )
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{entry.entry_id}",
+            update_interval=timedelta(seconds=interval),
+        )
+
+    async def async_restore_snapshot(self) -> bool:
+        """Seed the coordinator with the fleet data saved by the last run."""
+        vehicles = await self.snapshot.async_load()
+        if not vehicles:
+            return False
+
+        self.restored = True
+        self.async_set_updated_data(
+            {raw["vehicle"].id: VehicleData(**raw) for raw in vehicles}
+        )
+        _LOGGER.debug(
+            "LubeLogger: Restored %s vehicles from snapshot", len(vehicles)
+        )
+        return True
+
+    async def async_refresh_vehicles(
+        self, vehicle_ids: list[int] | None = None, full_history: bool = False
+    ) -> None:
+        """Fetch the given vehicles (or the whole fleet) right now.
+
+        full_history re-reads complete listings, picking up edits to
+        records older than the regular refresh window. Fresh cached
+        responses are skipped, so the result reflects LubeLogger now.
+        """
+        if full_history:
+            self._full_sync.update(
+                vehicle_ids if vehicle_ids is not None else (self.data or {})
+            )
+        self.polling.force(vehicle_ids)
+        with bypass_cache():
+            await self.async_refresh()
+
+    async def async_request_vehicle_refresh(
+        self, vehicle_ids: list[int] | None = None
+    ) -> None:
+        """Fetch the given vehicles on the next, debounced refresh."""
+        self.polling.force(vehicle_ids)
+        await self.async_request_refresh()
+
+    async def _async_update_data(self) -> dict[int, VehicleData]:
+        """Fetch the vehicle list and per-vehicle data."""
+        with span("coordinator.refresh"):
+            return await self._async_refresh_fleet()
+
+    async def _async_refresh_fleet(self) -> dict[int, VehicleData]:
+        try:
+            vehicles = await self.api.vehicles.vehicles_list()
+        except Exception as err:
+            raise UpdateFailed(f"Error fetching vehicles: {err}") from err
+
+        async with self._fetch_lock:
+            # Read under the lock so a pushed update that just landed is kept
+            previous = self.data or {}
+            data: dict[int, VehicleData] = {}
+
+            for vehicle in vehicles or []:
+                vehicle_id = vehicle.id
+                old = previous.get(vehicle_id)
+                data[vehicle_id] = VehicleData(
+                    vehicle=vehicle,
+                    odometer=old.odometer if old else None,
+                )
+
+            if self.sync.needs_full_sync:
+                # The date order changed; re-read every stored record
+                self._full_sync.update(data)
+                self.sync.needs_full_sync = False
+
+            # Only vehicles whose poll interval has elapsed are fetched; the
+            # rest keep their previous values until their turn comes
+            due = self.polling.due(
+                vehicle_data.vehicle for vehicle_data in data.values()
+            )
+            with span("coordinator.fetch"):
+                await self._async_fetch(data, due)
+            self.sync.prune(data)
+            self.backfill.prune(data)
+
+        self.polling.prune(data)
+        self.update_interval = timedelta(seconds=self.polling.next_refresh())
+
+        with span("coordinator.analytics"):
+            self._update_derived(data, data)
+
+        for cache in (self._fuel_analytics, self._trends, self._costs):
+            for vehicle_id in [vid for vid in cache if vid not in data]:
+                del cache[vehicle_id]
+
+        self.restored = False
+        self.snapshot.save(data)
+        return data
+
+    async def async_push_update(self, vehicle_ids: set[int]) -> None:
+        """Fetch just the given vehicles after LubeLogger reported a change.
+
+        Unlike a refresh this skips the vehicle list and leaves every other
+        vehicle untouched. Vehicles not known yet need the vehicle list, so
+        they fall back to a regular refresh.
+        """
+        if self.restored or not self.data or not vehicle_ids <= self.data.keys():
+            await self.async_request_vehicle_refresh(list(vehicle_ids))
+            return
+
+        async with self._fetch_lock:
+            # Copies without deltas, so listeners only see this update's changes
+            data = {
+                vehicle_id: replace(vehicle_data, deltas={})
+                for vehicle_id, vehicle_data in self.data.items()
+            }
+            failed = await self._async_fetch(data, vehicle_ids)
+            if failed:
+                # Retried by the next refresh
+                self.polling.force(failed)
+
+            self._update_derived(data, vehicle_ids)
+            self.snapshot.save(data)
+            self.async_set_updated_data(data)
+
+    async def _async_fetch(
+        self, data: dict[int, VehicleData], vehicle_ids: set[int]
+    ) -> set[int]:
+        """Fetch odometers and record listings into data; returns failed ids."""
+        changed: set[int] = set()
+
+        # Vehicles that fail keep their previous value for this cycle
+        odometers = await self.scheduler.gather(
+            [vid for vid in data if vid in vehicle_ids],
+            self.api.odometer.get_latest_odometer,
+        )
+
+        for vehicle_id, value in odometers.results.items():
+            odometer = _to_float(value)
+            if odometer != data[vehicle_id].odometer:
+                changed.add(vehicle_id)
+            data[vehicle_id].odometer = odometer
+
+        if odometers.errors:
+            _LOGGER.warning(
+                "LubeLogger: Failed to fetch odometer for %s of %s vehicles: %s",
+                len(odometers.errors),
+                len(vehicle_ids),
+                {vid: repr(err) for vid, err in odometers.errors.items()},
+            )
+
+        listings = await self.scheduler.gather(
+            [(vid, kind) for vid in data if vid in vehicle_ids for kind in RECORD_KINDS],
+            self._sync_records,
+        )
+
+        for (vehicle_id, kind), delta in listings.results.items():
+            data[vehicle_id].deltas[kind] = delta
+            if delta:
+                changed.add(vehicle_id)
+
+        if listings.errors:
+            _LOGGER.warning(
+                "LubeLogger: Failed to sync %s of %s record listings: %s",
+                len(listings.errors),
+                len(vehicle_ids) * len(RECORD_KINDS),
+                {key: repr(err) for key, err in listings.errors.items()},
+            )
+
+        failed = set(odometers.errors) | {vid for vid, _ in listings.errors}
+        self._full_sync -= vehicle_ids - failed
+        for vehicle_id in vehicle_ids - failed:
+            if vehicle_id not in data:
+                continue
+            # Failed vehicles are not observed, so they stay due
+            self.polling.observe(
+                vehicle_id,
+                vehicle_id in changed,
+                sold=data[vehicle_id].vehicle.sold,
+            )
+
+        return failed
+
+    def _update_derived(
+        self, data: dict[int, VehicleData], vehicle_ids: Iterable[int]
+    ) -> None:
+        """Recompute fuel, service and cost figures for the given vehicles."""
+        options = self.entry.options
+        interval_distance = options.get(
+            CONF_SERVICE_INTERVAL_DISTANCE, DEFAULT_SERVICE_INTERVAL_DISTANCE
+        )
+        interval_days = options.get(
+            CONF_SERVICE_INTERVAL_DAYS, DEFAULT_SERVICE_INTERVAL_DAYS
+        )
+
+        today = dt_util.now().date()
+        for vehicle_id in vehicle_ids:
+            vehicle_data = data[vehicle_id]
+            # Extends history only as far back as some consumer needs it
+            self.backfill.request(vehicle_data.vehicle)
+
+            engine = self._update_fuel_analytics(
+                vehicle_id, vehicle_data.deltas.get(RECORD_FUEL)
+            )
+            vehicle_data.fuel_stats = engine.stats(today)
+
+            trend = self._update_trend(
+                vehicle_id, vehicle_data.deltas.get(RECORD_ODOMETER)
+            )
+            vehicle_data.service_forecast = predict_service(
+                trend,
+                self.sync.index(vehicle_id, RECORD_SERVICE).latest(),
+                vehicle_data.odometer,
+                today,
+                interval_distance,
+                interval_days,
+            )
+
+            costs = self._update_costs(vehicle_id, vehicle_data.deltas)
+            vehicle_data.cost_stats = costs.stats(today, vehicle_data.odometer)
+
+    def _update_fuel_analytics(
+        self, vehicle_id: int, delta: SyncDelta | None
+    ) -> FuelAnalytics:
+        """Bring a vehicle's fuel analytics up to date with its synced records."""
+        engine = self._fuel_analytics.get(vehicle_id)
+
+        if engine is None or (delta and not delta.append_only):
+            engine = engine or FuelAnalytics()
+            engine.rebuild(self.sync.records(vehicle_id, RECORD_FUEL))
+            self._fuel_analytics[vehicle_id] = engine
+        elif delta:
+            # Only newer fill-ups arrived; append them to the columns
+            engine.extend(
+                sorted(delta.added, key=lambda r: r.date or date.min)
+            )
+
+        return engine
+
+    def _update_trend(self, vehicle_id: int, delta: SyncDelta | None) -> OdometerTrend:
+        """Feed new odometer readings into a vehicle's distance trend."""
+        trend = self._trends.get(vehicle_id)
+
+        if trend is None or (delta and not delta.append_only):
+            trend = OdometerTrend()
+            trend.extend(self.sync.records(vehicle_id, RECORD_ODOMETER))
+            self._trends[vehicle_id] = trend
+        elif delta:
+            trend.extend(
+                sorted(delta.added, key=lambda r: r.date or date.min)
+            )
+
+        return trend
+
+    def _update_costs(
+        self, vehicle_id: int, deltas: dict[str, SyncDelta]
+    ) -> CostAggregates:
+        """Fold a vehicle's new fuel and service records into its cost totals."""
+        costs = self._costs.get(vehicle_id)
+        changes = [
+            deltas[kind] for kind in (RECORD_FUEL, RECORD_SERVICE) if deltas.get(kind)
+        ]
+
+        if costs is not None and not any(delta.rebuild for delta in changes):
+            for delta in changes:
+                costs.apply(
+                    added=[*delta.added, *(new for _, new in delta.changed)],
+                    removed=[*delta.removed, *(old for old, _ in delta.changed)],
+                )
+            if not costs.stale:
+                return costs
+
+        costs = CostAggregates()
+        costs.rebuild(
+            self.sync.records(vehicle_id, RECORD_FUEL),
+            self.sync.records(vehicle_id, RECORD_SERVICE),
+        )
+        self._costs[vehicle_id] = costs
+        return costs
+
+    async def _sync_records(self, key: tuple[int, str]) -> SyncDelta:
+        """Stream one record listing straight into the sync engine."""
+        vehicle_id, kind = key
+        client = self._clients[kind]
+        start = None
+        if vehicle_id not in self._full_sync:
+            # Older history is only fetched by the backfill, on demand
+            start = dt_util.now().date() - timedelta(days=RECENT_WINDOW_DAYS)
+
+        return await self.sync.async_apply_stream(
+            vehicle_id, kind, client.iter_window(vehicle_id, start), start
+        )
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 
-from .const import DOMAIN
+from .api import PRIORITY_INTERACTIVE, request_priority
+from .const import DOMAIN, CONF_PASSWORD, CONF_WEBHOOK_ID
+from .profiling import last_profile
+
+# The webhook id is a secret: anyone who knows it can trigger fetches
+TO_REDACT = {CONF_PASSWORD, CONF_WEBHOOK_ID}
 
 
 async def async_get_config_entry_diagnostics(
@@ -11,25 +17,49 @@ async def async_get_config_entry_diagnostics(
 ):
     """Return diagnostics for a config entry."""
 
-    api = hass.data[DOMAIN][entry.entry_id]
+    data = hass.data[DOMAIN][entry.entry_id]
+    api = data.api
 
     diagnostics = {
         "config_entry": {
             "title": entry.title,
-            "data": entry.data,
-            "options": entry.options,
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
         },
         "api": {
             "base_url": entry.data.get("base_url"),
             "auth_mode": "basic" if entry.data.get("username") else "none",
             "last_error": getattr(api.vehicles, "_last_error", None),
+            "cache": api.cache.as_dict() if api.cache else None,
+            "circuit_breaker": api.breaker.as_dict(),
+            "metrics": api.metrics.as_dict(),
+            "rate_limiter": api.rate_limiter.as_dict(),
+            "server_windows": {
+                "fuel": api.fuel.server_windows,
+                "service": api.service_records.server_windows,
+                "odometer": api.odometer.server_windows,
+            },
+        },
+        "coordinator": {
+            "last_update_success": data.coordinator.last_update_success,
+            "update_interval": str(data.coordinator.update_interval),
+            "vehicle_count": len(data.coordinator.data or {}),
+            "restored_from_snapshot": data.coordinator.restored,
+            "polling": data.coordinator.polling.as_dict(),
+            "backfill": data.coordinator.backfill.as_dict(),
         },
+        "outbox": data.outbox.as_dict(),
+        "imports": data.importer.as_dict(),
+        "statistics": data.statistics.as_dict(),
+        "push": data.push.as_dict() if data.push else None,
+        "profile": last_profile(hass),
         "vehicles": [],
     }
 
     try:
-        vehicles = await api.vehicles.vehicles_list()
-        diagnostics["vehicles"] = vehicles
+        with request_priority(PRIORITY_INTERACTIVE):
+            vehicles = await api.vehicles.vehicles_list()
+        diagnostics["vehicles"] = [vehicle.as_dict() for vehicle in vehicles]
     except Exception as err:
         diagnostics["vehicles_error"] = str(err)
 
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api.models import HistoryRecord
+from .backfill import full_history
+from .const import DOMAIN
+from .sensors.utils import build_vehicle_name
+from .sync import RECORD_FUEL, RECORD_ODOMETER, SyncDelta
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant before 2025.6
+    StatisticMeanType = None
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+# Daily rows handed to the recorder per call
+BATCH_SIZE = 500
+
+STAT_ODOMETER = "odometer"
+STAT_FUEL = "fuel_consumed"
+STAT_FUEL_COST = "fuel_cost"
+
+STATISTICS_BY_KIND = {
+    RECORD_ODOMETER: (STAT_ODOMETER,),
+    RECORD_FUEL: (STAT_FUEL, STAT_FUEL_COST),
+}
+
+# Backfill everything from the first day
+FULL = 0
+
+
+# Statistic ids written before they were scoped to the config entry
+_LEGACY_STATISTIC_ID = re.compile(rf"^{DOMAIN}:vehicle_(\d+)_(\w+)$")
+
+
+def statistic_id(entry_id: str, vehicle_id: int, stat: str) -> str:
+    """Statistic id of one vehicle; vehicle ids are only unique per server."""
+    return f"{DOMAIN}:{entry_id.lower()}_vehicle_{vehicle_id}_{stat}"
+
+
+@dataclass
+class _Pending:
+    """Work queued for one vehicle and record kind."""
+
+    # Re-emit days from this ordinal on; FULL for the whole history
+    from_day: int
+    # Days that may have lost every record, leaving stale rows behind
+    vacated: set[int]
+
+
+def _ordinal(record: HistoryRecord) -> int | None:
+    return record.date.toordinal() if record.date else None
+
+
+def _row_start(day: int) -> datetime:
+    """Start of a day's row: local midnight, moved up to a whole UTC hour.
+
+    The recorder only takes statistics that start on the hour, which local
+    midnight is not in zones with a half-hour offset. Rounding up keeps the
+    row inside its own local day.
+    """
+    start = dt_util.as_utc(dt_util.start_of_local_day(date.fromordinal(day)))
+    if start.minute or start.second or start.microsecond:
+        start = start.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    return start
+
+
+def daily_odometer(records: Iterable[HistoryRecord]) -> list[tuple[int, float, float]]:
+    """Return (day, state, sum) rows with the highest reading of each day."""
+    days: dict[int, float] = {}
+    for record in records:
+        day = _ordinal(record)
+        if day is None or record.odometer is None:
+            continue
+        days[day] = max(days.get(day, record.odometer), record.odometer)
+
+    # The sum is the reading itself so "change" statistics give distance
+    return [(day, value, value) for day, value in sorted(days.items())]
+
+
+def daily_totals(
+    records: Iterable[HistoryRecord], attr: str
+) -> list[tuple[int, float, float]]:
+    """Return (day, state, running sum) rows of a per-record amount."""
+    days: dict[int, float] = {}
+    for record in records:
+        day = _ordinal(record)
+        if day is None:
+            continue
+        days[day] = days.get(day, 0.0) + (getattr(record, attr) or 0.0)
+
+    rows = []
+    total = 0.0
+    for day, amount in sorted(days.items()):
+        total += amount
+        rows.append((day, amount, round(total, 3)))
+    return rows
+
+
+class HistoryStatistics:
+    """Backfill synced odometer and fuel history into long-term statistics.
+
+    Each vehicle gets external statistics for its odometer, fuel consumed
+    and fuel cost, one row per day with records. A high-water mark per
+    statistic means a refresh that only appended records writes just the
+    new days. Corrections to older records re-emit from the earliest
+    affected day; if a day lost all of its records the statistic is
+    cleared and rebuilt, since the recorder cannot delete single rows.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: Any):
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.statistics"
+        )
+        self._high_water: dict[str, int] = {}
+        self._pending: dict[tuple[int, str], _Pending] = {}
+        self._task: asyncio.Task | None = None
+        self.rows_written = 0
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load() or {}
+        self._high_water = dict(stored.get("high_water", {}))
+        self._migrate_legacy_ids()
+
+    def _migrate_legacy_ids(self) -> None:
+        """Move statistics written under unscoped ids to this entry's ids.
+
+        With one config entry the statistics are renamed and keep their
+        history. With several, a legacy statistic may hold rows of more
+        than one server, so it is left alone and this entry's statistics
+        are rebuilt under the new ids.
+        """
+        legacy = {
+            stat_id: match
+            for stat_id in self._high_water
+            if (match := _LEGACY_STATISTIC_ID.match(stat_id))
+        }
+        if not legacy:
+            return
+
+        rename = (
+            "recorder" in self._hass.config.components
+            and len(self._hass.config_entries.async_entries(DOMAIN)) == 1
+        )
+        for old_id, match in legacy.items():
+            high_water = self._high_water.pop(old_id)
+            if not rename:
+                continue
+            new_id = statistic_id(
+                self._entry.entry_id, int(match.group(1)), match.group(2)
+            )
+            get_instance(self._hass).async_update_statistics_metadata(
+                old_id, new_statistic_id=new_id
+            )
+            self._high_water[new_id] = high_water
+
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def _stat_id(self, vehicle_id: int, stat: str) -> str:
+        return statistic_id(self._entry.entry_id, vehicle_id, stat)
+
+    @callback
+    def async_schedule(self) -> None:
+        """Queue the changes picked up by the latest refresh."""
+        if "recorder" not in self._hass.config.components:
+            return
+
+        for vehicle_id, vehicle_data in (self._coordinator.data or {}).items():
+            # Statistics cover each vehicle's whole history
+            self._coordinator.backfill.async_require(
+                vehicle_data.vehicle,
+                "statistics",
+                tuple(STATISTICS_BY_KIND),
+                full_history,
+            )
+            for kind, stats in STATISTICS_BY_KIND.items():
+                stat_ids = [self._stat_id(vehicle_id, stat) for stat in stats]
+                if any(stat_id not in self._high_water for stat_id in stat_ids):
+                    self._queue(vehicle_id, kind, FULL, ())
+                    continue
+
+                delta = vehicle_data.deltas.get(kind)
+                if delta:
+                    self._queue_delta(vehicle_id, kind, delta)
+
+        if self._pending and (self._task is None or self._task.done()):
+            self._task = self._entry.async_create_background_task(
+                self._hass, self._async_process(), f"{DOMAIN} statistics backfill"
+            )
+
+    def _queue_delta(self, vehicle_id: int, kind: str, delta: SyncDelta) -> None:
+        if delta.rebuild:
+            self._queue(vehicle_id, kind, FULL, ())
+            return
+
+        touched = [record for record in delta.added if record.date]
+        vacated: set[int] = set()
+
+        for old, new in delta.changed:
+            touched.extend(r for r in (old, new) if r.date)
+            if old.date and old.date != new.date:
+                vacated.add(old.date.toordinal())
+        for record in delta.removed:
+            if record.date:
+                touched.append(record)
+                vacated.add(record.date.toordinal())
+
+        if touched:
+            from_day = min(record.date.toordinal() for record in touched)
+            self._queue(vehicle_id, kind, from_day, vacated)
+
+    def _queue(
+        self, vehicle_id: int, kind: str, from_day: int, vacated: Iterable[int]
+    ) -> None:
+        pending = self._pending.get((vehicle_id, kind))
+        if pending is None:
+            self._pending[(vehicle_id, kind)] = _Pending(from_day, set(vacated))
+        else:
+            pending.from_day = min(pending.from_day, from_day)
+            pending.vacated.update(vacated)
+
+    async def _async_process(self) -> None:
+        while self._pending:
+            (vehicle_id, kind), pending = self._pending.popitem()
+            try:
+                self._backfill(vehicle_id, kind, pending)
+            except Exception:
+                _LOGGER.exception(
+                    "LubeLogger: Failed to backfill %s statistics for vehicle %s",
+                    kind,
+                    vehicle_id,
+                )
+            # Let the event loop breathe between vehicles of a large fleet
+            await asyncio.sleep(0)
+
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _backfill(self, vehicle_id: int, kind: str, pending: _Pending) -> None:
+        vehicle_data = (self._coordinator.data or {}).get(vehicle_id)
+        if vehicle_data is None:
+            return
+
+        records = self._coordinator.sync.records(vehicle_id, kind)
+        name = build_vehicle_name(vehicle_data.vehicle)
+        options = self._entry.options
+
+        if kind == RECORD_ODOMETER:
+            series = [
+                (
+                    STAT_ODOMETER,
+                    f"{name} Odometer",
+                    options.get("odometer_unit", "mi"),
+                    daily_odometer(records),
+                )
+            ]
+        else:
+            series = [
+                (
+                    STAT_FUEL,
+                    f"{name} Fuel Consumed",
+                    options.get("fuel_unit", "gal"),
+                    daily_totals(records, "fuel_consumed"),
+                ),
+                (
+                    STAT_FUEL_COST,
+                    f"{name} Fuel Cost",
+                    options.get("currency", "£"),
+                    daily_totals(records, "cost"),
+                ),
+            ]
+
+        for stat, stat_name, unit, rows in series:
+            self._write(self._stat_id(vehicle_id, stat), stat_name, unit, rows, pending)
+
+    def _write(
+        self,
+        stat_id: str,
+        name: str,
+        unit: str,
+        rows: list[tuple[int, float, float]],
+        pending: _Pending,
+    ) -> None:
+        high_water = self._high_water.get(stat_id)
+        days = {day for day, _, _ in rows}
+        from_day = pending.from_day
+
+        if high_water is None or from_day == FULL or pending.vacated - days:
+            if high_water is not None:
+                get_instance(self._hass).async_clear_statistics([stat_id])
+            from_day = FULL
+        else:
+            # Append-only changes start after what was written before
+            from_day = min(from_day, high_water + 1)
+
+        new_rows = [row for row in rows if row[0] >= from_day]
+        if not new_rows:
+            self._high_water[stat_id] = rows[-1][0] if rows else 0
+            return
+
+        metadata = StatisticMetaData(
+            has_sum=True,
+            name=name,
+            source=DOMAIN,
+            statistic_id=stat_id,
+            unit_of_measurement=unit,
+        )
+        if StatisticMeanType is not None:
+            metadata["mean_type"] = StatisticMeanType.NONE
+            metadata["unit_class"] = None
+        else:
+            metadata["has_mean"] = False
+
+        for start in range(0, len(new_rows), BATCH_SIZE):
+            statistics = [
+                StatisticData(
+                    start=_row_start(day),
+                    state=state,
+                    sum=total,
+                )
+                for day, state, total in new_rows[start : start + BATCH_SIZE]
+            ]
+            async_add_external_statistics(self._hass, metadata, statistics)
+
+        self.rows_written += len(new_rows)
+        self._high_water[stat_id] = rows[-1][0]
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"high_water": self._high_water}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return backfill state for diagnostics."""
+        return {
+            "rows_written": self.rows_written,
+            "pending": len(self._pending),
+            "high_water": {
+                stat_id: date.fromordinal(day).isoformat() if day else None
+                for stat_id, day in self._high_water.items()
+            },
+        }
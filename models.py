@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .api import LubeLoggerApi
+from .bulk_import import BulkImporter
+from .history_statistics import HistoryStatistics
+from .coordinator import LubeLoggerDataUpdateCoordinator
+from .outbox import WriteOutbox
+from .push import PushReceiver
+
+
+@dataclass
+class LubeLoggerRuntimeData:
+    """Objects owned by a single LubeLogger config entry."""
+
+    api: LubeLoggerApi
+    coordinator: LubeLoggerDataUpdateCoordinator
+    outbox: WriteOutbox
+    importer: BulkImporter
+    statistics: HistoryStatistics
+    push: PushReceiver | None = None
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable
+
+import aiohttp
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+
+from .api import (
+    PRIORITY_INTERACTIVE,
+    LubeLoggerApi,
+    ResponseDecodeError,
+    request_priority,
+)
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 1
+
+WRITE_ODOMETER = "odometer"
+WRITE_FUEL = "fuel"
+WRITE_SERVICE = "service"
+
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_MAX_CONCURRENCY = 2
+
+# Retry backoff bounds in seconds
+BACKOFF_BASE = 5
+BACKOFF_MAX = 15 * 60
+
+
+@dataclass
+class OutboxItem:
+    """A queued write waiting to be sent to LubeLogger."""
+
+    kind: str
+    vehicle_id: int
+    payload: dict[str, Any]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    created: float = field(default_factory=time.time)
+    attempts: int = 0
+    next_attempt: float = 0.0
+    last_error: str | None = None
+
+    @property
+    def coalesce_key(self) -> tuple[int, str] | None:
+        """Odometer readings for the same vehicle and day replace each other."""
+        if self.kind != WRITE_ODOMETER:
+            return None
+        return (self.vehicle_id, str(self.payload.get("date")))
+
+
+def is_permanent_failure(err: Exception) -> bool:
+    """Rejected or malformed writes will never succeed on retry."""
+    if isinstance(err, ResponseDecodeError):
+        # Only the reply was unreadable; the write itself was accepted
+        return False
+    if isinstance(err, (ValueError, KeyError)):
+        return True
+    return (
+        isinstance(err, aiohttp.ClientResponseError)
+        and 400 <= err.status < 500
+        and err.status not in (408, 429)
+    )
+
+
+def _backoff(attempts: int) -> float:
+    """Exponential backoff, jittered over the upper half of the interval."""
+    ceiling = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempts - 1))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+class WriteOutbox:
+    """Persistent queue of writes for one config entry.
+
+    Service calls enqueue and return immediately. Items are stored on
+    disk, flushed in batches with bounded concurrency and retried with
+    jittered backoff until LubeLogger accepts them, across restarts.
+    Queued odometer readings for the same vehicle and date are coalesced
+    so only the newest one is sent.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        api: LubeLoggerApi,
+        on_flushed: Callable[[list[int]], Any] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        self._hass = hass
+        self._api = api
+        self._on_flushed = on_flushed
+        self._batch_size = batch_size
+        self._max_concurrency = max_concurrency
+
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.outbox"
+        )
+        self._items: dict[str, OutboxItem] = {}
+        self._coalesce: dict[tuple[int, str], str] = {}
+        self._in_flight: set[str] = set()
+
+        self._flush_task: asyncio.Task | None = None
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._closed = False
+
+        self.sent = 0
+        self.unconfirmed = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load() or {}
+
+        for raw in stored.get("items", []):
+            item = OutboxItem(**raw)
+            self._add(item)
+
+        if self._items:
+            _LOGGER.info("LubeLogger: Resuming %s queued writes", len(self._items))
+            self._schedule_flush(0)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    async def async_enqueue(
+        self, kind: str, vehicle_id: int, payload: dict[str, Any]
+    ) -> OutboxItem:
+        """Queue a write and return once it is on disk.
+
+        LubeLogger is not waited for; the write survives a restart from
+        the moment this returns.
+        """
+        item = OutboxItem(kind=kind, vehicle_id=vehicle_id, payload=dict(payload))
+
+        key = item.coalesce_key
+        existing_id = self._coalesce.get(key) if key else None
+        if existing_id is not None and existing_id not in self._in_flight:
+            self._remove(existing_id)
+            self.coalesced += 1
+
+        self._add(item)
+        await self._store.async_save(self._data_to_save())
+        self._schedule_flush(0)
+        return item
+
+    async def async_shutdown(self) -> None:
+        """Stop flushing and persist whatever is still queued."""
+        self._closed = True
+
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+
+        await self._store.async_save(self._data_to_save())
+
+    def _add(self, item: OutboxItem) -> None:
+        self._items[item.id] = item
+        if item.coalesce_key:
+            self._coalesce[item.coalesce_key] = item.id
+
+    def _remove(self, item_id: str) -> None:
+        item = self._items.pop(item_id, None)
+        if item is not None and self._coalesce.get(item.coalesce_key) == item_id:
+            del self._coalesce[item.coalesce_key]
+
+    @callback
+    def _schedule_flush(self, delay: float) -> None:
+        if self._closed:
+            return
+
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+
+        if delay <= 0:
+            self._start_flush()
+            return
+
+        self._cancel_timer = async_call_later(
+            self._hass, delay, self._timer_fired
+        )
+
+    @callback
+    def _timer_fired(self, _now: Any) -> None:
+        self._cancel_timer = None
+        self._start_flush()
+
+    @callback
+    def _start_flush(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            # The running flush picks up new items before it finishes
+            return
+
+        self._flush_task = self._hass.async_create_background_task(
+            self._async_flush(), f"{DOMAIN} outbox flush"
+        )
+
+    async def _async_flush(self) -> None:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        written: set[int] = set()
+
+        while not self._closed:
+            now = time.time()
+            due = sorted(
+                (
+                    item
+                    for item in self._items.values()
+                    if item.next_attempt <= now and item.id not in self._in_flight
+                ),
+                key=lambda item: item.created,
+            )[: self._batch_size]
+
+            if not due:
+                break
+
+            async def _send(item: OutboxItem) -> bool:
+                async with semaphore:
+                    # Writes come from service calls, so they go ahead of
+                    # refreshes; the refresh after the flush stays background
+                    with request_priority(PRIORITY_INTERACTIVE):
+                        return await self._async_send(item)
+
+            results = await asyncio.gather(*(_send(item) for item in due))
+            written.update(item.vehicle_id for item, ok in zip(due, results) if ok)
+            self._save()
+
+        if written and self._on_flushed is not None:
+            # Only the vehicles that were written to need fetching again
+            result = self._on_flushed(sorted(written))
+            if asyncio.iscoroutine(result):
+                await result
+
+        if self._items and not self._closed:
+            next_due = min(item.next_attempt for item in self._items.values())
+            self._schedule_flush(max(next_due - time.time(), 0.1))
+
+    async def _async_send(self, item: OutboxItem) -> bool:
+        self._in_flight.add(item.id)
+        try:
+            await self._write(item)
+        except asyncio.CancelledError:
+            raise
+        except ResponseDecodeError as err:
+            # LubeLogger answered with a success status, so the write most
+            # likely landed and resending could duplicate it. The refresh
+            # that follows the flush reads the vehicle back.
+            _LOGGER.warning(
+                "LubeLogger: %s write for vehicle %s was accepted but its "
+                "response could not be read, not resending: %s",
+                item.kind,
+                item.vehicle_id,
+                err,
+            )
+            self._remove(item.id)
+            self.unconfirmed += 1
+            return True
+        except Exception as err:
+            item.attempts += 1
+            item.last_error = str(err) or type(err).__name__
+
+            if is_permanent_failure(err):
+                _LOGGER.error(
+                    "LubeLogger: Dropping %s write for vehicle %s: %s",
+                    item.kind,
+                    item.vehicle_id,
+                    item.last_error,
+                )
+                self._remove(item.id)
+                self.dropped += 1
+                return False
+
+            delay = _backoff(item.attempts)
+            item.next_attempt = time.time() + delay
+            _LOGGER.warning(
+                "LubeLogger: %s write for vehicle %s failed (attempt %s), "
+                "retrying in %ss: %s",
+                item.kind,
+                item.vehicle_id,
+                item.attempts,
+                round(delay),
+                item.last_error,
+            )
+            return False
+        finally:
+            self._in_flight.discard(item.id)
+
+        self._remove(item.id)
+        self.sent += 1
+        return True
+
+    async def _write(self, item: OutboxItem) -> None:
+        payload = item.payload
+
+        if item.kind == WRITE_ODOMETER:
+            await self._api.odometer.add(
+                item.vehicle_id, payload["odometer"], payload["date"]
+            )
+        elif item.kind == WRITE_FUEL:
+            await self._api.fuel.add(item.vehicle_id, payload)
+        elif item.kind == WRITE_SERVICE:
+            await self._api.service_records.add(item.vehicle_id, payload)
+        else:
+            raise ValueError(f"Unknown write kind {item.kind}")
+
+    @callback
+    def _save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"items": [asdict(item) for item in self._items.values()]}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return queue statistics for diagnostics."""
+        return {
+            "pending": len(self._items),
+            "in_flight": len(self._in_flight),
+            "sent": self.sent,
+            "unconfirmed": self.unconfirmed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "oldest_error": next(
+                (item.last_error for item in self._items.values() if item.last_error),
+                None,
+            ),
+        }
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from .api.models import Vehicle
+
+# Poll interval right after a vehicle's data changed
+FAST_POLL_INTERVAL = 60
+# Ceiling for the backoff of vehicles that stopped changing
+IDLE_POLL_INTERVAL = 6 * 60 * 60
+BACKOFF_FACTOR = 2.0
+
+
+@dataclass
+class _PollState:
+    interval: float
+    next_due: float
+    last_change: float | None = None
+    polls: int = 0
+
+
+class VehiclePollPlanner:
+    """Decide which vehicles a refresh should fetch.
+
+    A vehicle whose data changed is polled again after FAST_POLL_INTERVAL.
+    Every poll without a change doubles its interval, up to
+    IDLE_POLL_INTERVAL. Sold vehicles are fetched once and then only when
+    explicitly forced. Request volume therefore follows actual activity
+    rather than fleet size; the vehicle list itself is still fetched on
+    every refresh so new and sold vehicles are noticed.
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        fast_interval: float = FAST_POLL_INTERVAL,
+        idle_interval: float = IDLE_POLL_INTERVAL,
+    ):
+        self.base_interval = base_interval
+        self.fast_interval = min(fast_interval, base_interval)
+        self.idle_interval = max(idle_interval, base_interval)
+
+        self._states: dict[int, _PollState] = {}
+        self._forced: set[int] = set()
+        self._force_all = False
+
+    def due(self, vehicles: Iterable[Vehicle], now: float | None = None) -> set[int]:
+        """Return the ids of vehicles to fetch in this refresh."""
+        now = time.monotonic() if now is None else now
+        # Refreshes never fire exactly on time; don't miss a slot by a hair
+        slack = self.fast_interval / 2
+        due: set[int] = set()
+
+        for vehicle in vehicles:
+            state = self._states.get(vehicle.id)
+
+            if self._force_all or vehicle.id in self._forced or state is None:
+                due.add(vehicle.id)
+            elif not vehicle.sold and state.next_due <= now + slack:
+                due.add(vehicle.id)
+
+        self._forced.clear()
+        self._force_all = False
+        return due
+
+    def observe(
+        self,
+        vehicle_id: int,
+        changed: bool,
+        sold: bool = False,
+        now: float | None = None,
+    ) -> None:
+        """Record the outcome of fetching a vehicle."""
+        now = time.monotonic() if now is None else now
+        state = self._states.get(vehicle_id)
+
+        if state is None:
+            # Start at the configured interval until there is a track record
+            state = self._states[vehicle_id] = _PollState(
+                interval=self.base_interval, next_due=now
+            )
+        elif changed:
+            state.interval = self.fast_interval
+            state.last_change = now
+        else:
+            state.interval = min(state.interval * BACKOFF_FACTOR, self.idle_interval)
+
+        state.polls += 1
+        state.next_due = math.inf if sold else now + state.interval
+
+    def force(self, vehicle_ids: Iterable[int] | None = None) -> None:
+        """Fetch the given vehicles (or all of them) on the next refresh."""
+        if vehicle_ids is None:
+            self._force_all = True
+        else:
+            self._forced.update(vehicle_ids)
+
+    def next_refresh(self, now: float | None = None) -> float:
+        """Seconds until the next vehicle is due, within sane bounds."""
+        now = time.monotonic() if now is None else now
+        pending = [
+            state.next_due
+            for state in self._states.values()
+            if state.next_due != math.inf
+        ]
+        if not pending:
+            return self.base_interval
+        wait = min(pending) - now
+        return max(self.fast_interval, min(wait, self.base_interval))
+
+    def prune(self, vehicle_ids: Iterable[int]) -> None:
+        keep = set(vehicle_ids)
+        for vehicle_id in [vid for vid in self._states if vid not in keep]:
+            del self._states[vehicle_id]
+
+    def as_dict(self, now: float | None = None) -> dict[str, Any]:
+        """Return per-vehicle polling state for diagnostics."""
+        now = time.monotonic() if now is None else now
+        return {
+            str(vehicle_id): {
+                "interval": round(state.interval),
+                "due_in": (
+                    None
+                    if state.next_due == math.inf
+                    else round(max(state.next_due - now, 0))
+                ),
+                "polls": state.polls,
+                "last_change_ago": (
+                    None if state.last_change is None else round(now - state.last_change)
+                ),
+            }
+            for vehicle_id, state in self._states.items()
+        }
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .api import SpanRecorder, spans_active, start_spans, stop_spans
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_LAST_PROFILE = f"{DOMAIN}_last_profile"
+EVENT_PROFILE_FINISHED = f"{DOMAIN}_profile_finished"
+
+DEFAULT_PROFILE_SECONDS = 30
+MAX_PROFILE_SECONDS = 600
+# Functions listed per section of the report
+REPORT_LIMIT = 40
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@dataclass
+class ProfileResult:
+    """Summary of one profiling run, kept for diagnostics."""
+
+    started: str
+    seconds: float
+    report: str
+    spans: dict[str, Any] = field(default_factory=dict)
+    refreshed: int = 0
+    reloaded: int = 0
+
+
+def _write_report(
+    path: str,
+    profiler: cProfile.Profile,
+    recorder: SpanRecorder,
+    seconds: float,
+) -> None:
+    """Write the span table and the integration's hottest functions."""
+    out = io.StringIO()
+    out.write(f"LubeLogger profile, {seconds:.1f}s from {datetime.now():%c}\n\n")
+
+    out.write("Spans (wall-clock, includes time spent awaiting)\n")
+    out.write(
+        f"{'span':<24}{'count':>8}{'total ms':>12}{'mean ms':>10}{'max ms':>10}\n"
+    )
+    for name, stats in recorder.as_dict().items():
+        out.write(
+            f"{name:<24}{stats['count']:>8}{stats['total_ms']:>12}"
+            f"{stats['mean_ms'] or 0:>10}{stats['max_ms']:>10}\n"
+        )
+
+    # cProfile sees the whole event loop; keep the report to this package
+    only_ours = re.escape(_PACKAGE_DIR)
+    for title, sort in (
+        ("By cumulative time", pstats.SortKey.CUMULATIVE),
+        ("By own time", pstats.SortKey.TIME),
+    ):
+        out.write(f"\n{title}\n")
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats(sort).print_stats(only_ours, REPORT_LIMIT)
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(out.getvalue())
+
+
+async def async_profile(
+    hass: HomeAssistant,
+    seconds: float = DEFAULT_PROFILE_SECONDS,
+    refresh: bool = True,
+    include_setup: bool = False,
+) -> ProfileResult:
+    """Profile the integration for a number of seconds and write a report.
+
+    Only one run can be active. include_setup reloads every LubeLogger
+    config entry inside the window; refresh requests a fleet refresh so
+    the window covers at least one. Spans are only recorded while a run
+    is active, so instrumented code costs nothing the rest of the time.
+    """
+    if spans_active():
+        raise HomeAssistantError("A LubeLogger profile is already running")
+
+    seconds = min(max(seconds, 1), MAX_PROFILE_SECONDS)
+    profiler = cProfile.Profile()
+
+    try:
+        profiler.enable()
+    except ValueError as err:
+        # Python 3.12+ allows one profiler per thread
+        raise HomeAssistantError(f"Cannot start profiler: {err}") from err
+
+    recorder = start_spans()
+    started = time.monotonic()
+    reloaded = refreshed = 0
+
+    try:
+        if include_setup:
+            for entry in hass.config_entries.async_entries(DOMAIN):
+                await hass.config_entries.async_reload(entry.entry_id)
+                reloaded += 1
+
+        if refresh:
+            for data in list(hass.data.get(DOMAIN, {}).values()):
+                await data.coordinator.async_refresh_vehicles()
+                refreshed += 1
+
+        remaining = seconds - (time.monotonic() - started)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+    finally:
+        profiler.disable()
+        stop_spans()
+
+    elapsed = time.monotonic() - started
+    path = hass.config.path(f"{DOMAIN}_profile_{datetime.now():%Y%m%d_%H%M%S}.txt")
+    await hass.async_add_executor_job(
+        _write_report, path, profiler, recorder, elapsed
+    )
+
+    result = ProfileResult(
+        started=datetime.fromtimestamp(recorder.started).isoformat(),
+        seconds=round(elapsed, 1),
+        report=path,
+        spans=recorder.as_dict(),
+        refreshed=refreshed,
+        reloaded=reloaded,
+    )
+    hass.data[DATA_LAST_PROFILE] = result
+    hass.bus.async_fire(EVENT_PROFILE_FINISHED, asdict(result))
+    _LOGGER.info("LubeLogger: Profile written to %s", path)
+    return result
+
+
+def last_profile(hass: HomeAssistant) -> dict[str, Any] | None:
+    result = hass.data.get(DATA_LAST_PROFILE)
+    return asdict(result) if result else None
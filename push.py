@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.network import NoURLAvailableError
+
+from .const import CONF_WEBHOOK_ID, DOMAIN
+from .coordinator import LubeLoggerDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to gather notifications before fetching, so bursts cost one fetch
+PUSH_COOLDOWN = 2
+
+_VEHICLE_ID_KEYS = ("vehicleId", "VehicleId", "vehicle_id")
+
+
+def _vehicle_id(item: dict[str, Any]) -> int | None:
+    for source in (item, item.get("data")):
+        if not isinstance(source, dict):
+            continue
+        for key in _VEHICLE_ID_KEYS:
+            value = source.get(key)
+            if value in (None, ""):
+                continue
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def parse_notification(payload: Any) -> set[int] | None:
+    """Return the vehicle ids a change notification is about.
+
+    Accepts LubeLogger's webhook payload, whose ``data`` holds the changed
+    record, a bare ``{"vehicleId": ...}`` object, or a list of either.
+    None means the notification names no vehicle (e.g. a vehicle was added
+    or deleted) and the whole fleet needs a refresh.
+    """
+    items = payload if isinstance(payload, list) else [payload]
+    vehicle_ids: set[int] = set()
+
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError("Notification must be a JSON object or list of objects")
+        vehicle_id = _vehicle_id(item)
+        if vehicle_id is None:
+            return None
+        vehicle_ids.add(vehicle_id)
+
+    return vehicle_ids
+
+
+class PushReceiver:
+    """Webhook that LubeLogger (or a relay) posts change notifications to.
+
+    Each notification marks its vehicle as pending. After a short cooldown
+    the pending vehicles are fetched on their own, without the vehicle
+    list or the rest of the fleet, and their entities update. Polling
+    carries on at PUSH_RECONCILE_INTERVAL to catch missed notifications.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: LubeLoggerDataUpdateCoordinator,
+    ):
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+
+        self._pending: set[int] = set()
+        self._refresh_all = False
+        self._received = 0
+        self._rejected = 0
+        self._last_received: float | None = None
+        self._registered = False
+
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PUSH_COOLDOWN,
+            immediate=False,
+            function=self._async_flush,
+        )
+
+    @property
+    def webhook_id(self) -> str | None:
+        return self._entry.data.get(CONF_WEBHOOK_ID)
+
+    @callback
+    def async_setup(self) -> None:
+        """Register the webhook, creating its id on first use."""
+        if self.webhook_id is None:
+            self._hass.config_entries.async_update_entry(
+                self._entry,
+                data={**self._entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()},
+            )
+
+        webhook.async_register(
+            self._hass,
+            DOMAIN,
+            f"LubeLogger ({self._entry.title})",
+            self.webhook_id,
+            self._async_handle_webhook,
+            allowed_methods=["POST", "PUT"],
+        )
+        self._registered = True
+
+        _LOGGER.info(
+            "LubeLogger: Push updates enabled, notifications go to %s",
+            self.webhook_url or f"webhook {self.webhook_id}",
+        )
+
+    @property
+    def webhook_url(self) -> str | None:
+        try:
+            return webhook.async_generate_url(self._hass, self.webhook_id)
+        except NoURLAvailableError:
+            return None
+
+    async def async_shutdown(self) -> None:
+        if self._registered:
+            webhook.async_unregister(self._hass, self.webhook_id)
+            self._registered = False
+        self._debouncer.async_shutdown()
+
+    async def _async_handle_webhook(
+        self, hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        try:
+            vehicle_ids = parse_notification(await request.json())
+        except ValueError as err:
+            self._rejected += 1
+            _LOGGER.debug("LubeLogger: Ignoring malformed notification: %s", err)
+            return web.Response(status=400, text=str(err))
+
+        self._received += 1
+        self._last_received = time.time()
+
+        if vehicle_ids is None:
+            self._refresh_all = True
+        else:
+            self._pending.update(vehicle_ids)
+
+        await self._debouncer.async_call()
+        return web.Response(status=202)
+
+    async def _async_flush(self) -> None:
+        pending, self._pending = self._pending, set()
+        refresh_all, self._refresh_all = self._refresh_all, False
+
+        if refresh_all:
+            # Vehicles may have come or gone, so the vehicle list is needed
+            await self._coordinator.async_request_vehicle_refresh(list(pending))
+        elif pending:
+            await self._coordinator.async_push_update(pending)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "registered": self._registered,
+            "received": self._received,
+            "rejected": self._rejected,
+            "pending": sorted(self._pending),
+            "last_received_ago": (
+                None
+                if self._last_received is None
+                else round(time.time() - self._last_received)
+            ),
+        }
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .models import LubeLoggerRuntimeData
+
+DATA_ROUTER = f"{DOMAIN}_router"
+
+
+@dataclass(frozen=True, slots=True)
+class VehicleRoute:
+    """Where service calls for one vehicle entity or device must go."""
+
+    entry_id: str
+    vehicle_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedVehicle:
+    """A route together with the runtime data of its config entry."""
+
+    entry_id: str
+    vehicle_id: int
+    data: LubeLoggerRuntimeData
+
+
+class VehicleRouter:
+    """Index from entity and device ids to the vehicle they belong to.
+
+    Vehicle entities register themselves when added to Home Assistant and
+    drop out when removed, so a service call resolves with dictionary
+    lookups instead of reading the state machine, and always reaches the
+    config entry (and LubeLogger server) that owns the vehicle.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+        self._entities: dict[str, VehicleRoute] = {}
+        self._devices: dict[str, VehicleRoute] = {}
+        self._device_refs: dict[str, int] = {}
+
+    @callback
+    def async_register(
+        self, entity_id: str, device_id: str | None, route: VehicleRoute
+    ) -> Callable[[], None]:
+        """Index an entity (and its device); returns the undo callback."""
+        self._entities[entity_id] = route
+        if device_id is not None:
+            self._devices[device_id] = route
+            self._device_refs[device_id] = self._device_refs.get(device_id, 0) + 1
+
+        @callback
+        def _unregister() -> None:
+            if self._entities.get(entity_id) == route:
+                del self._entities[entity_id]
+            if device_id is not None:
+                refs = self._device_refs.get(device_id, 1) - 1
+                if refs > 0:
+                    self._device_refs[device_id] = refs
+                else:
+                    self._device_refs.pop(device_id, None)
+                    self._devices.pop(device_id, None)
+
+        return _unregister
+
+    def _resolve(self, route: VehicleRoute | None, target: str) -> ResolvedVehicle:
+        if route is None:
+            raise HomeAssistantError(f"{target} is not a LubeLogger vehicle")
+
+        data = self._hass.data.get(DOMAIN, {}).get(route.entry_id)
+        if data is None:
+            raise HomeAssistantError(f"LubeLogger entry for {target} is not loaded")
+
+        return ResolvedVehicle(route.entry_id, route.vehicle_id, data)
+
+    def resolve_entity(self, entity_id: str) -> ResolvedVehicle:
+        return self._resolve(self._entities.get(entity_id), entity_id)
+
+    def resolve_device(self, device_id: str) -> ResolvedVehicle:
+        return self._resolve(self._devices.get(device_id), device_id)
+
+    def resolve_call(self, call: ServiceCall) -> list[ResolvedVehicle]:
+        """Return every vehicle targeted by a call's entity_id and device_id."""
+        resolved = [
+            self.resolve_entity(entity_id)
+            for entity_id in _as_list(call.data.get("entity_id"))
+        ]
+        resolved.extend(
+            self.resolve_device(device_id)
+            for device_id in _as_list(call.data.get("device_id"))
+        )
+
+        # One entry per vehicle even if several of its entities were picked
+        unique = {(item.entry_id, item.vehicle_id): item for item in resolved}
+        return list(unique.values())
+
+    def resolve_one(self, call: ServiceCall) -> ResolvedVehicle:
+        """Return the single vehicle a write service call targets."""
+        resolved = self.resolve_call(call)
+        if len(resolved) != 1:
+            raise HomeAssistantError("Select exactly one LubeLogger vehicle")
+        return resolved[0]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"entities": len(self._entities), "devices": len(self._devices)}
+
+
+def _as_list(value: Any) -> list[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+@callback
+def async_get_router(hass: HomeAssistant) -> VehicleRouter:
+    """Return the router shared by every LubeLogger config entry."""
+    router = hass.data.get(DATA_ROUTER)
+    if router is None:
+        router = hass.data[DATA_ROUTER] = VehicleRouter(hass)
+    return router
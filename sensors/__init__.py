@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from ..const import DOMAIN
 from .vehicle_info import LubeLoggerVehicleInfoSensor
 from .vehicle_status import LubeLoggerVehicleStatusSensor
 from .odometer import LubeLoggerOdometerSensor
+from .fuel import FUEL_SENSORS, LubeLoggerFuelSensor
+from .service_due import SERVICE_DUE_SENSORS, LubeLoggerServiceDueSensor
+from .cost import COST_SENSORS, LubeLoggerCostSensor
+from .api_metrics import API_METRICS_SENSORS, LubeLoggerApiMetricsSensor
 
 
 async def async_setup_entry(
@@ -16,14 +20,41 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up LubeLogger sensors based on a config entry."""
-    api = hass.data[DOMAIN][entry.entry_id]
-    vehicles = await api.vehicles.vehicles_list()
+    coordinator = hass.data[DOMAIN][entry.entry_id].coordinator
+    known: set[int] = set()
 
-    entities = []
+    @callback
+    def _async_add_new_vehicles() -> None:
+        entities = []
 
-    for vehicle in vehicles:
-        entities.append(LubeLoggerVehicleInfoSensor(entry, vehicle))
-        entities.append(LubeLoggerVehicleStatusSensor(entry, vehicle))
-        entities.append(LubeLoggerOdometerSensor(entry, vehicle, api))
+        for vehicle_id in coordinator.data or {}:
+            if vehicle_id in known:
+                continue
+            known.add(vehicle_id)
 
-    async_add_entities(entities)
+            entities.append(LubeLoggerVehicleInfoSensor(coordinator, vehicle_id))
+            entities.append(LubeLoggerVehicleStatusSensor(coordinator, vehicle_id))
+            entities.append(LubeLoggerOdometerSensor(coordinator, vehicle_id))
+            entities.extend(
+                LubeLoggerFuelSensor(coordinator, vehicle_id, description)
+                for description in FUEL_SENSORS
+            )
+            entities.extend(
+                LubeLoggerServiceDueSensor(coordinator, vehicle_id, description)
+                for description in SERVICE_DUE_SENSORS
+            )
+            entities.extend(
+                LubeLoggerCostSensor(coordinator, vehicle_id, description)
+                for description in COST_SENSORS
+            )
+
+        if entities:
+            async_add_entities(entities)
+
+    async_add_entities(
+        LubeLoggerApiMetricsSensor(coordinator, description)
+        for description in API_METRICS_SENSORS
+    )
+
+    _async_add_new_vehicles()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_vehicles))
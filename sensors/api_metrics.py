@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from ..api.metrics import ApiMetrics
+from ..const import DOMAIN
+from ..coordinator import LubeLoggerDataUpdateCoordinator
+
+
+def _latency_ms(metrics: ApiMetrics, percent: int) -> float | None:
+    seconds = metrics.latency.percentile(percent)
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def _requests_by_endpoint(metrics: ApiMetrics) -> dict[str, Any]:
+    return {endpoint: m.requests for endpoint, m in metrics.endpoints.items()}
+
+
+def _errors_by_endpoint(metrics: ApiMetrics) -> dict[str, Any]:
+    return {
+        endpoint: dict(m.errors) for endpoint, m in metrics.endpoints.items() if m.errors
+    }
+
+
+def _bytes_by_endpoint(metrics: ApiMetrics) -> dict[str, Any]:
+    return {
+        "decoded_bytes": metrics.bytes,
+        "endpoints": {
+            endpoint: {"wire": m.wire_bytes, "decoded": m.bytes}
+            for endpoint, m in metrics.endpoints.items()
+        },
+    }
+
+
+def _latency_by_endpoint(metrics: ApiMetrics) -> dict[str, Any]:
+    slowest = metrics.slowest()
+    return {
+        "slowest_endpoint": slowest[0] if slowest else None,
+        "endpoints": {
+            endpoint: m.latency.as_dict() for endpoint, m in metrics.endpoints.items()
+        },
+    }
+
+
+@dataclass(frozen=True, kw_only=True)
+class LubeLoggerApiMetricsSensorDescription(SensorEntityDescription):
+    """Describes a sensor reporting API request metrics for a config entry."""
+
+    value_fn: Callable[[ApiMetrics], float | int | None]
+    attributes_fn: Callable[[ApiMetrics], dict[str, Any]]
+
+
+API_METRICS_SENSORS: tuple[LubeLoggerApiMetricsSensorDescription, ...] = (
+    LubeLoggerApiMetricsSensorDescription(
+        key="api_requests",
+        name="API Requests",
+        icon="mdi:swap-horizontal",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.requests,
+        attributes_fn=_requests_by_endpoint,
+    ),
+    LubeLoggerApiMetricsSensorDescription(
+        key="api_errors",
+        name="API Errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.errors,
+        attributes_fn=_errors_by_endpoint,
+    ),
+    LubeLoggerApiMetricsSensorDescription(
+        key="api_bytes_received",
+        name="API Bytes Received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.wire_bytes,
+        attributes_fn=_bytes_by_endpoint,
+    ),
+    *(
+        LubeLoggerApiMetricsSensorDescription(
+            key=f"api_latency_p{percent}",
+            name=f"API Latency p{percent}",
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda metrics, percent=percent: _latency_ms(metrics, percent),
+            attributes_fn=_latency_by_endpoint,
+        )
+        for percent in (50, 95, 99)
+    ),
+)
+
+
+class LubeLoggerApiMetricsSensor(
+    CoordinatorEntity[LubeLoggerDataUpdateCoordinator], SensorEntity
+):
+    """Request metrics for the LubeLogger server behind a config entry.
+
+    Values are read from the API metrics whenever the coordinator
+    refreshes. These sensors are diagnostic and disabled by default.
+    """
+
+    entity_description: LubeLoggerApiMetricsSensorDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: LubeLoggerDataUpdateCoordinator,
+        description: LubeLoggerApiMetricsSensorDescription,
+    ):
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._metrics = coordinator.api.metrics
+
+        entry = coordinator.entry
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_name = f"LubeLogger {description.name}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"server_{entry.entry_id}")},
+            name=f"LubeLogger {entry.title}",
+            manufacturer="LubeLogger",
+            model="Server",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def available(self) -> bool:
+        # Metrics are most useful exactly when refreshes are failing
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        return self.entity_description.value_fn(self._metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self.entity_description.attributes_fn(self._metrics)
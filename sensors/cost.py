@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.util import dt as dt_util
+
+from ..analytics import CostStats
+from ..backfill import HistoryNeed, full_history, year_to_date
+from ..coordinator import LubeLoggerDataUpdateCoordinator
+from ..sync import RECORD_FUEL, RECORD_SERVICE
+from .entity import LubeLoggerVehicleEntity
+from .fuel import _cost_per_distance_unit, _currency_unit
+from .utils import start_of_month, start_of_year
+
+
+@dataclass(frozen=True, kw_only=True)
+class LubeLoggerCostSensorDescription(SensorEntityDescription):
+    """Describes a total-cost-of-ownership sensor."""
+
+    value_fn: Callable[[CostStats], float | None]
+    unit_fn: Callable[[ConfigEntry], str] = _currency_unit
+    # How far back the figure needs records; None when the window suffices
+    history: HistoryNeed | None = None
+    # Start of the period a TOTAL sensor counts from, given the time now
+    reset_fn: Callable[[datetime], datetime] | None = None
+
+
+COST_SENSORS: tuple[LubeLoggerCostSensorDescription, ...] = (
+    LubeLoggerCostSensorDescription(
+        key="total_cost",
+        name="Total Cost",
+        icon="mdi:cash-multiple",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        value_fn=lambda stats: stats.total,
+        history=full_history,
+    ),
+    LubeLoggerCostSensorDescription(
+        key="cost_month",
+        name="Cost This Month",
+        icon="mdi:cash-multiple",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        reset_fn=start_of_month,
+        value_fn=lambda stats: stats.month,
+    ),
+    LubeLoggerCostSensorDescription(
+        key="cost_ytd",
+        name="Cost Year To Date",
+        icon="mdi:cash-multiple",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        reset_fn=start_of_year,
+        value_fn=lambda stats: stats.ytd,
+        history=year_to_date,
+    ),
+    LubeLoggerCostSensorDescription(
+        key="fuel_cost_ytd",
+        name="Fuel Cost Year To Date",
+        icon="mdi:gas-station",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        reset_fn=start_of_year,
+        value_fn=lambda stats: stats.fuel_ytd,
+        history=year_to_date,
+    ),
+    LubeLoggerCostSensorDescription(
+        key="service_cost_month",
+        name="Service Cost This Month",
+        icon="mdi:wrench",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        reset_fn=start_of_month,
+        value_fn=lambda stats: stats.service_month,
+    ),
+    LubeLoggerCostSensorDescription(
+        key="service_cost_ytd",
+        name="Service Cost Year To Date",
+        icon="mdi:wrench",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        reset_fn=start_of_year,
+        value_fn=lambda stats: stats.service_ytd,
+        history=year_to_date,
+    ),
+    LubeLoggerCostSensorDescription(
+        key="service_cost_total",
+        name="Service Cost Total",
+        icon="mdi:wrench",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        value_fn=lambda stats: stats.service_total,
+        history=full_history,
+    ),
+    LubeLoggerCostSensorDescription(
+        key="total_cost_per_distance",
+        name="Total Cost Per Distance",
+        icon="mdi:cash",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.cost_per_distance,
+        unit_fn=_cost_per_distance_unit,
+        history=full_history,
+    ),
+)
+
+
+class LubeLoggerCostSensor(LubeLoggerVehicleEntity, SensorEntity):
+    """Running cost of ownership for a LubeLogger vehicle."""
+
+    entity_description: LubeLoggerCostSensorDescription
+    _attr_primary = False
+
+    def __init__(
+        self,
+        coordinator: LubeLoggerDataUpdateCoordinator,
+        vehicle_id: int,
+        description: LubeLoggerCostSensorDescription,
+    ):
+        super().__init__(coordinator, vehicle_id)
+        self.entity_description = description
+
+        self._attr_unique_id = (
+            f"{self._entry.entry_id}_vehicle_{vehicle_id}_{description.key}"
+        )
+        self._attr_name = f"{self._vehicle_name} {description.name}"
+        self._attr_native_unit_of_measurement = description.unit_fn(self._entry)
+        if description.history is not None:
+            self._history_kinds = (RECORD_FUEL, RECORD_SERVICE)
+
+    def _history_needed(self, today: date) -> date | None:
+        return self.entity_description.history(today)
+
+    @property
+    def native_value(self) -> float | None:
+        data = self.vehicle_data
+        if data is None or data.cost_stats is None:
+            return None
+        return self.entity_description.value_fn(data.cost_stats)
+
+    @property
+    def last_reset(self) -> datetime | None:
+        reset_fn = self.entity_description.reset_fn
+        return reset_fn(dt_util.now()) if reset_fn else None
+
+    @property
+    def extra_state_attributes(self):
+        data = self.vehicle_data
+        stats = data.cost_stats if data else None
+        if stats is None:
+            return None
+        return {
+            "fuel_total": stats.fuel_total,
+            "service_total": stats.service_total,
+            "distance": stats.distance,
+        }
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import date
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from ..api import span
+from ..api.models import HistoryRecord, Vehicle
+from ..coordinator import LubeLoggerDataUpdateCoordinator, VehicleData
+from ..routing import VehicleRoute, async_get_router
+from .utils import build_vehicle_name, vehicle_device_identifier
+
+
+class LubeLoggerVehicleEntity(CoordinatorEntity[LubeLoggerDataUpdateCoordinator]):
+    """Base entity for a vehicle backed by the fleet coordinator."""
+
+    # Record kinds this entity may need from before the refresh window;
+    # _history_needed says how far back
+    _history_kinds: tuple[str, ...] = ()
+
+    def __init__(self, coordinator: LubeLoggerDataUpdateCoordinator, vehicle_id: int):
+        super().__init__(coordinator)
+        self._entry = coordinator.entry
+        self._vehicle_id = vehicle_id
+
+        vehicle = self.vehicle_data.vehicle
+        self._vehicle_name = build_vehicle_name(vehicle)
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={vehicle_device_identifier(self._entry.entry_id, vehicle_id)},
+            name=self._vehicle_name,
+            manufacturer="LubeLogger",
+            model=vehicle.model or "Vehicle",
+        )
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+
+        # Lets service calls find this vehicle's entry without a state lookup
+        device_id = self.registry_entry.device_id if self.registry_entry else None
+        self.async_on_remove(
+            async_get_router(self.hass).async_register(
+                self.entity_id,
+                device_id,
+                VehicleRoute(self._entry.entry_id, self._vehicle_id),
+            )
+        )
+
+        if self._history_kinds:
+            self.async_on_remove(
+                self.coordinator.backfill.async_require(
+                    self._vehicle,
+                    self.entity_id,
+                    self._history_kinds,
+                    self._history_needed,
+                )
+            )
+
+    def _history_needed(self, today: date) -> date | None:
+        """Oldest date this entity needs records from, None for no need."""
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        with span("entities.update"):
+            super()._handle_coordinator_update()
+
+    @property
+    def vehicle_data(self) -> VehicleData | None:
+        """Return the latest coordinator data for this vehicle."""
+        return (self.coordinator.data or {}).get(self._vehicle_id)
+
+    @property
+    def _vehicle(self) -> Vehicle:
+        data = self.vehicle_data
+        return data.vehicle if data else Vehicle(id=self._vehicle_id)
+
+    def records(self, kind: str) -> list[HistoryRecord]:
+        """Return this vehicle's locally synced records of a kind, by date."""
+        return self.coordinator.sync.records(self._vehicle_id, kind)
+
+    @property
+    def available(self) -> bool:
+        # Snapshot values stay visible until LubeLogger has answered once
+        online = super().available or self.coordinator.restored
+        return online and self.vehicle_data is not None
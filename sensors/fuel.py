@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.util import dt as dt_util
+
+from ..analytics import FuelStats, ROLLING_WINDOWS
+from ..backfill import HistoryNeed, days_back, full_history
+from ..coordinator import LubeLoggerDataUpdateCoordinator
+from ..sync import RECORD_FUEL
+from .entity import LubeLoggerVehicleEntity
+from .utils import start_of_month
+
+
+def _economy_unit(entry: ConfigEntry) -> str:
+    odometer_unit = entry.options.get("odometer_unit", "mi")
+    fuel_unit = entry.options.get("fuel_unit", "gal")
+    return f"{odometer_unit}/{fuel_unit}"
+
+
+def _cost_per_distance_unit(entry: ConfigEntry) -> str:
+    currency = entry.options.get("currency", "£")
+    return f"{currency}/{entry.options.get('odometer_unit', 'mi')}"
+
+
+def _currency_unit(entry: ConfigEntry) -> str:
+    return entry.options.get("currency", "£")
+
+
+@dataclass(frozen=True, kw_only=True)
+class LubeLoggerFuelSensorDescription(SensorEntityDescription):
+    """Describes a sensor derived from a vehicle's fuel history."""
+
+    value_fn: Callable[[FuelStats], float | None]
+    unit_fn: Callable[[ConfigEntry], str]
+    # How far back the figure needs records; None when the window suffices
+    history: HistoryNeed | None = None
+    # Start of the period a TOTAL sensor counts from, given the time now
+    reset_fn: Callable[[datetime], datetime] | None = None
+
+
+FUEL_SENSORS: tuple[LubeLoggerFuelSensorDescription, ...] = (
+    LubeLoggerFuelSensorDescription(
+        key="fuel_economy",
+        name="Fuel Economy",
+        icon="mdi:gas-station",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.last_economy,
+        unit_fn=_economy_unit,
+    ),
+    *(
+        LubeLoggerFuelSensorDescription(
+            key=f"fuel_economy_{window}d",
+            name=f"Fuel Economy {window}d",
+            icon="mdi:gas-station",
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda stats, window=window: (stats.rolling_economy or {}).get(window),
+            unit_fn=_economy_unit,
+            history=days_back(window),
+        )
+        for window in ROLLING_WINDOWS
+    ),
+    LubeLoggerFuelSensorDescription(
+        key="fuel_cost_per_distance",
+        name="Fuel Cost Per Distance",
+        icon="mdi:cash",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.cost_per_distance,
+        unit_fn=_cost_per_distance_unit,
+        history=full_history,
+    ),
+    LubeLoggerFuelSensorDescription(
+        key="fuel_spend_month",
+        name="Fuel Spend This Month",
+        icon="mdi:cash-multiple",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        reset_fn=start_of_month,
+        value_fn=lambda stats: stats.month_spend,
+        unit_fn=_currency_unit,
+    ),
+)
+
+
+class LubeLoggerFuelSensor(LubeLoggerVehicleEntity, SensorEntity):
+    """Fuel economy or cost metric for a LubeLogger vehicle."""
+
+    entity_description: LubeLoggerFuelSensorDescription
+    _attr_primary = False
+
+    def __init__(
+        self,
+        coordinator: LubeLoggerDataUpdateCoordinator,
+        vehicle_id: int,
+        description: LubeLoggerFuelSensorDescription,
+    ):
+        super().__init__(coordinator, vehicle_id)
+        self.entity_description = description
+
+        self._attr_unique_id = (
+            f"{self._entry.entry_id}_vehicle_{vehicle_id}_{description.key}"
+        )
+        self._attr_name = f"{self._vehicle_name} {description.name}"
+        self._attr_native_unit_of_measurement = description.unit_fn(self._entry)
+        if description.history is not None:
+            self._history_kinds = (RECORD_FUEL,)
+
+    def _history_needed(self, today: date) -> date | None:
+        return self.entity_description.history(today)
+
+    @property
+    def native_value(self) -> float | None:
+        data = self.vehicle_data
+        if data is None or data.fuel_stats is None:
+            return None
+        return self.entity_description.value_fn(data.fuel_stats)
+
+    @property
+    def last_reset(self) -> datetime | None:
+        reset_fn = self.entity_description.reset_fn
+        return reset_fn(dt_util.now()) if reset_fn else None
+
+    @property
+    def extra_state_attributes(self):
+        data = self.vehicle_data
+        stats = data.fuel_stats if data else None
+        if stats is None:
+            return None
+        return {
+            "fill_ups": stats.fill_ups,
+            "total_fuel": stats.total_fuel,
+            "total_cost": stats.total_cost,
+        }
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+
+from ..analytics import ServiceForecast
+from ..backfill import full_history
+from ..coordinator import LubeLoggerDataUpdateCoordinator
+from ..sync import RECORD_SERVICE
+from .entity import LubeLoggerVehicleEntity
+
+
+@dataclass(frozen=True, kw_only=True)
+class LubeLoggerServiceDueSensorDescription(SensorEntityDescription):
+    """Describes a sensor derived from a vehicle's service forecast."""
+
+    value_fn: Callable[[ServiceForecast], float | date | None]
+    unit_fn: Callable[[ConfigEntry], str | None] = lambda entry: None
+    # Whether the value depends on the last service, however old
+    last_service: bool = True
+
+
+SERVICE_DUE_SENSORS: tuple[LubeLoggerServiceDueSensorDescription, ...] = (
+    LubeLoggerServiceDueSensorDescription(
+        key="next_service_date",
+        name="Next Service Date",
+        icon="mdi:calendar-wrench",
+        device_class=SensorDeviceClass.DATE,
+        value_fn=lambda forecast: forecast.due_date,
+    ),
+    LubeLoggerServiceDueSensorDescription(
+        key="next_service_odometer",
+        name="Next Service Odometer",
+        icon="mdi:wrench-clock",
+        value_fn=lambda forecast: forecast.due_odometer,
+        unit_fn=lambda entry: entry.options.get("odometer_unit", "mi"),
+    ),
+    LubeLoggerServiceDueSensorDescription(
+        key="daily_distance",
+        name="Daily Distance",
+        icon="mdi:map-marker-distance",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda forecast: forecast.daily_distance,
+        unit_fn=lambda entry: f"{entry.options.get('odometer_unit', 'mi')}/d",
+        last_service=False,
+    ),
+)
+
+
+class LubeLoggerServiceDueSensor(LubeLoggerVehicleEntity, SensorEntity):
+    """Predicted next service for a LubeLogger vehicle."""
+
+    entity_description: LubeLoggerServiceDueSensorDescription
+    _attr_primary = False
+
+    def __init__(
+        self,
+        coordinator: LubeLoggerDataUpdateCoordinator,
+        vehicle_id: int,
+        description: LubeLoggerServiceDueSensorDescription,
+    ):
+        super().__init__(coordinator, vehicle_id)
+        self.entity_description = description
+
+        self._attr_unique_id = (
+            f"{self._entry.entry_id}_vehicle_{vehicle_id}_{description.key}"
+        )
+        self._attr_name = f"{self._vehicle_name} {description.name}"
+        self._attr_native_unit_of_measurement = description.unit_fn(self._entry)
+        if description.last_service:
+            self._history_kinds = (RECORD_SERVICE,)
+
+    def _history_needed(self, today: date) -> date | None:
+        # Older history only matters while the window holds no service
+        if self.coordinator.sync.index(self._vehicle_id, RECORD_SERVICE).latest():
+            return None
+        return full_history(today)
+
+    @property
+    def _forecast(self) -> ServiceForecast | None:
+        data = self.vehicle_data
+        return data.service_forecast if data else None
+
+    @property
+    def native_value(self) -> float | date | None:
+        forecast = self._forecast
+        if forecast is None:
+            return None
+        return self.entity_description.value_fn(forecast)
+
+    @property
+    def extra_state_attributes(self):
+        forecast = self._forecast
+        if forecast is None:
+            return None
+        return {
+            "last_service_date": forecast.last_service_date,
+            "last_service_odometer": forecast.last_service_odometer,
+            "due_by": forecast.due_by,
+            "overdue": forecast.overdue,
+        }
@@ -1,15 +1,31 @@
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime
 
+from homeassistant.util import dt as dt_util
+
+from ..api.models import Vehicle
+from ..const import DOMAIN
 
-def build_vehicle_name(vehicle: dict[str, Any]) -> str:
-    """Create a readable vehicle name."""
-    year = vehicle.get("year")
-    make = vehicle.get("make", "")
-    model = vehicle.get("model", "")
 
-    parts = [str(year) if year else None, make, model]
+def build_vehicle_name(vehicle: Vehicle) -> str:
+    """Create a readable vehicle name."""
+    parts = [str(vehicle.year) if vehicle.year else None, vehicle.make, vehicle.model]
     name = " ".join(p for p in parts if p)
 
-    return name or f"Vehicle {vehicle['id']}"
+    return name or f"Vehicle {vehicle.id}"
+
+
+def vehicle_device_identifier(entry_id: str, vehicle_id: int) -> tuple[str, str]:
+    """Device registry identifier; vehicle ids are only unique per server."""
+    return (DOMAIN, f"{entry_id}_vehicle_{vehicle_id}")
+
+
+def start_of_month(now: datetime) -> datetime:
+    """Local midnight on the first of now's month, for last_reset."""
+    return dt_util.start_of_local_day(now.date().replace(day=1))
+
+
+def start_of_year(now: datetime) -> datetime:
+    """Local midnight on January 1 of now's year, for last_reset."""
+    return dt_util.start_of_local_day(now.date().replace(month=1, day=1))
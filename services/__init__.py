@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from . import odometer, service_records, fuel
+from homeassistant.core import HomeAssistant
 
+from . import odometer, service_records, fuel, refresh, bulk_import, profile
 
-async def async_register_services(hass, entry, api):
-    await odometer.register(hass, entry, api)
-    await service_records.register(hass, entry, api)
-    await fuel.register(hass, entry, api)
+
+async def async_register_services(hass: HomeAssistant) -> None:
+    """Register the services shared by every LubeLogger config entry."""
+    await odometer.register(hass)
+    await service_records.register(hass)
+    await fuel.register(hass)
+    await refresh.register(hass)
+    await bulk_import.register(hass)
+    await profile.register(hass)
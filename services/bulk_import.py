@@ -0,0 +1,36 @@
+from __future__ import annotations
+import os
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from ..const import DOMAIN
+from ..bulk_import import FORMAT_CSV, FORMAT_JSONL
+from ..routing import async_get_router
+
+
+async def register(hass: HomeAssistant):
+
+    async def handle_import(call: ServiceCall):
+        target = async_get_router(hass).resolve_one(call)
+        path = call.data["path"]
+        kind = call.data["record_type"]
+        file_format = call.data.get("format")
+
+        if kind not in ("odometer", "fuel", "service"):
+            raise HomeAssistantError(f"Unknown record type {kind}")
+        if file_format not in (None, FORMAT_CSV, FORMAT_JSONL):
+            raise HomeAssistantError(f"Unknown file format {file_format}")
+        if not hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Access to {path} is not allowed")
+        if not await hass.async_add_executor_job(os.path.isfile, path):
+            raise HomeAssistantError(f"{path} does not exist")
+
+        # Runs in the background; progress is reported through events
+        await target.data.importer.async_start(
+            target.vehicle_id, kind, path, file_format
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        "bulk_import",
+        handle_import,
+    )
@@ -1,18 +1,18 @@
 from __future__ import annotations
 from homeassistant.core import HomeAssistant, ServiceCall
 from ..const import DOMAIN
+from ..outbox import WRITE_FUEL
+from ..routing import async_get_router
 
 
-async def register(hass: HomeAssistant, entry, api):
+async def register(hass: HomeAssistant):
 
     async def handle_add(call: ServiceCall):
-        entity_id = call.data["entity_id"]
-        data = call.data["data"]
+        target = async_get_router(hass).resolve_one(call)
+        payload = call.data["data"]
 
-        state = hass.states.get(entity_id)
-        vehicle_id = state.attributes.get("vehicle_id")
-
-        await api.fuel.add(vehicle_id, data)
+        # Queued and sent in the background; the call returns immediately
+        await target.data.outbox.async_enqueue(WRITE_FUEL, target.vehicle_id, payload)
 
     hass.services.async_register(
         DOMAIN,
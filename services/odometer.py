@@ -1,19 +1,21 @@
 from __future__ import annotations
 from homeassistant.core import HomeAssistant, ServiceCall
 from ..const import DOMAIN
+from ..outbox import WRITE_ODOMETER
+from ..routing import async_get_router
 
 
-async def register(hass: HomeAssistant, entry, api):
+async def register(hass: HomeAssistant):
 
     async def handle_add(call: ServiceCall):
-        entity_id = call.data["entity_id"]
+        target = async_get_router(hass).resolve_one(call)
         value = call.data["value"]
         date = call.data["date"]
 
-        state = hass.states.get(entity_id)
-        vehicle_id = state.attributes.get("vehicle_id")
-
-        await api.odometer.add(vehicle_id, value, date)
+        # Queued and sent in the background; the call returns immediately
+        await target.data.outbox.async_enqueue(
+            WRITE_ODOMETER, target.vehicle_id, {"odometer": value, "date": date}
+        )
 
     hass.services.async_register(
         DOMAIN,
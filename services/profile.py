@@ -0,0 +1,23 @@
+from __future__ import annotations
+from homeassistant.core import HomeAssistant, ServiceCall
+from ..const import DOMAIN
+from ..profiling import DEFAULT_PROFILE_SECONDS, async_profile
+
+
+async def register(hass: HomeAssistant):
+
+    async def handle_profile(call: ServiceCall):
+        # Blocks for the whole window; the report path is logged and fired
+        # as a lubelogger_profile_finished event
+        await async_profile(
+            hass,
+            seconds=float(call.data.get("duration", DEFAULT_PROFILE_SECONDS)),
+            refresh=call.data.get("refresh", True),
+            include_setup=call.data.get("include_setup", False),
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        "profile",
+        handle_profile,
+    )
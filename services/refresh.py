@@ -0,0 +1,41 @@
+from __future__ import annotations
+from homeassistant.core import HomeAssistant, ServiceCall
+from ..api import PRIORITY_INTERACTIVE, request_priority
+from ..const import DOMAIN
+from ..routing import async_get_router
+
+
+async def register(hass: HomeAssistant):
+
+    async def handle_refresh(call: ServiceCall):
+        # Someone is waiting on this one; queue it before background polls
+        with request_priority(PRIORITY_INTERACTIVE):
+            await _refresh(call)
+
+    async def _refresh(call: ServiceCall):
+        targets = async_get_router(hass).resolve_call(call)
+        full_history = call.data.get("full_history", False)
+
+        if not targets:
+            # No selection refreshes every vehicle of every entry
+            for data in list(hass.data.get(DOMAIN, {}).values()):
+                await data.coordinator.async_refresh_vehicles(
+                    full_history=full_history
+                )
+            return
+
+        by_entry: dict[str, tuple[object, list[int]]] = {}
+        for target in targets:
+            by_entry.setdefault(target.entry_id, (target.data, []))[1].append(
+                target.vehicle_id
+            )
+
+        # Bypasses the adaptive poll schedule for the selected vehicles
+        for data, vehicle_ids in by_entry.values():
+            await data.coordinator.async_refresh_vehicles(vehicle_ids, full_history)
+
+    hass.services.async_register(
+        DOMAIN,
+        "refresh",
+        handle_refresh,
+    )
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, fields
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .analytics import CostStats, FuelStats, ServiceForecast
+from .api.models import Vehicle
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import VehicleData
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+
+def _dump(value: Any) -> dict[str, Any] | None:
+    if value is None:
+        return None
+    return {
+        key: item.isoformat() if isinstance(item, date) else item
+        for key, item in asdict(value).items()
+    }
+
+
+def _load_stats(raw: dict[str, Any] | None) -> FuelStats | None:
+    if raw is None:
+        return None
+    stats = FuelStats(**raw)
+    if stats.rolling_economy is not None:
+        # JSON turned the window lengths into strings
+        stats.rolling_economy = {
+            int(window): value for window, value in stats.rolling_economy.items()
+        }
+    return stats
+
+
+def _load_forecast(raw: dict[str, Any] | None) -> ServiceForecast | None:
+    if raw is None:
+        return None
+    forecast = ServiceForecast(**raw)
+    for f in fields(forecast):
+        value = getattr(forecast, f.name)
+        if f.name.endswith("_date") and isinstance(value, str):
+            setattr(forecast, f.name, date.fromisoformat(value))
+    return forecast
+
+
+class VehicleSnapshotStore:
+    """Last known fleet data for one config entry, kept on disk.
+
+    Lets entities be created and show their last values straight away at
+    startup while the first refresh from LubeLogger runs in the
+    background.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+        self._data: dict[int, VehicleData] = {}
+
+    async def async_load(self) -> list[dict[str, Any]]:
+        """Return the stored VehicleData fields for every vehicle."""
+        stored = await self._store.async_load() or {}
+        vehicles = []
+
+        for raw in stored.get("vehicles", []):
+            try:
+                vehicles.append(
+                    {
+                        "vehicle": Vehicle.from_json(raw["vehicle"]),
+                        "odometer": raw.get("odometer"),
+                        "fuel_stats": _load_stats(raw.get("fuel_stats")),
+                        "service_forecast": _load_forecast(
+                            raw.get("service_forecast")
+                        ),
+                        "cost_stats": (
+                            CostStats(**raw["cost_stats"])
+                            if raw.get("cost_stats")
+                            else None
+                        ),
+                    }
+                )
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.debug("LubeLogger: Skipping unreadable snapshot entry: %s", err)
+
+        return vehicles
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    @callback
+    def save(self, data: dict[int, VehicleData]) -> None:
+        """Schedule saving the latest fleet data."""
+        self._data = data
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "vehicles": [
+                {
+                    "vehicle": vehicle_data.vehicle.as_dict(),
+                    "odometer": vehicle_data.odometer,
+                    "fuel_stats": _dump(vehicle_data.fuel_stats),
+                    "service_forecast": _dump(vehicle_data.service_forecast),
+                    "cost_stats": _dump(vehicle_data.cost_stats),
+                }
+                for vehicle_data in self._data.values()
+            ]
+        }
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import bisect
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, AsyncIterable, Iterable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .api.models import FuelRecord, HistoryRecord, OdometerRecord, ServiceRecord
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+RECORD_FUEL = "fuel"
+RECORD_SERVICE = "service"
+RECORD_ODOMETER = "odometer"
+RECORD_KINDS = (RECORD_FUEL, RECORD_SERVICE, RECORD_ODOMETER)
+
+# Kinds whose listings can be fetched by date window, and how many days
+# back a regular refresh reaches for them
+WINDOWED_KINDS = RECORD_KINDS
+RECENT_WINDOW_DAYS = 120
+
+# Stands for "complete history" in RecordIndex.covered_from
+FULL_HISTORY = date.min
+
+RECORD_MODELS = {
+    RECORD_FUEL: FuelRecord,
+    RECORD_SERVICE: ServiceRecord,
+    RECORD_ODOMETER: OdometerRecord,
+}
+
+
+def _record_id(record: HistoryRecord, fingerprint: str) -> str:
+    if record.id is None:
+        # Older LubeLogger versions omit ids; fall back to the content hash
+        return f"h:{fingerprint}"
+    return str(record.id)
+
+
+@dataclass
+class SyncDelta:
+    """Records added, changed or removed by one sync of a vehicle."""
+
+    added: list[HistoryRecord] = field(default_factory=list)
+    changed: list[tuple[HistoryRecord, HistoryRecord]] = field(default_factory=list)
+    removed: list[HistoryRecord] = field(default_factory=list)
+    # True when everything added is dated on or after the previous newest record
+    append_only: bool = True
+    # An earlier sync was interrupted, so consumers must rebuild from the index
+    rebuild: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed or self.rebuild)
+
+
+class RecordIndex:
+    """Records of one kind for one vehicle, indexed by id and by date."""
+
+    def __init__(self):
+        self.by_id: dict[str, HistoryRecord] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._order: list[tuple[int, str]] = []
+        # Stored form of the records, kept until they change
+        self._saved: list[dict[str, Any]] | None = None
+        self._interrupted = False
+        # Oldest date from which the index mirrors the server; FULL_HISTORY
+        # once every record was seen, None before the first sync
+        self.covered_from: date | None = None
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    @staticmethod
+    def _sort_key(record_id: str, record: HistoryRecord) -> tuple[int, str]:
+        return (record.date.toordinal() if record.date else 0, record_id)
+
+    @property
+    def newest_date(self) -> date | None:
+        if not self._order or self._order[-1][0] == 0:
+            return None
+        return date.fromordinal(self._order[-1][0])
+
+    def records(self) -> list[HistoryRecord]:
+        """Return all records ordered by date."""
+        return [self.by_id[record_id] for _, record_id in self._order]
+
+    def latest(self) -> HistoryRecord | None:
+        """Return the newest record, or None when empty."""
+        if not self._order:
+            return None
+        return self.by_id[self._order[-1][1]]
+
+    def since(self, day: date) -> list[HistoryRecord]:
+        """Return records dated on or after day, ordered by date."""
+        start = bisect.bisect_left(self._order, (day.toordinal(), ""))
+        return [self.by_id[record_id] for _, record_id in self._order[start:]]
+
+    def require_rebuild(self) -> None:
+        """Make the next sync tell consumers to rebuild from the index."""
+        self._interrupted = True
+
+    def as_saved(self) -> list[dict[str, Any]]:
+        """Return the records in stored form, serialized once per change."""
+        if self._saved is None:
+            self._saved = [record.as_dict() for record in self.by_id.values()]
+        return self._saved
+
+    def _insert(self, record_id: str, record: HistoryRecord, fingerprint: str) -> None:
+        self._saved = None
+        self.by_id[record_id] = record
+        self._fingerprints[record_id] = fingerprint
+        bisect.insort(self._order, self._sort_key(record_id, record))
+
+    def _remove(self, record_id: str) -> HistoryRecord:
+        self._saved = None
+        record = self.by_id.pop(record_id)
+        del self._fingerprints[record_id]
+        key = self._sort_key(record_id, record)
+        pos = bisect.bisect_left(self._order, key)
+        if pos < len(self._order) and self._order[pos] == key:
+            del self._order[pos]
+        return record
+
+    def load(self, records: Iterable[HistoryRecord]) -> None:
+        for record in records:
+            fingerprint = record.fingerprint()
+            self._insert(_record_id(record, fingerprint), record, fingerprint)
+
+    async def async_reconcile(
+        self,
+        records: AsyncIterable[HistoryRecord],
+        start: date | None = None,
+        end: date | None = None,
+    ) -> SyncDelta:
+        """Merge a streamed record listing, one record at a time.
+
+        With a start or end the listing only covers that date window
+        (inclusive), so records outside it are left alone rather than
+        treated as deleted.
+        """
+        delta, seen, newest = self._begin()
+        try:
+            async for record in records:
+                self._merge(record, delta, seen, newest)
+        except BaseException:
+            # Records merged so far stay, but nobody saw their delta
+            self._interrupted = True
+            raise
+
+        window = start or FULL_HISTORY
+        if self.covered_from is None or window < self.covered_from:
+            self.covered_from = window
+        return self._finish(delta, seen, start, end)
+
+    def _ids_between(self, start: date | None, end: date | None) -> list[str]:
+        """Ids of the records a listing from start to end would contain.
+
+        Undated records only belong to listings without a start. Found by
+        bisecting the date order, so a windowed sync only looks at the
+        records inside its window.
+        """
+        order = self._order
+        low = 0 if start is None else bisect.bisect_left(order, (start.toordinal(), ""))
+        high = len(order)
+        if end is not None:
+            high = bisect.bisect_left(order, (end.toordinal() + 1, ""), low)
+        return [record_id for _, record_id in order[low:high]]
+
+    def _begin(self) -> tuple[SyncDelta, set[str], int]:
+        newest = self._order[-1][0] if self._order else 0
+        delta = SyncDelta()
+        if self._interrupted:
+            delta.rebuild = True
+            delta.append_only = False
+        return delta, set(), newest
+
+    def _merge(
+        self,
+        record: HistoryRecord,
+        delta: SyncDelta,
+        seen: set[str],
+        newest: int,
+    ) -> None:
+        fingerprint = record.fingerprint()
+        record_id = _record_id(record, fingerprint)
+        seen.add(record_id)
+
+        old_fingerprint = self._fingerprints.get(record_id)
+        if old_fingerprint == fingerprint:
+            return
+
+        if old_fingerprint is None:
+            self._insert(record_id, record, fingerprint)
+            delta.added.append(record)
+            if self._sort_key(record_id, record)[0] < newest:
+                delta.append_only = False
+        else:
+            old = self._remove(record_id)
+            self._insert(record_id, record, fingerprint)
+            delta.changed.append((old, record))
+            delta.append_only = False
+
+    def _finish(
+        self,
+        delta: SyncDelta,
+        seen: set[str],
+        start: date | None = None,
+        end: date | None = None,
+    ) -> SyncDelta:
+        for record_id in self._ids_between(start, end):
+            if record_id in seen:
+                continue
+            delta.removed.append(self._remove(record_id))
+            delta.append_only = False
+        self._interrupted = False
+        return delta
+
+
+class RecordSyncEngine:
+    """Keep each vehicle's fuel, service and odometer history in local storage.
+
+    Server listings are reconciled against the stored index, so only new,
+    changed and deleted records produce work downstream, and sensors read
+    the merged view instead of re-downloading history.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, day_first: bool = False):
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.records"
+        )
+        self._indexes: dict[int, dict[str, RecordIndex]] = {}
+        self.day_first = day_first
+        # Stored records were dated in another order and must be re-read
+        self.needs_full_sync = False
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load() or {}
+        # Stores written before windowed fetching only held full listings
+        coverage = stored.get("coverage")
+        if stored and stored.get("day_first", False) != self.day_first:
+            self.needs_full_sync = True
+
+        for vehicle_id, kinds in stored.get("vehicles", {}).items():
+            for kind, records in kinds.items():
+                model = RECORD_MODELS.get(kind)
+                if model is None:
+                    continue
+                index = self.index(int(vehicle_id), kind)
+                index.load(model.from_json(record) for record in records)
+
+                if coverage is None:
+                    index.covered_from = FULL_HISTORY
+                elif covered := coverage.get(vehicle_id, {}).get(kind):
+                    index.covered_from = date.fromisoformat(covered)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def index(self, vehicle_id: int, kind: str) -> RecordIndex:
+        kinds = self._indexes.setdefault(vehicle_id, {})
+        if kind not in kinds:
+            kinds[kind] = RecordIndex()
+        return kinds[kind]
+
+    def records(self, vehicle_id: int, kind: str) -> list[HistoryRecord]:
+        """Return the merged, date-ordered view of a vehicle's records."""
+        return self.index(vehicle_id, kind).records()
+
+    def mark_complete(self, vehicle_id: int, kind: str) -> None:
+        """Record that the stored history of a kind has no older records."""
+        self.index(vehicle_id, kind).covered_from = FULL_HISTORY
+        self._schedule_save()
+
+    async def async_apply_stream(
+        self,
+        vehicle_id: int,
+        kind: str,
+        records: AsyncIterable[HistoryRecord],
+        start: date | None = None,
+        end: date | None = None,
+    ) -> SyncDelta:
+        """Reconcile a streamed server listing without buffering it."""
+        index = self.index(vehicle_id, kind)
+        covered = index.covered_from
+        delta = await index.async_reconcile(records, start, end)
+        self._after_sync(vehicle_id, kind, delta)
+        if not delta and index.covered_from != covered:
+            self._schedule_save()
+        return delta
+
+    def _after_sync(self, vehicle_id: int, kind: str, delta: SyncDelta) -> None:
+        if delta:
+            _LOGGER.debug(
+                "LubeLogger: Vehicle %s %s records: +%s ~%s -%s",
+                vehicle_id,
+                kind,
+                len(delta.added),
+                len(delta.changed),
+                len(delta.removed),
+            )
+            self._schedule_save()
+
+    def prune(self, vehicle_ids: Iterable[int]) -> None:
+        """Forget vehicles that no longer exist on the server."""
+        keep = set(vehicle_ids)
+        stale = [vid for vid in self._indexes if vid not in keep]
+
+        for vehicle_id in stale:
+            del self._indexes[vehicle_id]
+
+        if stale:
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "day_first": self.day_first,
+            "vehicles": {
+                str(vehicle_id): {
+                    kind: index.as_saved()
+                    for kind, index in kinds.items()
+                }
+                for vehicle_id, kinds in self._indexes.items()
+            },
+            "coverage": {
+                str(vehicle_id): {
+                    kind: index.covered_from.isoformat()
+                    for kind, index in kinds.items()
+                    if index.covered_from is not None
+                }
+                for vehicle_id, kinds in self._indexes.items()
+            },
+        }
@@ -0,0 +1,33 @@
+"""Make the integration's pure modules importable without Home Assistant.
+
+The repository root is the integration package and its __init__ needs
+Home Assistant, so it is registered without running it, as
+benchmarks/common.py does. pytest also sets up the root as a package,
+under the checkout directory's name, and finds it registered. Without
+aiohttp the api package is registered the same way, leaving the modules
+that do not need it importable.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ROOT_PACKAGE = "lubelogger"
+
+
+def _register(name: str, path: Path) -> None:
+    package = types.ModuleType(name)
+    package.__path__ = [str(path)]
+    sys.modules.setdefault(name, package)
+
+
+_register(ROOT_PACKAGE, REPO_ROOT)
+sys.modules.setdefault(REPO_ROOT.name, sys.modules[ROOT_PACKAGE])
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    _register(f"{ROOT_PACKAGE}.api", REPO_ROOT / "api")
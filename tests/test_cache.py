@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from lubelogger.api.cache import (
+    ResponseCache,
+    bypass_cache,
+    cache_bypassed,
+    split_path,
+)
+
+VEHICLES = ("GET", "/api/vehicles")
+FUEL_1 = ("GET", "/api/vehicle/fuelrecords/list?vehicleId=1")
+SERVICE_1 = ("GET", "/api/vehicle/servicerecords/list?vehicleId=1")
+FUEL_2 = ("GET", "/api/vehicle/fuelrecords/list?vehicleId=2")
+
+
+def test_split_path():
+    assert split_path(FUEL_1[1]) == ("/api/vehicle/fuelrecords/list", "1")
+    assert split_path("/api/vehicle/get?id=4") == ("/api/vehicle/get", "4")
+    assert split_path(VEHICLES[1]) == ("/api/vehicles", None)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.put(VEHICLES, [], 10)
+    cache.put(FUEL_1, [], 10)
+    assert cache.get(VEHICLES) is not None
+
+    cache.put(FUEL_2, [], 10)
+    assert cache.get(FUEL_1) is None
+    assert cache.get(VEHICLES) is not None
+    assert cache.evictions == 1
+
+
+def test_size_bound():
+    cache = ResponseCache(max_bytes=100)
+    cache.put(VEHICLES, [], 60)
+    cache.put(FUEL_1, [], 60)
+    assert cache.get(VEHICLES) is None
+    assert cache.as_dict()["bytes"] == 60
+
+    # Larger than the whole cache: not stored at all
+    cache.put(FUEL_2, [], 101)
+    assert cache.get(FUEL_2) is None
+
+
+def test_entries_expire_and_keep_validators():
+    cache = ResponseCache(ttls={"/api/vehicles": 0})
+    cache.put(VEHICLES, [], 10, etag='"v1"')
+    assert cache.get(VEHICLES) is None
+
+    cache = ResponseCache(ttls={"/api/vehicles": 60})
+    cache.put(VEHICLES, [], 10, etag='"v1"')
+    entry = cache.get(VEHICLES)
+    assert entry.fresh and entry.revalidatable
+
+    entry.expires = 0
+    assert not cache.get(VEHICLES).fresh
+    assert cache.refresh(VEHICLES).fresh
+    assert cache.revalidations == 1
+
+
+def test_invalidate_vehicle():
+    cache = ResponseCache()
+    for key in (VEHICLES, FUEL_1, SERVICE_1, FUEL_2):
+        cache.put(key, [], 10)
+
+    cache.invalidate_vehicle(1)
+    assert cache.get(FUEL_1) is None and cache.get(SERVICE_1) is None
+    assert cache.get(FUEL_2) is not None and cache.get(VEHICLES) is not None
+
+
+def test_bypass_is_scoped_to_the_block():
+    assert not cache_bypassed()
+    with bypass_cache():
+        assert cache_bypassed()
+        with bypass_cache(False):
+            assert not cache_bypassed()
+        assert cache_bypassed()
+    assert not cache_bypassed()
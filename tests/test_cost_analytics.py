@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import date
+
+from lubelogger.analytics import CostAggregates
+from lubelogger.api.models import FuelRecord, ServiceRecord
+
+
+def _fill(day, odometer, cost):
+    return FuelRecord(id=None, date=day, odometer=odometer, cost=cost)
+
+
+JAN_FILL = _fill(date(2024, 1, 1), 1000, 60)
+MAR_FILL = _fill(date(2024, 3, 1), 1800, 30)
+
+SERVICES = [
+    ServiceRecord(id=1, date=date(2023, 12, 20), odometer=900, cost=100),
+    ServiceRecord(id=2, date=date(2024, 3, 5), odometer=1750, cost=200),
+]
+
+
+def test_cost_totals_by_period():
+    costs = CostAggregates()
+    costs.rebuild([JAN_FILL, MAR_FILL], SERVICES)
+    stats = costs.stats(date(2024, 3, 10), 1900)
+
+    assert stats.total == 390.0
+    assert stats.month == 230.0
+    assert (stats.fuel_ytd, stats.service_ytd, stats.ytd) == (90.0, 200.0, 290.0)
+    assert stats.distance == 1000.0
+    assert stats.cost_per_distance == 0.39
+
+
+def test_cost_changes_apply_in_place():
+    costs = CostAggregates()
+    costs.rebuild([JAN_FILL], SERVICES)
+
+    edited = ServiceRecord(id=2, date=date(2024, 3, 5), odometer=1750, cost=250)
+    costs.apply(added=[edited], removed=[SERVICES[1]])
+    assert costs.stats(date(2024, 3, 10), None).service_total == 350.0
+    assert not costs.stale
+
+    # The lowest reading cannot be un-applied without a rescan
+    costs.apply(removed=[SERVICES[0]])
+    assert costs.stale
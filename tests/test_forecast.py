@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import date
+
+from lubelogger.analytics import OdometerTrend, predict_service
+from lubelogger.api.models import OdometerRecord, ServiceRecord
+
+
+def _readings(*points):
+    return [
+        OdometerRecord(id=None, date=day, odometer=odometer) for day, odometer in points
+    ]
+
+
+def test_trend_ignores_a_single_backwards_reading():
+    trend = OdometerTrend()
+    trend.extend(
+        _readings(
+            (date(2024, 1, 1), 1000),
+            (date(2024, 1, 11), 1100),
+            (date(2024, 1, 21), 1200),
+            (date(2024, 1, 31), 1300),
+            (date(2024, 2, 5), 1250),
+        )
+    )
+    assert trend.daily_distance == 10.0
+    assert trend.last_odometer == 1300
+
+
+def test_service_falls_due_by_distance_or_time():
+    trend = OdometerTrend()
+    trend.extend(
+        _readings(
+            (date(2024, 1, 1), 1000),
+            (date(2024, 1, 11), 1100),
+            (date(2024, 1, 21), 1200),
+            (date(2024, 1, 31), 1300),
+        )
+    )
+    last = ServiceRecord(id=1, date=date(2024, 1, 1), odometer=1000)
+    today = date(2024, 1, 31)
+
+    forecast = predict_service(trend, last, 1300, today, 1000, 365)
+    assert forecast.due_odometer == 2000
+    assert (forecast.due_date, forecast.due_by) == (date(2024, 4, 10), "distance")
+    assert not forecast.overdue
+
+    forecast = predict_service(trend, last, 1300, today, 1000, 30)
+    assert (forecast.due_date, forecast.due_by) == (date(2024, 1, 31), "time")
+
+    forecast = predict_service(trend, last, 2100, today, 1000, 365)
+    assert forecast.due_date == today and forecast.overdue
+
+
+def test_no_forecast_without_a_service():
+    forecast = predict_service(OdometerTrend(), None, 1000, date(2024, 1, 1), 1000, 365)
+    assert forecast.due_date is None and forecast.last_service_date is None
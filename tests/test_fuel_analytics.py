@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import date
+
+from lubelogger.analytics import FuelAnalytics
+from lubelogger.api.models import FuelRecord
+
+
+def _fill(day, odometer, fuel, cost, full=True, missed=False):
+    return FuelRecord(
+        id=None,
+        date=day,
+        odometer=odometer,
+        fuel_consumed=fuel,
+        cost=cost,
+        is_fill_to_full=full,
+        missed_fuel_up=missed,
+    )
+
+
+FILLS = [
+    _fill(date(2024, 1, 1), 1000, 40, 60),
+    _fill(date(2024, 1, 15), 1200, 10, 15, full=False),
+    _fill(date(2024, 2, 1), 1500, 20, 30),
+    _fill(date(2024, 3, 1), 1800, 20, 30),
+]
+
+
+def test_fuel_economy_spans_partial_fills():
+    engine = FuelAnalytics()
+    engine.extend(FILLS)
+    stats = engine.stats(date(2024, 3, 10))
+
+    assert stats.fill_ups == 4
+    assert stats.last_economy == 15.0
+    assert stats.rolling_economy == {30: 15.0, 90: 16.0, 365: 16.0}
+    assert stats.cost_per_distance == 0.169
+    assert stats.month_spend == 30.0
+    assert stats.total_cost == 135.0
+    assert stats.total_fuel == 90.0
+
+
+def test_missed_fill_up_restarts_the_chain():
+    engine = FuelAnalytics()
+    engine.extend(
+        [
+            _fill(date(2024, 1, 1), 1000, 40, 60),
+            _fill(date(2024, 1, 10), 1300, 20, 30, missed=True),
+            _fill(date(2024, 1, 20), 1600, 20, 30),
+        ]
+    )
+    assert engine.last_economy() == 15.0
+    assert engine.rolling_economy(date(2024, 1, 20), 365) == 15.0
+
+
+def test_rebuild_matches_incremental_extend():
+    incremental = FuelAnalytics()
+    for record in FILLS:
+        incremental.extend([record])
+
+    rebuilt = FuelAnalytics()
+    rebuilt.extend(FILLS[:2])
+    rebuilt.rebuild(FILLS)
+
+    today = date(2024, 3, 10)
+    assert rebuilt.stats(today) == incremental.stats(today)
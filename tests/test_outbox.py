@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+pytest.importorskip("homeassistant")
+
+from lubelogger.api import ResponseDecodeError  # noqa: E402
+from lubelogger.outbox import (  # noqa: E402
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+    WRITE_FUEL,
+    WRITE_ODOMETER,
+    OutboxItem,
+    _backoff,
+    is_permanent_failure,
+)
+
+
+def _http_error(status: int) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(None, (), status=status, message="error")
+
+
+@pytest.mark.parametrize(
+    ("err", "permanent"),
+    [
+        (ValueError("Unknown write kind"), True),
+        (KeyError("odometer"), True),
+        (_http_error(400), True),
+        (_http_error(404), True),
+        (_http_error(408), False),
+        (_http_error(429), False),
+        (_http_error(500), False),
+        (asyncio.TimeoutError(), False),
+        (aiohttp.ClientConnectionError(), False),
+        # The write was accepted; only its response was unreadable
+        (ResponseDecodeError("Invalid JSON response"), False),
+    ],
+)
+def test_permanent_failures(err, permanent):
+    assert is_permanent_failure(err) is permanent
+
+
+def test_odometer_readings_coalesce_per_vehicle_and_day():
+    first = OutboxItem(WRITE_ODOMETER, 1, {"odometer": 100, "date": "2024-01-01"})
+    second = OutboxItem(WRITE_ODOMETER, 1, {"odometer": 110, "date": "2024-01-01"})
+    other = OutboxItem(WRITE_ODOMETER, 2, {"odometer": 110, "date": "2024-01-01"})
+
+    assert first.coalesce_key == second.coalesce_key
+    assert first.coalesce_key != other.coalesce_key
+    assert OutboxItem(WRITE_FUEL, 1, {"date": "2024-01-01"}).coalesce_key is None
+
+
+def test_backoff_grows_to_the_cap():
+    assert BACKOFF_BASE / 2 <= _backoff(1) <= BACKOFF_BASE
+    assert BACKOFF_MAX / 2 <= _backoff(30) <= BACKOFF_MAX
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+
+from lubelogger.api.models import FuelRecord
+from lubelogger.api.parsing import parse_bool, parse_date, parse_float
+
+
+@pytest.mark.parametrize(
+    ("value", "day_first", "expected"),
+    [
+        ("2024-04-13", False, date(2024, 4, 13)),
+        ("2024-04-13T08:30:00", True, date(2024, 4, 13)),
+        ("04/13/2024", False, date(2024, 4, 13)),
+        ("13/04/2024", True, date(2024, 4, 13)),
+        ("1/15/2024 12:00:00 AM", False, date(2024, 1, 15)),
+        ("13.04.2024", False, date(2024, 4, 13)),
+        (datetime(2024, 4, 13, 8, 30), False, date(2024, 4, 13)),
+    ],
+)
+def test_parse_date(value, day_first, expected):
+    assert parse_date(value, day_first) == expected
+
+
+def test_slashed_dates_follow_the_configured_order():
+    assert parse_date("03/04/2024") == date(2024, 3, 4)
+    assert parse_date("03/04/2024", day_first=True) == date(2024, 4, 3)
+    # Not guessed from whichever order happens to parse
+    assert parse_date("13/04/2024") is None
+    assert parse_date("04/13/2024", day_first=True) is None
+
+
+@pytest.mark.parametrize("value", [None, "", "  ", "soon"])
+def test_parse_date_unparseable(value):
+    assert parse_date(value) is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (12, 12.0),
+        ("12.5", 12.5),
+        ("12,5", 12.5),
+        ("1,234,567", 1234567.0),
+        ("0,125", 0.125),
+        ("1234,567", 1234.567),
+        ("1.234,56", 1234.56),
+        ("1,234.56", 1234.56),
+        ("£ 45.10", 45.1),
+        ("", None),
+        (True, None),
+    ],
+)
+def test_parse_float(value, expected):
+    assert parse_float(value) == expected
+
+
+@pytest.mark.parametrize("value", ["45,123", "1,234", "-12,345", "€ 1,234"])
+def test_parse_float_does_not_guess_a_lone_comma_before_three_digits(value):
+    # European decimals ("1,234" litres) and US thousands look the same
+    assert parse_float(value) is None
+
+
+def test_parse_float_reads_european_decimals():
+    assert parse_float("45,12") == 45.12
+    assert parse_float("1.234,567") == 1234.567
+    assert parse_float("1 234,5") == 1234.5
+
+
+def test_parse_bool():
+    assert parse_bool("True") and parse_bool("1") and parse_bool(True)
+    assert not parse_bool("false") and not parse_bool(None)
+
+
+def test_record_reads_dates_in_the_configured_order():
+    data = {"id": "7", "date": "03/04/2024", "odometer": "1.234,5", "cost": "40"}
+    assert FuelRecord.from_json(data).date == date(2024, 3, 4)
+
+    record = FuelRecord.from_json(data, day_first=True)
+    assert record.id == 7
+    assert record.date == date(2024, 4, 3)
+    assert record.odometer == 1234.5
+    assert record.fingerprint() == FuelRecord.from_json(data, True).fingerprint()
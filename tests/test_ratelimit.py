@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from lubelogger.api.ratelimit import (  # noqa: E402
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    RateLimits,
+    TokenBucket,
+    current_priority,
+    request_priority,
+)
+
+
+def test_burst_is_granted_without_waiting():
+    async def scenario():
+        bucket = TokenBucket(rate=1, burst=3)
+        waits = [await bucket.acquire() for _ in range(3)]
+        assert waits == [0.0, 0.0, 0.0]
+        assert bucket.delayed == 0
+
+    asyncio.run(scenario())
+
+
+def test_interactive_requests_jump_the_queue():
+    async def scenario():
+        bucket = TokenBucket(rate=20, burst=1)
+        await bucket.acquire()
+        served: list[str] = []
+
+        async def request(name: str, priority: int):
+            await bucket.acquire(priority)
+            served.append(name)
+
+        await asyncio.gather(
+            request("poll 1", PRIORITY_BACKGROUND),
+            request("poll 2", PRIORITY_BACKGROUND),
+            request("write", PRIORITY_INTERACTIVE),
+            request("poll 3", PRIORITY_BACKGROUND),
+        )
+        # Same priority stays first come, first served
+        assert served == ["write", "poll 1", "poll 2", "poll 3"]
+        assert bucket.delayed == 4
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    async def scenario():
+        bucket = TokenBucket(rate=20, burst=1)
+        await bucket.acquire()
+
+        cancelled = asyncio.ensure_future(bucket.acquire())
+        waiting = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        await asyncio.wait_for(waiting, 1)
+        assert bucket.as_dict()["queued"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_zero_rate_turns_limiting_off():
+    async def scenario():
+        bucket = TokenBucket(rate=0, burst=1)
+        assert [await bucket.acquire() for _ in range(50)] == [0.0] * 50
+
+    asyncio.run(scenario())
+
+
+def test_reads_and_writes_have_separate_budgets():
+    async def scenario():
+        limiter = RateLimiter(
+            "host", RateLimits(read_rate=1, read_burst=1, write_rate=1, write_burst=1)
+        )
+        await limiter.acquire("GET")
+        # The read budget is spent, the write budget is not
+        assert await asyncio.wait_for(limiter.acquire("POST"), 0.1) == 0.0
+
+    asyncio.run(scenario())
+
+
+def test_priority_follows_the_context():
+    assert current_priority() == PRIORITY_BACKGROUND
+    with request_priority(PRIORITY_INTERACTIVE):
+        assert current_priority() == PRIORITY_INTERACTIVE
+    assert current_priority() == PRIORITY_BACKGROUND
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from lubelogger.api.resilience import (  # noqa: E402
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    is_outage,
+)
+
+
+def _http_error(status: int) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(None, (), status=status, message="error")
+
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("host", failure_threshold=3, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.before_request()
+    assert breaker.state == STATE_CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    assert breaker.rejected == 1
+    assert breaker.times_opened == 1
+
+
+def test_single_probe_after_reset_timeout():
+    breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    breaker.before_request()
+    assert breaker.state == STATE_HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    breaker.before_request()
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker("host", failure_threshold=5, reset_timeout=0)
+    for _ in range(5):
+        breaker.record_failure()
+
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert breaker.times_opened == 1
+
+
+def test_abandoned_probe_lets_the_next_one_through():
+    breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.abandon()
+    breaker.before_request()
+
+
+@pytest.mark.parametrize(
+    ("err", "retry", "outage"),
+    [
+        (_http_error(503), True, True),
+        (_http_error(429), True, False),
+        (_http_error(500), True, True),
+        (_http_error(404), False, False),
+        (asyncio.TimeoutError(), True, True),
+        (aiohttp.ClientConnectionError(), True, True),
+        (CircuitOpenError(), False, False),
+        (ValueError(), False, False),
+    ],
+)
+def test_retry_and_outage_classification(err, retry, outage):
+    assert RetryPolicy().should_retry(err) is retry
+    assert is_outage(err) is outage
+
+
+def test_retry_delay_is_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+    assert all(0 <= policy.delay(attempt) <= 4 for attempt in range(1, 10))
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from lubelogger.api.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_run():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "vehicles"
+
+        waiters = [asyncio.ensure_future(flight.run("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert len(flight) == 1
+
+        release.set()
+        assert await asyncio.gather(*waiters) == ["vehicles"] * 3
+        assert calls == 1
+        assert len(flight) == 0
+
+        # Later calls start a new run
+        assert await flight.run("key", work) == "vehicles"
+        assert calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_exception_reaches_every_waiter():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0)
+            raise RuntimeError("down")
+
+        results = await asyncio.gather(
+            flight.run("key", work), flight.run("key", work), return_exceptions=True
+        )
+        assert [type(result) for result in results] == [RuntimeError] * 2
+
+    asyncio.run(scenario())
+
+
+def test_cancelling_one_waiter_keeps_the_run():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return 42
+
+        first = asyncio.ensure_future(flight.run("key", work))
+        second = asyncio.ensure_future(flight.run("key", work))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        release.set()
+        assert await second == 42
+
+    asyncio.run(scenario())
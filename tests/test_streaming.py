@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from lubelogger.api.streaming import JsonArrayDecoder
+
+RECORDS = [
+    {"id": 1, "date": "2024-01-15", "notes": "Vidange café", "cost": "12,50"},
+    {"id": 2, "odometer": 15000.5, "tags": ["a", "b"]},
+    1500.5,
+    "déjà",
+    True,
+    None,
+]
+BODY = json.dumps(RECORDS, ensure_ascii=False, indent=1).encode()
+
+
+def _decode(chunks: list[bytes]) -> list:
+    decoder = JsonArrayDecoder()
+    items = []
+    for chunk in chunks:
+        items += decoder.feed(chunk)
+    return items + decoder.close()
+
+
+def test_one_byte_chunks():
+    assert _decode([BODY[i : i + 1] for i in range(len(BODY))]) == RECORDS
+
+
+@pytest.mark.parametrize("split", range(1, len(BODY)))
+def test_split_anywhere(split):
+    # Splits land inside multi-byte characters, strings and numbers alike
+    assert _decode([BODY[:split], BODY[split:]]) == RECORDS
+
+
+def test_number_waits_for_separator():
+    decoder = JsonArrayDecoder()
+    assert decoder.feed(b"[15") == []
+    assert decoder.feed(b"00.5, 2") == [1500.5]
+    assert decoder.feed(b"]") == [2]
+    assert decoder.close() == []
+    assert decoder.items == 2
+
+
+def test_empty_body_is_an_empty_list():
+    assert _decode([b"", b"  \n"]) == []
+    assert _decode([b"[", b" ]"]) == []
+
+
+def test_truncated_body_raises():
+    decoder = JsonArrayDecoder()
+    assert decoder.feed(b'[{"id": 1}, {"id": ') == [{"id": 1}]
+    with pytest.raises(ValueError):
+        decoder.close()
+
+
+def test_non_array_raises():
+    with pytest.raises(ValueError):
+        JsonArrayDecoder().feed(b'{"id": 1}')
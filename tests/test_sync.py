@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from lubelogger.api.models import OdometerRecord  # noqa: E402
+from lubelogger.sync import FULL_HISTORY, RecordIndex  # noqa: E402
+
+
+def _reading(record_id, day, odometer):
+    return OdometerRecord(id=record_id, date=day, odometer=odometer)
+
+
+JAN = _reading(1, date(2024, 1, 10), 1000)
+MAR = _reading(2, date(2024, 3, 10), 2000)
+MAY = _reading(3, date(2024, 5, 10), 3000)
+JUL = _reading(4, date(2024, 7, 10), 4000)
+
+
+async def _stream(records):
+    for record in records:
+        yield record
+
+
+def _reconcile(index, records, start=None, end=None):
+    return asyncio.run(index.async_reconcile(_stream(records), start, end))
+
+
+def test_full_listing_adds_in_date_order():
+    index = RecordIndex()
+    delta = _reconcile(index, [MAR, JAN, JUL, MAY])
+
+    assert len(delta.added) == 4
+    assert index.records() == [JAN, MAR, MAY, JUL]
+    assert index.covered_from == FULL_HISTORY
+    assert index.since(date(2024, 4, 1)) == [MAY, JUL]
+
+
+def test_window_only_deletes_inside_the_window():
+    index = RecordIndex()
+    _reconcile(index, [JAN, MAR, MAY, JUL])
+
+    # MAY was deleted on the server; JAN and MAR are outside the window
+    delta = _reconcile(index, [JUL], start=date(2024, 4, 1))
+
+    assert delta.removed == [MAY]
+    assert not delta.added and not delta.append_only
+    assert index.records() == [JAN, MAR, JUL]
+    assert index.covered_from == FULL_HISTORY
+
+
+def test_bounded_window_leaves_newer_records_alone():
+    index = RecordIndex()
+    _reconcile(index, [JAN, MAR, MAY, JUL])
+
+    delta = _reconcile(index, [JAN], start=date(2024, 1, 1), end=date(2024, 3, 31))
+    assert delta.removed == [MAR]
+    assert index.records() == [JAN, MAY, JUL]
+
+
+def test_windows_extend_coverage_backwards():
+    index = RecordIndex()
+    assert index.covered_from is None
+
+    _reconcile(index, [MAY, JUL], start=date(2024, 4, 1))
+    assert index.covered_from == date(2024, 4, 1)
+
+    delta = _reconcile(index, [MAR], start=date(2024, 2, 1), end=date(2024, 3, 31))
+    assert delta.added == [MAR] and not delta.append_only
+    assert index.covered_from == date(2024, 2, 1)
+
+    # A later recent window does not shrink what is covered
+    _reconcile(index, [MAY, JUL], start=date(2024, 4, 1))
+    assert index.covered_from == date(2024, 2, 1)
+    assert index.records() == [MAR, MAY, JUL]
+
+
+def test_changed_and_appended_records():
+    index = RecordIndex()
+    _reconcile(index, [JAN, MAR])
+
+    delta = _reconcile(index, [JAN, MAR, MAY])
+    assert delta.added == [MAY] and delta.append_only
+
+    corrected = _reading(2, date(2024, 3, 10), 2050)
+    delta = _reconcile(index, [JAN, corrected, MAY])
+    assert delta.changed == [(MAR, corrected)]
+    assert not delta.append_only
+
+
+def test_interrupted_stream_asks_for_a_rebuild():
+    index = RecordIndex()
+
+    async def broken():
+        yield JAN
+        raise ConnectionError
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(index.async_reconcile(broken()))
+    assert index.records() == [JAN]
+    assert index.covered_from is None
+
+    delta = _reconcile(index, [JAN, MAR])
+    assert delta.rebuild and delta.added == [MAR]
+    assert not _reconcile(index, [JAN, MAR]).rebuild
+
+
+def test_records_without_ids_are_matched_by_content():
+    index = RecordIndex()
+    unnumbered = _reading(None, date(2024, 1, 10), 1000)
+    _reconcile(index, [unnumbered])
+
+    assert not _reconcile(index, [_reading(None, date(2024, 1, 10), 1000)])
+    delta = _reconcile(index, [_reading(None, date(2024, 1, 10), 1001)])
+    assert len(delta.added) == 1 and len(delta.removed) == 1
+
+
+def test_undated_records_only_leave_on_listings_without_a_start():
+    index = RecordIndex()
+    undated = _reading(5, None, 500)
+    _reconcile(index, [undated, JAN, MAY])
+
+    assert not _reconcile(index, [MAY], start=date(2024, 4, 1))
+    delta = _reconcile(index, [JAN, MAY])
+    assert delta.removed == [undated]
+
+
+def test_stored_form_is_reused_until_the_index_changes():
+    index = RecordIndex()
+    _reconcile(index, [JAN, MAR])
+    saved = index.as_saved()
+
+    _reconcile(index, [JAN, MAR])
+    assert index.as_saved() is saved
+    _reconcile(index, [MAY], start=date(2024, 4, 1))
+    assert index.as_saved() is not saved
+    assert len(index.as_saved()) == 3